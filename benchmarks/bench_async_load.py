@@ -0,0 +1,110 @@
+"""
+동시 세션 부하 벤치마크
+N개의 가상 세션이 동시에 질의할 때 sync(stream_query)와 async(astream_query) 경로의
+p50/p99 지연시간과 TTFT 비교 (LLM은 로컬 stub 사용)
+
+사용법:
+    python benchmarks/bench_async_load.py --sessions 1 8 32 --requests 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import (
+    StubChatModel,
+    VECTORSTORE_PATH,
+    load_questions,
+    summarize_latencies,
+)
+from utils.rag_pipeline import RAGPipeline
+
+
+async def _sync_session(pipeline, questions, latencies, ttfts):
+    """기존 핸들러 재현: async 핸들러 안에서 sync 제너레이터 순회"""
+    for question in questions:
+        start = time.perf_counter()
+        first = None
+        for _ in pipeline.stream_query(question):
+            if first is None:
+                first = time.perf_counter() - start
+            await asyncio.sleep(0)  # msg.stream_token() 자리
+        latencies.append(time.perf_counter() - start)
+        ttfts.append(first or 0.0)
+
+
+async def _async_session(pipeline, questions, latencies, ttfts):
+    """새 핸들러: astream_query 사용"""
+    for question in questions:
+        start = time.perf_counter()
+        first = None
+        async for _ in pipeline.astream_query(question):
+            if first is None:
+                first = time.perf_counter() - start
+            await asyncio.sleep(0)
+        latencies.append(time.perf_counter() - start)
+        ttfts.append(first or 0.0)
+
+
+async def run_load(pipeline, mode: str, sessions: int, requests: int, questions):
+    """동시 세션 부하 실행"""
+    session_fn = _async_session if mode == "async" else _sync_session
+    latencies, ttfts = [], []
+
+    tasks = []
+    for s in range(sessions):
+        workload = [questions[(s * requests + i) % len(questions)] for i in range(requests)]
+        tasks.append(session_fn(pipeline, workload, latencies, ttfts))
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "latency": summarize_latencies(latencies),
+        "ttft": summarize_latencies(ttfts),
+        "throughput_qps": round(len(latencies) / elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 세션 부하 벤치마크 (stub LLM)")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=5, help="세션당 질의 수")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--ttft", type=float, default=0.3, help="stub LLM 첫 토큰 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="stub LLM 토큰 간 지연(초)")
+    parser.add_argument("--reranking", action="store_true")
+    args = parser.parse_args()
+
+    pipeline = RAGPipeline(
+        use_reranking=args.reranking,
+        llm=StubChatModel(ttft=args.ttft, token_delay=args.token_delay)
+    )
+    pipeline.load_vectorstore(str(VECTORSTORE_PATH))
+    pipeline.create_qa_chain()
+
+    questions = load_questions()
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+
+    print(f"{'mode':<6} {'sessions':>8} {'p50 ms':>9} {'p99 ms':>9} {'ttft p50':>9} {'ttft p99':>9} {'qps':>7}")
+    for sessions in args.sessions:
+        for mode in modes:
+            result = asyncio.run(run_load(pipeline, mode, sessions, args.requests, questions))
+            print(
+                f"{mode:<6} {sessions:>8} "
+                f"{result['latency']['p50_ms']:>9.1f} {result['latency']['p99_ms']:>9.1f} "
+                f"{result['ttft']['p50_ms']:>9.1f} {result['ttft']['p99_ms']:>9.1f} "
+                f"{result['throughput_qps']:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
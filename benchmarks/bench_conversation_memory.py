@@ -0,0 +1,72 @@
+"""
+롤링 요약 메모리 벤치마크
+긴 대화에서 턴마다 프롬프트에 들어가는 히스토리 토큰을 비교
+(원문 전체 / 최근 N개 원문 / 요약 + 최근 원문, StubSummarizer 사용)
+
+사용법:
+    python benchmarks/bench_conversation_memory.py --turns 40
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.conversation_memory import ConversationMemory, StubSummarizer, get_memory_stats
+from utils.prompt_budget import PromptBuilder, estimate_tokens
+
+
+def make_turn(i: int):
+    user = f"{i}번째 질문: 퓨쳐시스템의 제품 {i}에 대해 자세히 알려주세요."
+    assistant = (
+        f"제품 {i}는 퓨쳐시스템의 보안 솔루션입니다. "
+        + "주요 기능과 도입 사례, 라이선스 정책을 순서대로 설명드리겠습니다. " * 6
+    )
+    return user, assistant
+
+
+def main():
+    parser = argparse.ArgumentParser(description="롤링 요약 메모리 벤치마크")
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--history-items", type=int, default=5)
+    parser.add_argument("--fold-threshold", type=int, default=None, help="기본값: --history-items - 1")
+    parser.add_argument("--keep-recent", type=int, default=2)
+    args = parser.parse_args()
+
+    builder = PromptBuilder(max_prompt_tokens=10**6, history_budget=10**6, max_history_items=10**6)
+    window = PromptBuilder(max_prompt_tokens=10**6, history_budget=10**6, max_history_items=args.history_items)
+    memory = ConversationMemory(
+        StubSummarizer(max_tokens=200),
+        fold_threshold=args.history_items - 1 if args.fold_threshold is None else args.fold_threshold,
+        keep_recent=args.keep_recent
+    )
+
+    history = []
+    totals = {"full": 0, "window": 0, "summary": 0}
+    print(f"{'turn':>4} {'full':>8} {'window':>8} {'summary':>8}")
+    for i in range(1, args.turns + 1):
+        summary, turns = memory.snapshot()
+        full = estimate_tokens(builder.build(0, "", history, []).chat_history)
+        recent = estimate_tokens(window.build(0, "", history, []).chat_history)
+        rolled = estimate_tokens(builder.build(0, "", turns, [], summary=summary).chat_history)
+        totals["full"] += full
+        totals["window"] += recent
+        totals["summary"] += rolled
+        if i % 5 == 0 or i == 1:
+            print(f"{i:>4} {full:>8} {recent:>8} {rolled:>8}")
+
+        user, assistant = make_turn(i)
+        history.append({"user": user, "assistant": assistant})
+        memory.add_turn(user, assistant)
+        memory.wait()
+
+    print(f"\ntotal history tokens over {args.turns} turns: "
+          f"full={totals['full']:,} window={totals['window']:,} summary={totals['summary']:,}")
+    print(f"memory stats: {memory.get_stats()}")
+    print(f"global stats: {get_memory_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+데이터 로더 마이크로 벤치마크
+합성 1M행 CSV와 1000페이지 PDF로 기존 방식(iterrows, 문자열 +=)과
+스트리밍 로더(iter_csv_records, iter_pdf_pages)의 시간/최대 메모리 비교
+케이스마다 새 프로세스에서 실행하고 peak RSS - 시작 RSS를 메모리 사용량으로 본다.
+
+사용법:
+    python benchmarks/bench_data_loader.py --rows 1000000 --pages 1000
+"""
+
+import argparse
+import csv
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import current_rss_mb
+
+
+def write_csv(path: Path, rows: int) -> None:
+    """합성 질문-답변 CSV 생성"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["question", "answer", "category"])
+        for i in range(rows):
+            writer.writerow([
+                f"퓨쳐시스템 질문 {i}번은 무엇인가요?",
+                f"퓨쳐시스템의 {i}번 답변입니다. 네트워크 보안 전문기업입니다.",
+                f"카테고리{i % 10}"
+            ])
+
+
+def write_pdf(path: Path, pages: int) -> None:
+    """페이지마다 텍스트 한 단락이 있는 최소 PDF 생성 (외부 라이브러리 없이)"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages (페이지 객체 번호를 안 뒤에 채움)
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for i in range(pages):
+        lines = " ".join(
+            f"({'Page %d line %d: network security company profile text.' % (i + 1, j)}) Tj T*"
+            for j in range(40)
+        )
+        stream = f"BT /F1 10 Tf 12 TL 40 800 Td {lines} ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+def legacy_csv(path):
+    """기존 load_csv_data + prepare_documents (iterrows)"""
+    import pandas as pd
+
+    df = pd.read_csv(path)
+    data = []
+    for _, row in df.iterrows():
+        data.append({
+            "question": row.get("question", ""),
+            "answer": row.get("answer", ""),
+            "category": row.get("category", "general")
+        })
+    return sum(len(f"질문: {item['question']}\n답변: {item['answer']}") for item in data)
+
+
+def streaming_csv(path):
+    """iter_csv_records → iter_prepared_documents"""
+    from utils.data_loader import iter_csv_records, iter_prepared_documents
+
+    return sum(len(doc) for doc in iter_prepared_documents(iter_csv_records(path)))
+
+
+def legacy_pdf(path):
+    """기존 load_pdf_data (문자열 +=)"""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text() + "\n"
+    return len(text)
+
+
+def streaming_pdf(path):
+    """iter_pdf_pages (페이지 단위 처리)"""
+    from utils.data_loader import iter_pdf_pages
+
+    return sum(len(page["text"]) + 1 for page in iter_pdf_pages(path))
+
+
+CASES = {
+    "csv-legacy": legacy_csv,
+    "csv-streaming": streaming_csv,
+    "pdf-legacy": legacy_pdf,
+    "pdf-streaming": streaming_pdf,
+}
+
+
+def _run_case(name, path, result_queue):
+    import pandas  # noqa: F401  (import 비용을 기준 RSS에 포함)
+    import pypdf  # noqa: F401
+
+    base_rss = current_rss_mb()
+    start = time.perf_counter()
+    size = CASES[name](path)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result_queue.put((elapsed, peak_rss - base_rss, size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 로더 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--pages", type=int, default=1000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "synthetic.csv"
+        pdf_path = Path(tmp) / "synthetic.pdf"
+        write_csv(csv_path, args.rows)
+        write_pdf(pdf_path, args.pages)
+        print(f"CSV {args.rows} rows ({csv_path.stat().st_size / 1e6:.0f}MB), "
+              f"PDF {args.pages} pages ({pdf_path.stat().st_size / 1e6:.1f}MB)")
+
+        print(f"{'case':<14} {'time s':>8} {'peak MB':>8} {'chars':>12}")
+        for name in CASES:
+            path = str(csv_path if name.startswith("csv") else pdf_path)
+            result_queue = ctx.Queue()
+            proc = ctx.Process(target=_run_case, args=(name, path, result_queue))
+            proc.start()
+            elapsed, peak_mb, size = result_queue.get()
+            proc.join()
+            print(f"{name:<14} {elapsed:>8.2f} {peak_mb:>8.1f} {size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+임베딩 백엔드 벤치마크 + 정합성 검사 (torch fp32 기준)
+백엔드마다 새 프로세스에서 로드 시간, RSS, 단일 질의 encode 지연시간, 배치 처리량을 측정하고
+fp32 벡터와의 코사인 유사도 및 질문→문서 top-1 검색 일치율을 비교
+
+사용법:
+    python benchmarks/bench_embedding_backend.py --backends torch onnx onnx-int8 --min-cosine 0.99
+"""
+
+import argparse
+import csv
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import DATASET_PATH, current_rss_mb, summarize_latencies
+
+
+def load_texts():
+    """(질문 목록, 문서 목록) - 문서는 벡터 스토어와 같은 '질문/답변' 형식"""
+    with open(DATASET_PATH, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    questions = [row["question"] for row in rows]
+    documents = [f"질문: {row['question']}\n답변: {row['answer']}" for row in rows]
+    return questions, documents
+
+
+def measure(backend: str, batch_size: int, repeat: int, queue) -> None:
+    from utils.embedding_backend import create_embeddings
+    from utils.rag_pipeline import EMBEDDING_MODEL_NAME
+
+    questions, documents = load_texts()
+    baseline = current_rss_mb()
+
+    start = time.perf_counter()
+    embeddings = create_embeddings(EMBEDDING_MODEL_NAME, backend)
+    embeddings.embed_query(questions[0])  # 첫 호출(그래프 초기화)까지 로드 시간에 포함
+    load_s = time.perf_counter() - start
+    loaded_rss = current_rss_mb()
+
+    latencies = []
+    query_vectors = []
+    for _ in range(repeat):
+        query_vectors = []
+        for question in questions:
+            start = time.perf_counter()
+            query_vectors.append(embeddings.embed_query(question))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    doc_vectors = []
+    for i in range(0, len(documents), batch_size):
+        doc_vectors.extend(embeddings.embed_documents(documents[i:i + batch_size]))
+    batch_s = time.perf_counter() - start
+
+    queue.put({
+        "backend": backend,
+        "load_s": load_s,
+        "latency": summarize_latencies(latencies),
+        "docs_per_s": len(documents) / batch_s,
+        "rss_base_mb": baseline,
+        "rss_loaded_mb": loaded_rss,
+        "rss_after_mb": current_rss_mb(),
+        "queries": query_vectors,
+        "documents": doc_vectors,
+    })
+
+
+def parity(result, reference):
+    """fp32 기준 대비 코사인 유사도(평균/최소)와 top-1 검색 일치율"""
+    q, q_ref = np.asarray(result["queries"]), np.asarray(reference["queries"])
+    d, d_ref = np.asarray(result["documents"]), np.asarray(reference["documents"])
+
+    # 모든 백엔드가 정규화 벡터를 내므로 내적 = 코사인
+    cosines = np.concatenate([np.sum(q * q_ref, axis=1), np.sum(d * d_ref, axis=1)])
+    top1 = np.argmax(q @ d.T, axis=1)
+    top1_ref = np.argmax(q_ref @ d_ref.T, axis=1)
+    return float(cosines.mean()), float(cosines.min()), float(np.mean(top1 == top1_ref))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임베딩 백엔드 지연시간/처리량/RSS + fp32 정합성")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3, help="질의 지연시간 측정 반복 횟수")
+    parser.add_argument("--min-cosine", type=float, default=0.99,
+                        help="fp32 대비 평균 코사인 유사도 하한 (미달 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    backends = args.backends if "torch" in args.backends else ["torch"] + args.backends
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for backend in backends:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=measure, args=(backend, args.batch_size, args.repeat, queue))
+        proc.start()
+        results[backend] = queue.get()
+        proc.join()
+
+    reference = results["torch"]
+    print(f"{'backend':<10} {'load s':>7} {'p50 ms':>7} {'p95 ms':>7} {'docs/s':>8} {'base MB':>8} "
+          f"{'loaded':>7} {'after':>7} {'cos avg':>8} {'cos min':>8} {'top1':>6}")
+
+    failed = False
+    for backend in backends:
+        r = results[backend]
+        cos_avg, cos_min, top1 = parity(r, reference)
+        failed |= cos_avg < args.min_cosine
+        print(f"{backend:<10} {r['load_s']:>7.2f} {r['latency']['p50_ms']:>7.2f} {r['latency']['p95_ms']:>7.2f} "
+              f"{r['docs_per_s']:>8.1f} {r['rss_base_mb']:>8.0f} {r['rss_loaded_mb']:>7.0f} "
+              f"{r['rss_after_mb']:>7.0f} {cos_avg:>8.4f} {cos_min:>8.4f} {top1:>6.3f}")
+
+    if failed:
+        print(f"\n❌ 평균 코사인 유사도가 {args.min_cosine} 미만인 백엔드가 있습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+마이크로 배치 임베딩 처리량 벤치마크
+동시 호출자 1/8/32명이 질의 임베딩을 요청할 때 배치 유무에 따른 처리량/지연시간 비교
+
+사용법:
+    python benchmarks/bench_embedding_batcher.py --callers 1 8 32 --queries 64
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_community.embeddings import HuggingFaceEmbeddings
+
+from benchmarks.common import load_questions, summarize_latencies
+from utils.embedding_batcher import MicroBatchEmbeddings
+from utils.rag_pipeline import EMBEDDING_MODEL_NAME
+
+
+def run_threads(embed_fn, callers: int, texts):
+    """callers개 스레드가 texts를 나눠 embed_fn 호출"""
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(worker_texts):
+        local = []
+        for text in worker_texts:
+            start = time.perf_counter()
+            embed_fn(text)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [
+        threading.Thread(target=worker, args=(texts[i::callers],))
+        for i in range(callers)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, time.perf_counter() - start
+
+
+async def run_async(batcher: MicroBatchEmbeddings, callers: int, texts):
+    """callers개 코루틴이 texts를 나눠 aembed_query 호출"""
+    latencies = []
+
+    async def worker(worker_texts):
+        for text in worker_texts:
+            start = time.perf_counter()
+            await batcher.aembed_query(text)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(texts[i::callers]) for i in range(callers)))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마이크로 배치 임베딩 벤치마크")
+    parser.add_argument("--callers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--queries", type=int, default=64, help="설정당 총 질의 수")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--wait-ms", type=float, default=3.0)
+    args = parser.parse_args()
+
+    embeddings = HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL_NAME,
+        model_kwargs={"device": "cpu"},
+        encode_kwargs={"normalize_embeddings": True}
+    )
+    batcher = MicroBatchEmbeddings(embeddings, max_batch_size=args.batch_size, max_wait_ms=args.wait_ms)
+
+    questions = load_questions()
+    texts = [questions[i % len(questions)] for i in range(args.queries)]
+    embeddings.embed_query(texts[0])  # 워밍업
+
+    print(f"{'mode':<14} {'callers':>7} {'qps':>8} {'p50 ms':>8} {'p99 ms':>8} {'avg batch':>9}")
+    for callers in args.callers:
+        for mode in ("unbatched", "batched-sync", "batched-async"):
+            before = batcher.get_stats()
+            if mode == "unbatched":
+                latencies, elapsed = run_threads(embeddings.embed_query, callers, texts)
+            elif mode == "batched-sync":
+                latencies, elapsed = run_threads(batcher.embed_query, callers, texts)
+            else:
+                latencies, elapsed = asyncio.run(run_async(batcher, callers, texts))
+            after = batcher.get_stats()
+
+            batches = after["batches"] - before["batches"]
+            avg_batch = (after["items"] - before["items"]) / batches if batches else 1.0
+            stats = summarize_latencies(latencies)
+            print(f"{mode:<14} {callers:>7} {len(latencies) / elapsed:>8.1f} "
+                  f"{stats['p50_ms']:>8.1f} {stats['p99_ms']:>8.1f} {avg_batch:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
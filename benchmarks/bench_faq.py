@@ -0,0 +1,85 @@
+"""
+FAQ 빠른 경로 벤치마크
+CSV 질문의 변형(원문 / 공백·문장부호 변경 / 앞쪽 절반 어절)에 대해
+FAQ 응답 비율, 오답 비율(다른 행의 답변), 정밀도(응답 중 정답 비율), 조회 지연시간을 임계치별로 측정
+
+held-out: 질문 자신의 행을 빼고 원문으로 조회 (CSV에 없는 질문이 한 단어만 다른 이웃 질문,
+예: 본사 주소 / 전화번호에 잘못 걸리는 비율). 이 경우 응답하면 모두 오답이다.
+
+사용법:
+    python benchmarks/bench_faq.py --thresholds 0.88 0.90 0.93 0.95
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from benchmarks.common import DATASET_PATH, summarize_latencies
+from utils.faq_index import FAQIndex
+from utils.rag_pipeline import get_shared_embeddings
+
+VARIANTS = {
+    "original": lambda q: q,
+    "reformatted": lambda q: "  " + q.rstrip("?") + " ? ",
+    "short": lambda q: " ".join(q.split()[:max(1, len(q.split()) // 2)]),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAQ 빠른 경로 벤치마크")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.90, 0.93, 0.95])
+    args = parser.parse_args()
+
+    embeddings = get_shared_embeddings()
+
+    start = time.perf_counter()
+    index = FAQIndex.from_csv(str(DATASET_PATH), embeddings)
+    print(f"index: {len(index.questions)} questions, built in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    # held-out: 자기 행을 제외한 최고 유사도 (같은 답변의 중복 행은 정답으로 보고 제외)
+    held_out = []
+    for row, vector in enumerate(index.matrix):
+        scores = index.matrix @ vector
+        same = [i for i, answer in enumerate(index.answers) if answer == index.answers[row]]
+        scores[same] = -np.inf
+        held_out.append(float(scores.max()) if len(same) < len(scores) else -np.inf)
+
+    print(f"{'threshold':>9} {'variant':<12} {'served':>7} {'wrong':>6} {'precision':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for threshold in args.thresholds:
+        index.threshold = threshold
+        for name, variant in VARIANTS.items():
+            served = wrong = 0
+            latencies = []
+            for row, question in enumerate(index.questions):
+                start = time.perf_counter()
+                match = index.match(variant(question))
+                latencies.append(time.perf_counter() - start)
+                if match is not None:
+                    served += 1
+                    wrong += match.answer != index.answers[row]
+            stats = summarize_latencies(latencies)
+            n = len(index.questions)
+            precision = (served - wrong) / served if served else 1.0
+            print(f"{threshold:>9.2f} {name:<12} {served / n:>7.3f} {wrong / n:>6.3f} {precision:>9.3f} "
+                  f"{stats['p50_ms']:>8.3f} {stats['p99_ms']:>8.3f}")
+
+        false_hits = sum(1 for score in held_out if score >= threshold) / len(held_out)
+        print(f"{threshold:>9.2f} {'held-out':<12} {false_hits:>7.3f} {false_hits:>6.3f} {'-':>9}")
+
+    ranked = sorted(held_out, reverse=True)
+    print(f"\nheld-out nearest-neighbour similarity: max {ranked[0]:.3f}, "
+          f"p99 {ranked[len(ranked) // 100]:.3f}, p90 {ranked[len(ranked) // 10]:.3f}")
+    print(f"FAQ_THRESHOLD > {ranked[0]:.3f}이면 CSV에 없는 이웃 질문에 큐레이션 답변을 주지 않음 "
+          f"(FAQ_SEMANTIC=true로 켤 때 기준)")
+
+    print(f"\nstats: {index.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+인제스트 임베딩 벤치마크
+배치 크기 × 워커 수 조합별 docs/sec와 peak RSS 측정
+조합마다 새 프로세스에서 실행하여 RSS가 서로 섞이지 않게 한다.
+
+사용법:
+    python benchmarks/bench_ingest.py --docs 2000 --batch-sizes 16 64 256 --workers 1 2 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import load_questions
+
+
+def _run_config(texts, batch_size, workers, result_queue):
+    """한 조합 측정 (별도 프로세스)"""
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from utils.batch_embedder import iter_embedding_batches, peak_rss_mb
+    from utils.rag_pipeline import EMBEDDING_MODEL_NAME
+
+    embeddings = None
+    if workers <= 1:
+        embeddings = HuggingFaceEmbeddings(
+            model_name=EMBEDDING_MODEL_NAME,
+            model_kwargs={"device": "cpu"},
+            encode_kwargs={"normalize_embeddings": True}
+        )
+
+    start = time.perf_counter()
+    count = 0
+    for _, vectors in iter_embedding_batches(
+        texts, batch_size=batch_size, workers=workers,
+        embeddings=embeddings, model_name=EMBEDDING_MODEL_NAME
+    ):
+        count += len(vectors)
+    elapsed = time.perf_counter() - start
+
+    own_rss, worker_rss = peak_rss_mb()
+    result_queue.put({
+        "batch_size": batch_size,
+        "workers": workers,
+        "docs_per_sec": round(count / elapsed, 1),
+        "elapsed_s": round(elapsed, 2),
+        "peak_rss_mb": round(own_rss, 1),
+        "peak_worker_rss_mb": round(worker_rss, 1),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인제스트 임베딩 벤치마크")
+    parser.add_argument("--docs", type=int, default=2000, help="합성 문서 수")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    questions = load_questions()
+    texts = [f"질문: {questions[i % len(questions)]} ({i})" for i in range(args.docs)]
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    print(f"{'batch':>6} {'workers':>7} {'docs/s':>8} {'rss MB':>8} {'worker MB':>9}")
+    for workers in args.workers:
+        for batch_size in args.batch_sizes:
+            result_queue = ctx.Queue()
+            proc = ctx.Process(target=_run_config, args=(texts, batch_size, workers, result_queue))
+            proc.start()
+            result = result_queue.get()
+            proc.join()
+            results.append(result)
+            print(f"{batch_size:>6} {workers:>7} {result['docs_per_sec']:>8.1f} "
+                  f"{result['peak_rss_mb']:>8.0f} {result['peak_worker_rss_mb']:>9.0f}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Rate Limiter 벤치마크
+서로 다른 사용자 10만 명 규모에서 기존 리스트 스캔 방식과 인덱스 슬라이딩 윈도우 비교
+(확인 + 사용량 조회 1쌍의 처리량, 보관 메모리, 유휴 사용자 정리 시간)
+
+사용법:
+    python benchmarks/bench_rate_limiter.py --users 100000 --requests 5
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.rate_limiter import RateLimiter
+
+
+class LegacyRateLimiter:
+    """기존 구현 (매 호출 리스트 재생성 + 분당 윈도우 재스캔, 사용자 미정리)"""
+
+    def __init__(self, requests_per_minute=30, requests_per_hour=100):
+        self.rpm = requests_per_minute
+        self.rph = requests_per_hour
+        self.requests = defaultdict(list)
+
+    def _cleanup_old_requests(self, user_id, current_time):
+        self.requests[user_id] = [t for t in self.requests[user_id] if current_time - t < 3600]
+
+    def is_allowed(self, user_id):
+        current_time = time.time()
+        self._cleanup_old_requests(user_id, current_time)
+        recent_minute = [t for t in self.requests[user_id] if current_time - t < 60]
+        if len(recent_minute) >= self.rpm:
+            return False, "minute"
+        if len(self.requests[user_id]) >= self.rph:
+            return False, "hour"
+        self.requests[user_id].append(current_time)
+        return True, ""
+
+    def get_usage_stats(self, user_id):
+        current_time = time.time()
+        self._cleanup_old_requests(user_id, current_time)
+        recent_minute = [t for t in self.requests[user_id] if current_time - t < 60]
+        return {"requests_last_minute": len(recent_minute), "requests_last_hour": len(self.requests[user_id])}
+
+
+def run(limiter, users: int, requests: int, legacy: bool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        for u in range(users):
+            user_id = f"user-{u}"
+            if legacy:
+                limiter.is_allowed(user_id)
+                limiter.get_usage_stats(user_id)
+            else:
+                limiter.check(user_id)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return users * requests / elapsed, current / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate Limiter 벤치마크")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=5, help="사용자당 요청 수")
+    parser.add_argument("--hot-requests", type=int, default=5_000,
+                        help="한 사용자가 분당 한도 근처에서 반복 요청하는 횟수")
+    args = parser.parse_args()
+
+    print(f"{'impl':<8} {'checks/s':>12} {'memory MB':>10}")
+    legacy = LegacyRateLimiter(requests_per_minute=30, requests_per_hour=100)
+    qps, mem = run(legacy, args.users, args.requests, legacy=True)
+    print(f"{'legacy':<8} {qps:>12,.0f} {mem:>10.1f}")
+
+    limiter = RateLimiter(requests_per_minute=30, requests_per_hour=100, evict_interval=0)
+    qps, mem = run(limiter, args.users, args.requests, legacy=False)
+    print(f"{'window':<8} {qps:>12,.0f} {mem:>10.1f}")
+
+    # 한 시간 뒤 시점 기준 유휴 사용자 정리
+    start = time.perf_counter()
+    evicted = limiter.evict_idle(now=time.time() + 3600)
+    print(f"evict_idle: {evicted:,} users in {(time.perf_counter() - start) * 1000:.1f}ms, "
+          f"{len(limiter.backend.requests)} remaining (legacy keeps {len(legacy.requests):,})")
+
+    # 한도에 걸린 단일 사용자: 기존 방식은 매번 전체 기록을 두 번 스캔
+    for name, impl in (("legacy", LegacyRateLimiter(10**6, 10**6)), ("window", RateLimiter(10**6, 10**6, evict_interval=0))):
+        start = time.perf_counter()
+        for _ in range(args.hot_requests):
+            if name == "legacy":
+                impl.is_allowed("hot")
+                impl.get_usage_stats("hot")
+            else:
+                impl.check("hot")
+        elapsed = time.perf_counter() - start
+        print(f"hot user {name:<6}: {args.hot_requests / elapsed:>12,.0f} checks/s")
+
+
+if __name__ == "__main__":
+    main()
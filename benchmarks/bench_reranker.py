@@ -0,0 +1,86 @@
+"""
+FlashRank Reranker 모델별 벤치마크
+모델마다 새 프로세스에서 로드 시간, 로드 전후 RSS, rerank 지연시간(10개 후보), 해제 후 RSS 측정
+
+사용법:
+    python benchmarks/bench_reranker.py --models nano small multilingual
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import current_rss_mb
+
+QUERY = "퓨쳐시스템의 대표자는 누구인가요?"
+PASSAGES = [
+    "질문: 퓨쳐시스템의 대표자는 누구인가요?\n답변: 퓨쳐시스템의 대표자는 정원규입니다.",
+    "질문: 퓨쳐시스템은 언제 설립되었나요?\n답변: 퓨쳐시스템은 1987년 11월 18일에 설립되었습니다.",
+    "질문: 퓨쳐시스템의 직원은 몇 명인가요?\n답변: 퓨쳐시스템에는 총 68명의 직원이 근무하고 있습니다.",
+    "질문: 퓨쳐시스템은 어떤 회사인가요?\n답변: 국내 네트워크 보안업계 1세대 기업입니다.",
+    "Future Systems develops VPN and firewall appliances for enterprise networks.",
+] * 2
+
+
+def measure(model: str, repeat: int, queue) -> None:
+    from flashrank import RerankRequest
+    from utils.reranker import LazyReranker
+
+    baseline = current_rss_mb()
+    reranker = LazyReranker(model, idle_seconds=0)
+    request = RerankRequest(
+        query=QUERY,
+        passages=[{"id": i, "text": text} for i, text in enumerate(PASSAGES)]
+    )
+
+    start = time.perf_counter()
+    result = reranker.rerank(request)  # 첫 호출: 로드 + rerank
+    first_call = time.perf_counter() - start
+    loaded_rss = current_rss_mb()
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reranker.rerank(request)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    reranker.unload()
+    queue.put({
+        "model": reranker.model_name,
+        "load_s": reranker.load_seconds,
+        "first_call_s": first_call,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "rss_base_mb": baseline,
+        "rss_loaded_mb": loaded_rss,
+        "rss_unloaded_mb": current_rss_mb(),
+        "top1_correct": result[0]["id"] == 0,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FlashRank 모델별 로드 시간/RSS/지연시간")
+    parser.add_argument("--models", nargs="+", default=["nano", "small", "multilingual"])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'model':<28} {'load s':>7} {'1st s':>7} {'p50 ms':>7} {'base MB':>8} {'loaded':>7} {'unload':>7} {'top1':>5}")
+    for model in args.models:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=measure, args=(model, args.repeat, queue))
+        proc.start()
+        r = queue.get()
+        proc.join()
+        print(f"{r['model']:<28} {r['load_s']:>7.2f} {r['first_call_s']:>7.2f} {r['p50_ms']:>7.1f} "
+              f"{r['rss_base_mb']:>8.0f} {r['rss_loaded_mb']:>7.0f} {r['rss_unloaded_mb']:>7.0f} "
+              f"{'ok' if r['top1_correct'] else 'miss':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Retriever 백엔드 벤치마크
+1) Chroma(SQLite + HNSW) 경로와 NumPy 정확 검색 경로의 지연시간/재현율 비교
+2) dense / sparse(BM25) / hybrid(RRF) 검색 모드의 hit@1, hit@k, 지연시간 비교
+
+- 질의 임베딩은 미리 계산해 두고 검색 단계만 측정
+- recall@k: NumPy 정확 검색 top-k 대비 각 백엔드 top-k의 겹침 비율
+- hit@k: 질문의 원래 CSV 행이 top-k 안에 있는 비율
+- --variant short: 질문 앞쪽 절반 어절만 사용 (짧은 고유명사 위주 질의 근사)
+
+사용법:
+    python benchmarks/bench_retriever.py --k 10 --repeat 5
+    python benchmarks/bench_retriever.py --fused-k 5 --variant short
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import VECTORSTORE_PATH, load_questions, summarize_latencies
+from utils.rag_pipeline import RRF_K, get_shared_embeddings, get_shared_vectorstore
+from utils.numpy_retriever import NumpyRetriever
+from utils.lexical_index import BM25Index, reciprocal_rank_fusion
+from utils.retrieval_eval import paraphrase
+
+
+def hit_rates(results, questions):
+    """(hit@1, hit@k): 원래 CSV 행이 1위 / top-k 안에 있는 비율"""
+    hit1 = sum(1 for q, docs in results if docs and f"질문: {q}\n" in docs[0]) / len(questions)
+    hitk = sum(1 for q, docs in results if any(f"질문: {q}\n" in d for d in docs)) / len(questions)
+    return hit1, hitk
+
+
+def compare_modes(numpy_retriever, lexical_index, questions, queries, vectors, k, fused_k, repeat):
+    """dense / sparse / hybrid 검색 모드 비교 출력"""
+    results = {"dense": [], "sparse": [], "hybrid": []}
+    latencies = {"dense": [], "sparse": [], "hybrid": []}
+
+    for question, query, vector in zip(questions, queries, vectors):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            dense = [d.page_content for d, _ in numpy_retriever.search_by_vector(vector, k)]
+            dense_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            sparse = [d.page_content for d, _ in lexical_index.search(query, k)]
+            sparse_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fused = [c for c, _ in reciprocal_rank_fusion([dense, sparse], k=RRF_K)[:fused_k]]
+            fuse_time = time.perf_counter() - start
+
+            latencies["dense"].append(dense_time)
+            latencies["sparse"].append(sparse_time)
+            latencies["hybrid"].append(dense_time + sparse_time + fuse_time)
+
+        results["dense"].append((question, dense[:fused_k]))
+        results["sparse"].append((question, sparse[:fused_k]))
+        results["hybrid"].append((question, fused))
+
+    print(f"\n{'mode':<8} {'p50 ms':>8} {'p99 ms':>8} {'hit@1':>6} {'hit@' + str(fused_k):>6}")
+    for mode in ("dense", "sparse", "hybrid"):
+        hit1, hitk = hit_rates(results[mode], questions)
+        stats = summarize_latencies(latencies[mode])
+        print(f"{mode:<8} {stats['p50_ms']:>8.3f} {stats['p99_ms']:>8.3f} {hit1:>6.3f} {hitk:>6.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chroma vs NumPy retriever 벤치마크")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5, help="질문당 반복 횟수")
+    parser.add_argument("--fused-k", type=int, default=5, help="검색 모드 비교에서 평가할 상위 문서 수")
+    parser.add_argument("--variant", choices=("full", "short"), default="full", help="질의 형태")
+    args = parser.parse_args()
+
+    embeddings = get_shared_embeddings()
+    vectorstore = get_shared_vectorstore(str(VECTORSTORE_PATH))
+
+    start = time.perf_counter()
+    numpy_retriever = NumpyRetriever.from_chroma(vectorstore, embeddings, k=args.k)
+    load_time = time.perf_counter() - start
+
+    questions = load_questions()
+    queries = [paraphrase(q, args.variant) for q in questions]
+    vectors = embeddings.embed_documents(queries)
+
+    results = {"chroma": [], "numpy": []}
+    latencies = {"chroma": [], "numpy": []}
+
+    for question, vector in zip(questions, vectors):
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            chroma_docs = vectorstore.similarity_search_by_vector(vector, k=args.k)
+            latencies["chroma"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            numpy_docs = [doc for doc, _ in numpy_retriever.search_by_vector(vector, args.k)]
+            latencies["numpy"].append(time.perf_counter() - start)
+
+        results["chroma"].append((question, [d.page_content for d in chroma_docs]))
+        results["numpy"].append((question, [d.page_content for d in numpy_docs]))
+
+    exact = {q: set(docs) for q, docs in results["numpy"]}
+
+    print(f"corpus: {numpy_retriever.matrix.shape[0]} vectors, "
+          f"matrix {numpy_retriever.matrix.nbytes / 1024:.1f}KB, load {load_time * 1000:.1f}ms")
+    print(f"{'backend':<8} {'p50 ms':>8} {'p99 ms':>8} {'recall@k':>9} {'hit@1':>6} {'hit@k':>6}")
+    for backend in ("chroma", "numpy"):
+        recall = sum(
+            len(exact[q] & set(docs)) / max(1, len(exact[q])) for q, docs in results[backend]
+        ) / len(questions)
+        hit1, hitk = hit_rates(results[backend], questions)
+        stats = summarize_latencies(latencies[backend])
+        print(f"{backend:<8} {stats['p50_ms']:>8.3f} {stats['p99_ms']:>8.3f} "
+              f"{recall:>9.3f} {hit1:>6.3f} {hitk:>6.3f}")
+
+    lexical_index = BM25Index.from_chroma(vectorstore)
+    compare_modes(numpy_retriever, lexical_index, questions, queries, vectors, args.k, args.fused_k, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+벤치마크 공통 유틸리티
+오프라인 stub LLM, 워크로드 로드, 지연시간 통계
+"""
+
+import asyncio
+import csv
+import math
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+project_root = Path(__file__).parent.parent
+DATASET_PATH = project_root / "data" / "datasets" / "company_qa.csv"
+VECTORSTORE_PATH = project_root / "data" / "vectorstore"
+
+
+class StubChatModel(BaseChatModel):
+    """결정적 응답을 내는 로컬 stub 채팅 모델 (Groq 대체)
+
+    첫 토큰까지 ttft초, 이후 토큰마다 token_delay초를 기다린다.
+    """
+
+    ttft: float = 0.3
+    token_delay: float = 0.02
+    answer: str = "퓨쳐시스템은 네트워크 보안 전문기업으로 관련 문서를 바탕으로 답변드립니다."
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat"
+
+    def _tokens(self) -> List[str]:
+        words = self.answer.split(" ")
+        return [word if i == 0 else f" {word}" for i, word in enumerate(words)]
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.ttft + self.token_delay * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.answer))])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.ttft + self.token_delay * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.answer))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.ttft)
+        for token in self._tokens():
+            time.sleep(self.token_delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.ttft)
+        for token in self._tokens():
+            await asyncio.sleep(self.token_delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+def load_questions(path: Path = DATASET_PATH) -> List[str]:
+    """company_qa.csv의 질문 목록 로드"""
+    with open(path, encoding="utf-8") as f:
+        return [row["question"] for row in csv.DictReader(f)]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    """지연시간(초) 목록을 ms 단위 요약 통계로 변환"""
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(max(values) * 1000, 2) if values else 0.0,
+    }
+
+
+def current_rss_mb() -> float:
+    """현재 RSS (MB, Linux /proc 기준)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
@@ -0,0 +1,130 @@
+"""
+적응형 Reranking 평가
+CSV 질문(원문 / 앞쪽 절반 어절)에 대해 항상 rerank하는 경우와 margin 기반 적응형 정책을 비교
+
+- rerank_rate: 적응형 정책이 실제로 rerank한 질의 비율
+- agree@1: 최종 1위 문서가 항상 rerank한 결과와 같은 비율
+- overlap@3: 최종 상위 3개가 항상 rerank한 결과와 겹치는 비율
+- hit@1: 최종 1위가 질문의 원래 CSV 행인 비율
+- rerank ms: 질의당 평균 cross-encoder 시간 (항상 rerank 대비 절약량)
+
+--bar를 만족하는(agree@1 기준) 조합 중 질의당 rerank 시간이 가장 짧은 조합을 RERANK_MARGIN/RERANK_TOP_M으로 추천한다.
+--mode hybrid는 dense + BM25 RRF 결합 순서로 같은 비교를 한다 (dense/BM25 1위 일치도 확정으로 취급).
+
+사용법:
+    python benchmarks/eval_adaptive_rerank.py --margins 0.02 0.05 0.1 --top-m 5
+    python benchmarks/eval_adaptive_rerank.py --mode hybrid --top-m 3 5 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import VECTORSTORE_PATH, StubChatModel, load_questions
+from utils.rag_pipeline import RAGPipeline, get_shared_lexical_index
+from utils.rerank_policy import AdaptiveRerankPolicy
+from utils.retrieval_eval import paraphrase
+
+
+def is_gold(doc, question: str) -> bool:
+    return f"질문: {question}\n" in doc.page_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="적응형 reranking 평가")
+    parser.add_argument("--margins", type=float, nargs="+", default=[0.02, 0.05, 0.1])
+    parser.add_argument("--top-m", type=int, nargs="+", default=[5])
+    parser.add_argument("--variant", choices=("full", "short"), default="short")
+    parser.add_argument("--mode", choices=("dense", "hybrid"), default="dense")
+    parser.add_argument("--bar", type=float, default=0.97, help="추천 기준 agree@1 (항상 rerank 대비)")
+    args = parser.parse_args()
+
+    pipeline = RAGPipeline(llm=StubChatModel(), use_reranking=True, retrieval_mode=args.mode)
+    pipeline.load_vectorstore(str(VECTORSTORE_PATH))
+    lexical_index = get_shared_lexical_index(str(VECTORSTORE_PATH)) if args.mode == "hybrid" else None
+
+    questions = load_questions()
+    queries = [paraphrase(q, args.variant) for q in questions]
+
+    # 항상 rerank (기존 방식: 후보 10개 전체)
+    baseline = []
+    for question, query in zip(questions, queries):
+        scored = pipeline._dense_search(query)
+        docs = [doc for doc, _ in scored]
+        scores = [score for _, score in scored]
+        decisive = False
+        if lexical_index is not None:
+            docs, scores, decisive = pipeline._hybrid_search(query, scored, lexical_index)
+        start = time.perf_counter()
+        reranked = pipeline._rerank_documents(query, docs)
+        elapsed = time.perf_counter() - start
+        baseline.append((question, query, docs, scores, decisive, reranked, elapsed))
+
+    n = len(baseline)
+    always_ms = sum(b[-1] for b in baseline) / n * 1000
+    always_hit = sum(1 for b in baseline if b[5] and is_gold(b[5][0], b[0])) / n
+    retrieval_hit = sum(1 for b in baseline if b[2] and is_gold(b[2][0], b[0])) / n
+
+    print(f"{n} queries ({args.variant}, {args.mode})")
+    print(f"{args.mode} only:{'':<{8 - len(args.mode)}} hit@1 {retrieval_hit:.3f}")
+    print(f"always rerank: hit@1 {always_hit:.3f}, {always_ms:.2f} ms/query")
+    print(f"\n{'top_m':>5} {'margin':>7} {'rerank_rate':>11} {'agree@1':>8} {'overlap@3':>9} {'hit@1':>6} "
+          f"{'rerank ms':>9} {'saved ms':>8}")
+
+    results = [
+        evaluate_policy(pipeline, baseline, margin, top_m, always_ms)
+        for top_m in args.top_m
+        for margin in args.margins
+    ]
+
+    candidates = [r for r in results if r["agree@1"] >= args.bar]
+    print()
+    if candidates:
+        best = min(candidates, key=lambda r: r["rerank_ms"])
+        print(f"✅ 추천: RERANK_POLICY=adaptive RERANK_MARGIN={best['margin']} RERANK_TOP_M={best['top_m']} "
+              f"(agree@1 {best['agree@1']:.3f} ≥ {args.bar}, rerank_rate {best['rerank_rate']:.3f}, "
+              f"{best['saved_ms']:.2f} ms/query 절약)")
+    else:
+        print(f"⚠️ agree@1 ≥ {args.bar}를 만족하는 조합이 없습니다. RERANK_POLICY=always 유지")
+
+
+def evaluate_policy(pipeline, baseline, margin: float, top_m: int, always_ms: float) -> dict:
+    """margin/top_m 조합 1개를 항상 rerank한 결과와 비교해 한 줄 출력"""
+    policy = AdaptiveRerankPolicy(mode="adaptive", margin=margin, top_m=top_m)
+    pipeline.rerank_policy = policy
+    agree = overlap = hit = 0
+    total = 0.0
+    n = len(baseline)
+
+    for question, query, docs, scores, decisive, always, _ in baseline:
+        start = time.perf_counter()
+        final = pipeline._adaptive_rerank(query, docs, scores, decisive=decisive)
+        total += time.perf_counter() - start
+
+        agree += bool(final and always) and final[0].page_content == always[0].page_content
+        always_set = {d.page_content for d in always[:3]}
+        overlap += len(always_set & {d.page_content for d in final[:3]}) / max(1, len(always_set))
+        hit += bool(final) and is_gold(final[0], question)
+
+    stats = policy.get_stats()
+    result = {
+        "margin": margin,
+        "top_m": top_m,
+        "rerank_rate": stats["rerank_rate"],
+        "agree@1": agree / n,
+        "overlap@3": overlap / n,
+        "hit@1": hit / n,
+        "rerank_ms": total / n * 1000,
+        "saved_ms": always_ms - total / n * 1000,
+    }
+    print(f"{top_m:>5} {margin:>7.3f} {result['rerank_rate']:>11.3f} {result['agree@1']:>8.3f} "
+          f"{result['overlap@3']:>9.3f} {result['hit@1']:>6.3f} {result['rerank_ms']:>9.2f} {result['saved_ms']:>8.2f}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
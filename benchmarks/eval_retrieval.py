@@ -0,0 +1,152 @@
+"""
+검색 품질 + 지연시간 평가
+company_qa.csv 질문(원문과 규칙 기반 변형)마다 원래 행을 정답으로 두고 검색 설정별
+recall@1/3/10, MRR, 질의당 지연시간(질의 임베딩 포함) 비교 후,
+기준 recall을 만족하는 설정 중 가장 빠른 설정을 추천
+
+설정:
+- dense-chroma: Chroma HNSW
+- dense-numpy: NumPy 정확 검색
+- bm25: BM25 단독
+- hybrid: dense(NumPy) + BM25, RRF 결합
+- dense+rerank / hybrid+rerank: 상위 --rerank-top개를 FlashRank로 재정렬 (--rerank 지정 시)
+
+사용법:
+    python benchmarks/eval_retrieval.py --variants full short keywords request --bar 0.9 --bar-metric recall@3
+    python benchmarks/eval_retrieval.py --rerank --output benchmarks/results/eval.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from statistics import mean
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from flashrank import RerankRequest
+
+from benchmarks.common import VECTORSTORE_PATH, load_questions, summarize_latencies
+from utils.embedding_backend import create_embeddings
+from utils.lexical_index import BM25Index, reciprocal_rank_fusion
+from utils.numpy_retriever import NumpyRetriever
+from utils.rag_pipeline import EMBEDDING_MODEL_NAME, RERANK_TOP_M, RRF_K, get_shared_vectorstore
+from utils.reranker import get_reranker
+from utils.retrieval_eval import RECALL_KS, VARIANTS, evaluate
+
+
+def build_configs(depth: int, rerank: bool, rerank_top: int):
+    """설정 이름 → (질의 → 순위순 문서 내용) 함수"""
+    # LRU 캐시 없는 임베딩: 설정마다 질의 임베딩 비용을 똑같이 포함
+    embeddings = create_embeddings(EMBEDDING_MODEL_NAME)
+    vectorstore = get_shared_vectorstore(str(VECTORSTORE_PATH))
+    numpy_retriever = NumpyRetriever.from_chroma(vectorstore, embeddings, k=depth)
+    lexical_index = BM25Index.from_chroma(vectorstore)
+
+    def dense_chroma(query):
+        vector = embeddings.embed_query(query)
+        return [d.page_content for d in vectorstore.similarity_search_by_vector(vector, k=depth)]
+
+    def dense_numpy(query):
+        vector = embeddings.embed_query(query)
+        return [d.page_content for d, _ in numpy_retriever.search_by_vector(vector, depth)]
+
+    def bm25(query):
+        return [d.page_content for d, _ in lexical_index.search(query, depth)]
+
+    def hybrid(query):
+        fused = reciprocal_rank_fusion([dense_numpy(query), bm25(query)], k=RRF_K)
+        return [content for content, _ in fused[:depth]]
+
+    configs = {
+        "dense-chroma": dense_chroma,
+        "dense-numpy": dense_numpy,
+        "bm25": bm25,
+        "hybrid": hybrid,
+    }
+
+    if rerank:
+        reranker = get_reranker()
+
+        def with_rerank(search):
+            def run(query):
+                ranked = search(query)
+                head = ranked[:rerank_top]
+                result = reranker.rerank(RerankRequest(
+                    query=query,
+                    passages=[{"id": i, "text": text} for i, text in enumerate(head)]
+                ))
+                return [head[r["id"]] for r in result] + ranked[rerank_top:]
+            return run
+
+        configs["dense+rerank"] = with_rerank(dense_numpy)
+        configs["hybrid+rerank"] = with_rerank(hybrid)
+
+    return configs
+
+
+def recommend(results, bar: float, metric: str):
+    """변형 평균 metric이 bar 이상인 설정 중 평균 p50이 가장 낮은 설정"""
+    candidates = []
+    for name, by_variant in results.items():
+        score = mean(r[metric] for r in by_variant.values())
+        p50 = mean(r["latency"]["p50_ms"] for r in by_variant.values())
+        if score >= bar:
+            candidates.append((p50, name, score))
+    return min(candidates) if candidates else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 품질(recall@k, MRR) + 지연시간 평가")
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    parser.add_argument("--depth", type=int, default=max(RECALL_KS), help="설정마다 가져올 문서 수")
+    parser.add_argument("--rerank", action="store_true", help="FlashRank 재정렬 설정 포함")
+    parser.add_argument("--rerank-top", type=int, default=RERANK_TOP_M)
+    parser.add_argument("--bar", type=float, default=0.9, help="추천 기준 (변형 평균)")
+    parser.add_argument("--bar-metric", default="recall@3",
+                        choices=[f"recall@{k}" for k in RECALL_KS] + ["mrr"])
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    questions = load_questions()
+    configs = build_configs(args.depth, args.rerank, args.rerank_top)
+
+    results = {}
+    for name, search in configs.items():
+        search(questions[0])  # 모델 첫 추론/지연 로딩은 측정에서 제외
+        results[name] = {}
+        for variant in args.variants:
+            result = evaluate(search, questions, variant)
+            result["latency"] = summarize_latencies(result.pop("latencies"))
+            results[name][variant] = result
+
+    recall_cols = " ".join(f"{'R@' + str(k):>6}" for k in RECALL_KS)
+    print(f"{len(questions)} questions, depth {args.depth}")
+    for variant in args.variants:
+        print(f"\n[{variant}]")
+        print(f"{'config':<14} {recall_cols} {'MRR':>6} {'p50 ms':>8} {'p95 ms':>8}")
+        for name in configs:
+            r = results[name][variant]
+            recalls = " ".join(f"{r[f'recall@{k}']:>6.3f}" for k in RECALL_KS)
+            print(f"{name:<14} {recalls} {r['mrr']:>6.3f} "
+                  f"{r['latency']['p50_ms']:>8.2f} {r['latency']['p95_ms']:>8.2f}")
+
+    best = recommend(results, args.bar, args.bar_metric)
+    print()
+    if best:
+        p50, name, score = best
+        print(f"✅ 추천: {name} ({args.bar_metric} {score:.3f} ≥ {args.bar}, 평균 p50 {p50:.2f}ms)")
+    else:
+        print(f"⚠️ {args.bar_metric} ≥ {args.bar}를 만족하는 설정이 없습니다.")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"depth": args.depth, "results": results}, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+오프라인 RAG 벤치마크 스위트 (stub LLM, Groq 불필요)
+use_reranking × 검색 백엔드 조합마다 새 프로세스에서 아래를 측정해 JSON으로 저장
+
+- cold_start: import / 파이프라인 생성(임베딩 로드) / 벡터 스토어 / 체인 / 첫 질의 TTFT
+- stages: company_qa.csv 질문을 순차 재생할 때의 단계별 p50/p95/p99 (utils.metrics)
+- load: 동시 세션 수별 지연시간, TTFT, 처리량 (astream_query)
+- peak_rss_mb: 프로세스 최대 RSS
+
+FAQ 빠른 경로와 답변 캐시는 CSV 질문을 그대로 응답해 검색/LLM 경로를 건너뛰므로 기본적으로 끈다.
+JSON은 키 정렬 + 고정 들여쓰기로 저장되어 커밋 간 diff가 가능하고, --compare로 주요 지표 변화를 출력한다.
+
+사용법:
+    python benchmarks/run_suite.py --output benchmarks/results/$(git rev-parse --short HEAD).json
+    python benchmarks/run_suite.py --compare benchmarks/results/old.json --output benchmarks/results/new.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_OUTPUT = project_root / "benchmarks" / "results" / "suite.json"
+
+
+def run_config(use_reranking: bool, backend: str, params: dict, queue) -> None:
+    """설정 1개 측정 (spawn된 새 프로세스에서 실행)"""
+    if not params["fast_paths"]:
+        os.environ["FAQ_ENABLED"] = "false"
+        os.environ["ANSWER_CACHE_ENABLED"] = "false"
+
+    cold = {}
+    start = time.perf_counter()
+    from benchmarks.bench_async_load import run_load
+    from benchmarks.common import StubChatModel, VECTORSTORE_PATH, load_questions
+    from utils.batch_embedder import peak_rss_mb
+    from utils.metrics import get_metrics
+    from utils.rag_pipeline import RAGPipeline
+    cold["import_s"] = time.perf_counter() - start
+
+    llm = StubChatModel(ttft=params["ttft"], token_delay=params["token_delay"])
+
+    t = time.perf_counter()
+    pipeline = RAGPipeline(use_reranking=use_reranking, llm=llm, retriever_backend=backend)
+    cold["pipeline_s"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    pipeline.load_vectorstore(str(VECTORSTORE_PATH))
+    cold["vectorstore_s"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    pipeline.create_qa_chain()
+    cold["chain_s"] = time.perf_counter() - t
+
+    questions = load_questions()
+
+    async def first_query():
+        t = time.perf_counter()
+        first = None
+        async for _ in pipeline.astream_query(questions[0]):
+            if first is None:
+                first = time.perf_counter() - t
+        return first or 0.0
+
+    # 첫 질의: 모델 첫 추론, HNSW/BM25 첫 접근, (rerank 시) reranker 로드 포함
+    cold["first_query_ttft_s"] = asyncio.run(first_query())
+    cold["total_s"] = time.perf_counter() - start
+    cold = {key: round(value, 3) for key, value in cold.items()}
+
+    # 단계별 지연시간: 순차 재생 (cold start 샘플 제외)
+    metrics = get_metrics()
+    metrics.reset()
+    for question in questions:
+        for _ in pipeline.stream_query(question):
+            pass
+    stages = metrics.get_summary()
+
+    load = [
+        asyncio.run(run_load(pipeline, "async", sessions, params["requests"], questions))
+        for sessions in params["concurrency"]
+    ]
+
+    queue.put({
+        "use_reranking": use_reranking,
+        "retriever_backend": backend,
+        "retrieval_mode": pipeline.retrieval_mode,
+        "rerank_policy": pipeline.rerank_policy.mode,
+        "cold_start": cold,
+        "stages": stages["stages"],
+        "counters": stages["counters"],
+        "load": load,
+        "peak_rss_mb": round(peak_rss_mb()[0], 1),
+    })
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def config_name(result: dict) -> str:
+    rerank = "rerank" if result["use_reranking"] else "norerank"
+    return f"{result['retriever_backend']}-{rerank}"
+
+
+def key_metrics(result: dict) -> dict:
+    """비교용 주요 지표 (낮을수록 좋음, throughput만 높을수록 좋음)"""
+    values = {
+        "cold_start.total_s": result["cold_start"]["total_s"],
+        "cold_start.first_query_ttft_s": result["cold_start"]["first_query_ttft_s"],
+        "peak_rss_mb": result["peak_rss_mb"],
+    }
+    for stage in ("embed", "vector_search", "lexical_search", "rerank", "retrieval", "ttft"):
+        if stage in result["stages"]:
+            values[f"stages.{stage}.p95_ms"] = result["stages"][stage]["p95_ms"]
+    for level in result["load"]:
+        values[f"load.{level['sessions']}.p99_ms"] = level["latency"]["p99_ms"]
+        values[f"load.{level['sessions']}.throughput_qps"] = level["throughput_qps"]
+    return values
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """두 결과 파일의 주요 지표 변화 출력"""
+    print(f"\n비교: {baseline['meta']['commit']} → {current['meta']['commit']}")
+    for name, result in current["configs"].items():
+        old = baseline["configs"].get(name)
+        if old is None:
+            continue
+        print(f"\n[{name}]")
+        old_values = key_metrics(old)
+        for metric, value in key_metrics(result).items():
+            before = old_values.get(metric)
+            if before is None:
+                continue
+            change = (value - before) / before * 100 if before else 0.0
+            print(f"  {metric:<36} {before:>10.2f} → {value:>10.2f} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 RAG 벤치마크 스위트 (stub LLM)")
+    parser.add_argument("--backends", nargs="+", default=["chroma", "numpy"])
+    parser.add_argument("--reranking", nargs="+", choices=("off", "on"), default=["off", "on"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=5, help="부하 측정 시 세션당 질의 수")
+    parser.add_argument("--ttft", type=float, default=0.1, help="stub LLM 첫 토큰 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="stub LLM 토큰 간 지연(초)")
+    parser.add_argument("--fast-paths", action="store_true", help="FAQ/답변 캐시 경로 유지")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    params = {
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "ttft": args.ttft,
+        "token_delay": args.token_delay,
+        "fast_paths": args.fast_paths,
+    }
+
+    ctx = multiprocessing.get_context("spawn")
+    configs = {}
+    for backend in args.backends:
+        for rerank in args.reranking:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=run_config, args=(rerank == "on", backend, params, queue))
+            proc.start()
+            result = queue.get()
+            proc.join()
+
+            name = config_name(result)
+            configs[name] = result
+            print(f"{name:<18} cold {result['cold_start']['total_s']:>6.2f}s  "
+                  f"first ttft {result['cold_start']['first_query_ttft_s'] * 1000:>7.1f}ms  "
+                  f"retrieval p95 {result['stages'].get('retrieval', {}).get('p95_ms', 0.0):>7.1f}ms  "
+                  f"peak {result['peak_rss_mb']:>6.0f}MB")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "params": params,
+        },
+        "configs": configs,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
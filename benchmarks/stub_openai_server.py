@@ -0,0 +1,181 @@
+"""
+OpenAI 호환 stub LLM 서버 (Groq API 대역, 표준 라이브러리만 사용)
+HTTP/1.1 keep-alive + chunked SSE 스트리밍으로 /openai/v1/chat/completions를 흉내내고,
+받은 TCP 연결 수와 completion 호출 수를 /stats로 노출해 커넥션 재사용/요청 병합을 검증
+
+사용법:
+    python benchmarks/stub_openai_server.py --port 8900 --ttft 0.2 --token-delay 0.01
+    GROQ_API_BASE=http://127.0.0.1:8900 GROQ_API_KEY=dummy chainlit run chainlit_app.py
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_MODEL = "stub-model"
+
+
+class StubStats:
+    """서버 측 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.completions = 0
+        self.prompts = {}
+
+    def add_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def add_completion(self, prompt: str) -> None:
+        with self._lock:
+            self.completions += 1
+            self.prompts[prompt] = self.prompts.get(prompt, 0) + 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "connections": self.connections,
+                "completions": self.completions,
+                "distinct_prompts": len(self.prompts)
+            }
+
+
+def stub_answer(prompt: str) -> list:
+    """프롬프트로 정해지는 답변 토큰 목록 (같은 프롬프트 → 같은 답변)"""
+    words = prompt.split()[-8:] or ["(empty)"]
+    return ["stub answer for:"] + [f" {w}" for w in words]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 유지 (연결 재사용 측정용)
+
+    def setup(self):
+        super().setup()
+        self.server.stats.add_connection()  # 핸들러는 TCP 연결당 1개 생성됨
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == "/openai/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": STUB_MODEL, "object": "model"}]})
+        elif self.path == "/stats":
+            self._send_json(200, self.server.stats.to_dict())
+        else:
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path != "/openai/v1/chat/completions":
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+
+        messages = request.get("messages", [])
+        prompt = messages[-1]["content"] if messages else ""
+        self.server.stats.add_completion(prompt)
+
+        tokens = stub_answer(prompt)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = request.get("model", STUB_MODEL)
+        time.sleep(self.server.ttft)
+
+        if not request.get("stream"):
+            time.sleep(self.server.token_delay * len(tokens))
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(tokens),
+                          "total_tokens": len(prompt.split()) + len(tokens)}
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta: dict, finish_reason=None) -> bytes:
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8")
+
+        self._write_chunk(event({"role": "assistant", "content": ""}))
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(self.server.token_delay)
+            self._write_chunk(event({"content": token}))
+        self._write_chunk(event({}, finish_reason="stop"))
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")  # chunked 종료
+
+
+def start_stub_server(port: int = 0, ttft: float = 0.2, token_delay: float = 0.01) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 stub 서버 시작
+
+    Args:
+        port: 포트 (0이면 빈 포트 자동 선택)
+        ttft: 첫 토큰 전 지연 (초)
+        token_delay: 토큰 간 지연 (초)
+
+    Returns:
+        실행 중인 서버 (server.server_address[1]로 포트 확인, server.shutdown()으로 종료)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.stats = StubStats()
+    server.ttft = ttft
+    server.token_delay = token_delay
+    threading.Thread(target=server.serve_forever, name="stub-openai", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 stub LLM 서버")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--ttft", type=float, default=0.2, help="첫 토큰 전 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="토큰 간 지연(초)")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.ttft, args.token_delay)
+    print(f"Stub server: http://127.0.0.1:{server.server_address[1]} (GROQ_API_BASE로 지정)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
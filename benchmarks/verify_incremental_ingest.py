@@ -0,0 +1,143 @@
+"""
+증분 인제스트 변경 감지 검증 (임베딩 모델/Chroma 불필요)
+CSV 중간에 행을 추가/삭제하거나 답변 하나를 고쳤을 때
+뒤쪽 행들이 updated로 잡혀 다시 임베딩되지 않고, 저장된 row 메타데이터는 새 위치로 갱신되는지 확인하고,
+마지막(배치 크기 미만) 배치에서 임베딩이 실패해도 파이프라인이 멈추지 않고 예외를 내는지 확인
+
+사용법:
+    python benchmarks/verify_incremental_ingest.py --rows 200
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from utils.ingest_pipeline import IngestPipeline
+
+
+class InMemoryCollection:
+    """Chroma 컬렉션의 upsert/update만 흉내내는 저장소 ({ID: metadata}, {ID: document})"""
+
+    def __init__(self):
+        self.metadatas = {}
+        self.documents = {}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.metadatas.update((doc_id, dict(meta)) for doc_id, meta in zip(ids, metadatas))
+        self.documents.update(zip(ids, documents))
+
+    def update(self, ids, metadatas):
+        self.metadatas.update((doc_id, dict(meta)) for doc_id, meta in zip(ids, metadatas))
+
+
+class FailingEmbedding(DeterministicFakeEmbedding):
+    """embed_documents가 항상 실패하는 임베딩"""
+
+    def embed_documents(self, texts):
+        raise RuntimeError("embedding failed")
+
+
+class InMemoryVectorstore:
+    def __init__(self):
+        self._collection = InMemoryCollection()
+
+
+def write_csv(path: Path, rows) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["question", "answer", "category"])
+        writer.writerows(rows)
+
+
+def ingest(vectorstore, path: Path) -> dict:
+    pipeline = IngestPipeline(
+        vectorstore,
+        embeddings=DeterministicFakeEmbedding(size=8),
+        existing_metadata={k: dict(v) for k, v in vectorstore._collection.metadatas.items()}
+    )
+    pipeline.run([path])
+    return pipeline.diff
+
+
+def stale_rows(vectorstore, rows, removed) -> int:
+    """저장된 row 메타데이터가 CSV의 실제 위치와 다른 청크 수 (삭제 예정 청크 제외)"""
+    position = {f"질문: {question}": i for i, (question, _, _) in enumerate(rows)}
+    collection = vectorstore._collection
+    return sum(
+        1 for doc_id, document in collection.documents.items()
+        if doc_id not in removed and collection.metadatas[doc_id]["row"] != position[document.split("\n")[0]]
+    )
+
+
+def check_final_batch_failure(path: Path, timeout: float = 10.0) -> bool:
+    """batch_size보다 적은 청크만 있을 때(마지막 배치만 존재) 임베딩 실패가 예외로 끝나는지"""
+    outcome = {}
+
+    def run():
+        pipeline = IngestPipeline(InMemoryVectorstore(), embeddings=FailingEmbedding(size=8), batch_size=10_000)
+        try:
+            pipeline.run([path])
+            outcome["result"] = "no error"
+        except RuntimeError as e:
+            outcome["result"] = f"raised: {e}"
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    result = outcome.get("result", f"hung > {timeout:g}s")
+    ok = result.startswith("raised")
+    print(f"{'final batch failure':<22} {result} {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 인제스트 변경 감지 검증")
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = [[f"질문 {i}번은 무엇인가요?", f"답변 {i}", "general"] for i in range(args.rows)]
+    middle = args.rows // 2
+
+    cases = [
+        # (설명, 변경 후 행, 기대 diff)
+        ("insert row mid-file", rows[:middle] + [["새 질문은 무엇인가요?", "새 답변", "general"]] + rows[middle:],
+         {"added": 1, "updated": 0, "removed": 0, "moved": args.rows - middle}),
+        ("delete row mid-file", rows[:middle] + rows[middle + 1:],
+         {"added": 0, "updated": 0, "removed": 1, "moved": args.rows - middle - 1}),
+        ("edit one answer", rows[:middle] + [[rows[middle][0], "바뀐 답변", "general"]] + rows[middle + 1:],
+         {"added": 0, "updated": 1, "removed": 0, "moved": 0}),
+    ]
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "company_qa.csv"
+        for label, changed, expected in cases:
+            vectorstore = InMemoryVectorstore()
+            write_csv(path, rows)
+            ingest(vectorstore, path)
+
+            write_csv(path, changed)
+            diff = ingest(vectorstore, path)
+            actual = {key: len(diff[key]) for key in expected}
+            stale = stale_rows(vectorstore, changed, set(diff["removed"]))
+            ok = actual == expected and stale == 0
+            failed |= not ok
+            print(f"{label:<22} {actual} (unchanged {len(diff['unchanged'])}, stale rows {stale}) "
+                  f"{'OK' if ok else f'FAIL, expected {expected}, stale rows 0'}")
+
+        write_csv(path, rows)
+        failed |= not check_final_batch_failure(path)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
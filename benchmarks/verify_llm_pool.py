@@ -0,0 +1,159 @@
+"""
+Groq 공유 커넥션 풀 + 요청 병합 검증 (로컬 stub 서버, Groq 불필요)
+세션별 파이프라인처럼 LLM 인스턴스를 여러 개 만들고 같은/다른 프롬프트를 동시에 스트리밍했을 때
+
+- 상위 completion 호출 수 == 서로 다른 프롬프트 수 (single-flight 병합)
+- 모든 대기자가 전체 답변을 받음
+- 대기자마다 청크 복사본을 받음 (자기 run id만 보이고 다른 대기자의 id로 덮이지 않음)
+- TCP 연결 수가 인스턴스/요청 수보다 훨씬 적음 (keep-alive 공유)
+
+을 확인하고, 인스턴스별 클라이언트(기존 방식)와 연결 수/지연을 비교
+
+사용법:
+    python benchmarks/verify_llm_pool.py --pipelines 8 --requests 64 --distinct 4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.stub_openai_server import start_stub_server, stub_answer
+
+MODEL_NAME = "stub-model"
+
+
+def server_stats(server) -> dict:
+    return server.stats.to_dict()
+
+
+def prompts_for(requests: int, distinct: int):
+    return [f"질문 {i % distinct}: 연차 휴가는 며칠인가요?" for i in range(requests)]
+
+
+async def run_async(llms, prompts):
+    """요청마다 (프롬프트, 답변, 지연) 반환 (요청 i는 인스턴스 i % len(llms) 사용)"""
+    from langchain_core.messages import HumanMessage
+
+    async def one(i, prompt):
+        start = time.perf_counter()
+        answer = ""
+        async for chunk in llms[i % len(llms)].astream([HumanMessage(content=prompt)]):
+            answer += chunk.content
+        return prompt, answer, time.perf_counter() - start
+
+    return await asyncio.gather(*(one(i, p) for i, p in enumerate(prompts)))
+
+
+def run_sync(llms, prompts):
+    """스레드 풀로 sync stream 동시 실행"""
+    from langchain_core.messages import HumanMessage
+
+    def one(i, prompt):
+        start = time.perf_counter()
+        answer = "".join(c.content for c in llms[i % len(llms)].stream([HumanMessage(content=prompt)]))
+        return prompt, answer, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        return list(pool.map(lambda args: one(*args), enumerate(prompts)))
+
+
+async def check_chunk_isolation(llms) -> bool:
+    """같은 프롬프트로 병합된 스트림이 각자 자기 run id가 붙은 청크만 받는지"""
+    from langchain_core.messages import HumanMessage
+
+    async def ids(llm):
+        return {chunk.id async for chunk in llm.astream([HumanMessage(content="청크 격리 확인 질문")])}
+
+    results = await asyncio.gather(*(ids(llm) for llm in llms))
+    ok = all(len(run_ids) == 1 for run_ids in results) and len(set().union(*results)) == len(llms)
+    print(f"{'async chunk isolation':<28} streams {len(llms):>4}  distinct run ids "
+          f"{len(set().union(*results)):>4}  {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def report(label, server, before, results, expected_calls=None) -> bool:
+    after = server_stats(server)
+    calls = after["completions"] - before["completions"]
+    connections = after["connections"] - before["connections"]
+    wrong = sum(1 for prompt, answer, _ in results if answer != "".join(stub_answer(prompt)))
+    latencies = [lat for _, _, lat in results]
+
+    ok = wrong == 0 and (expected_calls is None or calls == expected_calls)
+    expected = f" (expected {expected_calls})" if expected_calls is not None else ""
+    print(f"{label:<28} requests {len(results):>4}  upstream calls {calls:>4}{expected}  "
+          f"connections {connections:>4}  wrong answers {wrong}  "
+          f"p50 {statistics.median(latencies) * 1000:>7.1f}ms  max {max(latencies) * 1000:>7.1f}ms  "
+          f"{'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Groq 공유 커넥션 풀 + 요청 병합 검증 (stub 서버)")
+    parser.add_argument("--pipelines", type=int, default=8, help="LLM 인스턴스 수 (세션별 파이프라인)")
+    parser.add_argument("--requests", type=int, default=64, help="동시 요청 수")
+    parser.add_argument("--distinct", type=int, default=4, help="서로 다른 프롬프트 수")
+    parser.add_argument("--ttft", type=float, default=0.3, help="stub 서버 첫 토큰 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    server = start_stub_server(0, args.ttft, args.token_delay)
+    os.environ["GROQ_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+
+    # 환경변수 설정 후 import (모듈 로드 시 읽음)
+    from langchain_groq import ChatGroq
+    from utils.llm_client import GROQ_API_BASE, create_groq_llm
+
+    prompts = prompts_for(args.requests, args.distinct)
+    failed = False
+
+    # 공유 풀 + 병합 (파이프라인마다 create_groq_llm 호출)
+    shared = [create_groq_llm(MODEL_NAME, 0.3) for _ in range(args.pipelines)]
+
+    async def shared_rounds():
+        before = server_stats(server)
+        results = await run_async(shared, prompts)
+        ok = report("async shared+coalesced", server, before, results, expected_calls=args.distinct)
+
+        # 두 번째 라운드: 연결을 새로 열지 않고 재사용하는지
+        before = server_stats(server)
+        results = await run_async(shared, prompts)
+        ok &= report("async shared (warm)", server, before, results, expected_calls=args.distinct)
+        ok &= await check_chunk_isolation(shared)
+        return ok
+
+    failed |= not asyncio.run(shared_rounds())
+
+    before = server_stats(server)
+    results = run_sync(shared, prompts)
+    failed |= not report("sync shared+coalesced", server, before, results, expected_calls=args.distinct)
+
+    # 병합만 끄고 공유 풀 유지
+    uncoalesced = [create_groq_llm(MODEL_NAME, 0.3, coalesce=False) for _ in range(args.pipelines)]
+    before = server_stats(server)
+    results = run_sync(uncoalesced, prompts)
+    failed |= not report("sync shared, no coalescing", server, before, results, expected_calls=args.requests)
+
+    # 기존 방식: 인스턴스마다 자체 HTTP 클라이언트
+    per_instance = [
+        ChatGroq(model=MODEL_NAME, api_key=os.environ["GROQ_API_KEY"], base_url=GROQ_API_BASE, temperature=0.3)
+        for _ in range(args.pipelines)
+    ]
+    before = server_stats(server)
+    results = asyncio.run(run_async(per_instance, prompts))
+    failed |= not report("async per-instance clients", server, before, results, expected_calls=args.requests)
+
+    server.shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
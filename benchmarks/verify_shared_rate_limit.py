@@ -0,0 +1,109 @@
+"""
+공유 Rate Limiter 검증 (멀티 프로세스)
+여러 워커 프로세스가 같은 SQLite 파일로 한 사용자를 동시에 요청했을 때
+허용된 요청 합계가 전역 한도와 정확히 같은지 확인하고, 확인 1회 지연을 측정
+
+사용법:
+    python benchmarks/verify_shared_rate_limit.py --processes 8 --rpm 30 --rph 100
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.rate_limiter import RateLimiter, SQLiteBackend
+
+
+def worker(db_path: str, rpm: int, rph: int, attempts: int, user_id: str, barrier, results) -> None:
+    limiter = RateLimiter(rpm, rph, evict_interval=0, backend=SQLiteBackend(db_path))
+    allowed = 0
+    latencies = []
+
+    barrier.wait()
+    for _ in range(attempts):
+        start = time.perf_counter()
+        ok, _, _ = limiter.check(user_id)
+        latencies.append(time.perf_counter() - start)
+        allowed += ok
+
+    limiter.close()
+    results.put((allowed, latencies))
+
+
+def run_round(db_path: str, processes: int, rpm: int, rph: int, attempts: int, user_id: str):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(processes)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=worker, args=(db_path, rpm, rph, attempts, user_id, barrier, results))
+        for _ in range(processes)
+    ]
+    for p in procs:
+        p.start()
+    outcomes = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    allowed = sum(a for a, _ in outcomes)
+    latencies = [lat for _, lats in outcomes for lat in lats]
+    return allowed, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 Rate Limiter 멀티 프로세스 검증")
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=30)
+    parser.add_argument("--rph", type=int, default=100)
+    parser.add_argument("--attempts", type=int, default=50, help="프로세스당 요청 수")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "rate_limit.sqlite3")
+        SQLiteBackend(db_path).close()
+
+        # 분당 한도: 모든 워커를 합쳐 rpm개만 허용되어야 함
+        allowed, latencies = run_round(db_path, args.processes, args.rpm, args.rph, args.attempts, "minute-user")
+        expected = min(args.rpm, args.rph, args.processes * args.attempts)
+        ok = allowed == expected
+        failed |= not ok
+        print(f"minute limit: allowed {allowed}/{args.processes * args.attempts} (expected {expected}) "
+              f"{'OK' if ok else 'FAIL'}")
+
+        # 시간당 한도: 분당 한도를 풀고 rph개만 허용되어야 함
+        allowed, more = run_round(db_path, args.processes, 10**6, args.rph, args.attempts, "hour-user")
+        latencies += more
+        expected = min(args.rph, args.processes * args.attempts)
+        ok = allowed == expected
+        failed |= not ok
+        print(f"hour limit:   allowed {allowed}/{args.processes * args.attempts} (expected {expected}) "
+              f"{'OK' if ok else 'FAIL'}")
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"check latency ({args.processes} concurrent processes): "
+          f"p50={cuts[49] * 1000:.3f}ms p99={cuts[98] * 1000:.3f}ms")
+
+    # 경합 없는 단일 프로세스 지연
+    with tempfile.TemporaryDirectory() as tmp:
+        limiter = RateLimiter(10**6, 10**6, evict_interval=0, backend=SQLiteBackend(str(Path(tmp) / "rl.sqlite3")))
+        single = []
+        for i in range(2000):
+            start = time.perf_counter()
+            limiter.check(f"user-{i % 100}")
+            single.append(time.perf_counter() - start)
+        limiter.close()
+    cuts = statistics.quantiles(single, n=100)
+    print(f"check latency (single process): p50={cuts[49] * 1000:.3f}ms p99={cuts[98] * 1000:.3f}ms")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,15 @@ import os
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from utils.rag_pipeline import RAGPipeline
+from chainlit.server import app
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from utils.health import aget_health_status
+from utils.metrics import get_metrics
+from utils.pipeline_registry import get_pipeline_registry
+from utils.rag_pipeline import MAX_HISTORY_ITEMS
 from utils.rate_limiter import get_rate_limiter
+from utils.warmup import start_warmup
 
 # 인증 설정 (선택적)
 AUTH_ENABLED = os.getenv("AUTH_ENABLED", "false").lower() == "true"
@@ -43,40 +50,68 @@ logger.info(f"Vectorstore exists: {(project_root / 'data' / 'vectorstore').exist
 logger.info(f"GROQ_API_KEY: {'set' if os.getenv('GROQ_API_KEY') else 'not set'}")
 logger.info("=" * 50)
 
-# Pre-loading: 시작 시 모델 로드하여 첫 질의 타임아웃 방지
-logger.info("Pre-loading distiluse-base-multilingual-cased-v2 embeddings model...")
-try:
-    from sentence_transformers import SentenceTransformer
-    _ = SentenceTransformer("sentence-transformers/distiluse-base-multilingual-cased-v2")
-    logger.info("✅ distiluse-base-multilingual-cased-v2 model pre-loaded successfully")
-except Exception as e:
-    logger.warning(f"⚠️ Model pre-load failed (will load on first use): {e}")
+# 첫 세션 기본 설정 (Groq API)
+DEFAULT_MODEL_NAME = "llama-3.1-8b-instant"
+DEFAULT_TEMPERATURE = 0.7
+DEFAULT_USE_RERANKING = False  # 메모리 절약을 위해 비활성화 (~100MB 절약)
+
+# 프로세스 전역 파이프라인 레지스트리 (세션 간 임베딩/벡터 스토어/reranker 공유)
+pipeline_registry = get_pipeline_registry()
+
+# 백그라운드 워밍업: 첫 사용자가 모델 로드/벡터 스토어 오픈 비용을 내지 않도록
+# 기본 설정의 공유 파이프라인을 미리 만들고 더미 임베딩/검색(/rerank)을 실행
+warmup = start_warmup(pipeline_registry, DEFAULT_MODEL_NAME, DEFAULT_TEMPERATURE, DEFAULT_USE_RERANKING)
+
+
+@app.get("/metrics")
+def metrics_endpoint():
+    """Prometheus 스크레이프용 단계별 지연시간 히스토그램 + 카운터"""
+    return PlainTextResponse(get_metrics().render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/health")
+async def health_endpoint():
+    """컴포넌트 상태 + 단계별 p50/p95/p99 (TTL 캐시, unhealthy면 503)"""
+    status = await aget_health_status()
+    return JSONResponse(status, status_code=503 if status["status"] == "unhealthy" else 200)
+
+
+# Chainlit의 프론트엔드 catch-all 라우트보다 먼저 매칭되도록 앞으로 이동
+# (등록 순서에 의존하지 않고 엔드포인트로 찾음, 같은 경로의 다른 라우트보다도 우선)
+_ops_endpoints = (metrics_endpoint, health_endpoint)
+_ops_routes = [route for route in app.router.routes if getattr(route, "endpoint", None) in _ops_endpoints]
+app.router.routes[:] = _ops_routes + [route for route in app.router.routes if route not in _ops_routes]
+
+
+async def wait_until_ready() -> None:
+    """워밍업이 끝날 때까지 대기 (시간 초과 시 그대로 진행)"""
+    if warmup.ready.is_set():
+        return
+    logger.info("Waiting for warm-up to finish...")
+    await cl.Message(content="⏳ 시스템 준비 중입니다. 잠시만 기다려주세요...", author="System").send()
+    if not await cl.make_async(warmup.wait)():
+        logger.warning("Warm-up not finished within timeout, continuing")
 
 
 @cl.on_chat_start
 async def start():
     """채팅 시작 시 호출"""
-    # RAG 파이프라인 초기화 (백그라운드)
+    # 공유 RAG 파이프라인 가져오기 (프로세스당 1회 생성)
     try:
         logger.info("=== Starting RAG pipeline initialization ===")
 
+        # 워밍업 완료 전이면 대기 (완료 후에는 공유 파이프라인이 이미 로드되어 있음)
+        await wait_until_ready()
+
         # 기본 설정 (Groq API)
-        model_name = "llama-3.1-8b-instant"
-        temperature = 0.7
-        use_reranking = False  # 메모리 절약을 위해 비활성화 (~100MB 절약)
+        model_name = DEFAULT_MODEL_NAME
+        temperature = DEFAULT_TEMPERATURE
+        use_reranking = DEFAULT_USE_RERANKING
 
         logger.info(f"Model: {model_name}, Temperature: {temperature}, Reranking: {use_reranking}")
 
-        # RAG 파이프라인 생성
-        logger.info("Creating RAG pipeline...")
-        pipeline = RAGPipeline(
-            model_name=model_name,
-            temperature=temperature,
-            use_reranking=use_reranking
-        )
-
-        # 벡터 스토어 로드
-        vectorstore_path = project_root / "data" / "vectorstore"
+        # 벡터 스토어 확인
+        vectorstore_path = Path(pipeline_registry.vectorstore_path)
         logger.info(f"Checking vectorstore path: {vectorstore_path}")
         logger.info(f"Vectorstore exists: {vectorstore_path.exists()}")
 
@@ -89,20 +124,20 @@ async def start():
             ).send()
             return
 
-        logger.info("Loading vectorstore...")
-        pipeline.load_vectorstore(str(vectorstore_path))
-
-        # QA 체인 생성
-        pipeline.create_qa_chain()
+        # 레지스트리에서 공유 파이프라인 획득 (최초 1회만 모델/벡터 스토어 로드)
+        pipeline = await cl.make_async(pipeline_registry.acquire)(
+            model_name, temperature, use_reranking
+        )
 
-        # 세션에 저장
+        # 세션에 저장 (세션별 상태는 가벼운 값만)
         cl.user_session.set("rag_pipeline", pipeline)
         cl.user_session.set("model_name", model_name)
         cl.user_session.set("temperature", temperature)
         cl.user_session.set("use_reranking", use_reranking)
         cl.user_session.set("chat_history", [])  # 대화 히스토리 초기화
+        cl.user_session.set("memory", pipeline.create_memory())  # 롤링 요약 (비활성화 시 None)
 
-        logger.info("RAG 파이프라인 초기화 완료")
+        logger.info(f"RAG 파이프라인 초기화 완료: {pipeline_registry.get_stats()}")
 
     except Exception as e:
         error_msg = f"❌ RAG 초기화 실패: {e}"
@@ -110,6 +145,25 @@ async def start():
         logger.error(f"RAG 초기화 실패: {e}", exc_info=True)
 
 
+def _release_session_pipeline():
+    """현재 세션이 잡고 있는 공유 파이프라인 반환"""
+    if cl.user_session.get("rag_pipeline") is None:
+        return
+
+    pipeline_registry.release(
+        cl.user_session.get("model_name"),
+        cl.user_session.get("temperature"),
+        cl.user_session.get("use_reranking")
+    )
+    cl.user_session.set("rag_pipeline", None)
+
+
+@cl.on_chat_end
+async def end():
+    """채팅 종료 시 호출"""
+    _release_session_pipeline()
+
+
 @cl.on_message
 async def main(message: cl.Message):
     """메시지 수신 시 호출 (Rate Limiting 포함)"""
@@ -119,7 +173,7 @@ async def main(message: cl.Message):
 
     # Rate Limiting 확인
     rate_limiter = get_rate_limiter()
-    allowed, error_msg = rate_limiter.is_allowed(user_id)
+    allowed, error_msg, stats = rate_limiter.check(user_id)
 
     if not allowed:
         await cl.Message(
@@ -129,10 +183,12 @@ async def main(message: cl.Message):
         logger.warning(f"Rate limit exceeded for user {user_id}")
         return
 
-    # 사용량 통계 로깅
-    stats = rate_limiter.get_usage_stats(user_id)
+    # 사용량 통계 로깅 (확인 결과에 포함된 통계 사용)
     logger.info(f"User {user_id} usage: {stats['requests_last_minute']}/{stats['limit_per_minute']} per min")
 
+    # 워밍업 완료 전 도착한 메시지는 준비될 때까지 대기
+    await wait_until_ready()
+
     # RAG 파이프라인 가져오기
     rag_pipeline = cl.user_session.get("rag_pipeline")
 
@@ -146,33 +202,35 @@ async def main(message: cl.Message):
     try:
         # 대화 히스토리 가져오기
         chat_history = cl.user_session.get("chat_history", [])
-
-        # 대화 히스토리 포맷팅 (최근 5개 대화만)
-        history_text = ""
-        if chat_history:
-            recent_history = chat_history[-5:]  # 최근 5개만
-            for entry in recent_history:
-                history_text += f"사용자: {entry['user']}\n어시스턴트: {entry['assistant']}\n\n"
+        memory = cl.user_session.get("memory")
 
         # 스트리밍 응답 생성
         msg = cl.Message(content="", author="Assistant")
         await msg.send()
 
-        # RAG 파이프라인으로 스트리밍 응답 (히스토리 포함)
+        # RAG 파이프라인으로 스트리밍 응답 (히스토리 선택/압축은 파이프라인의 토큰 예산에 따름)
         full_response = ""
-        for chunk in rag_pipeline.stream_query(message.content, chat_history=history_text):
+        history = memory if memory is not None else chat_history
+        async for chunk in rag_pipeline.astream_query(message.content, chat_history=history):
             full_response += chunk
             await msg.stream_token(chunk)
 
         # 최종 응답 업데이트
         await msg.update()
 
-        # 대화 히스토리에 추가
-        chat_history.append({
-            "user": message.content,
-            "assistant": full_response
-        })
-        cl.user_session.set("chat_history", chat_history)
+        # 대화 히스토리에 추가 (요약 메모리는 오래된 대화를 백그라운드에서 요약)
+        if memory is not None:
+            memory.add_turn(message.content, full_response)
+        else:
+            chat_history.append({
+                "user": message.content,
+                "assistant": full_response
+            })
+            # 프롬프트에는 최근 MAX_HISTORY_ITEMS개만 들어가므로 세션에도 그만큼만 보관
+            cl.user_session.set(
+                "chat_history",
+                chat_history[-MAX_HISTORY_ITEMS:] if MAX_HISTORY_ITEMS > 0 else []
+            )
 
         # 성공 로깅
         logger.info(f"Query processed successfully for user {user_id}: {len(message.content)} chars -> {len(full_response)} chars")
@@ -190,17 +248,12 @@ async def setup_settings(settings):
     temperature = settings.get("temperature", 0.7)
     use_reranking = settings.get("use_reranking", True)
 
-    # RAG 파이프라인 재초기화
+    # 공유 파이프라인 교체 (같은 설정의 파이프라인이 있으면 재사용)
     try:
-        pipeline = RAGPipeline(
-            model_name=model_name,
-            temperature=temperature,
-            use_reranking=use_reranking
+        pipeline = await cl.make_async(pipeline_registry.acquire)(
+            model_name, temperature, use_reranking
         )
-
-        vectorstore_path = project_root / "data" / "vectorstore"
-        pipeline.load_vectorstore(str(vectorstore_path))
-        pipeline.create_qa_chain()
+        _release_session_pipeline()
 
         # 세션에 업데이트
         cl.user_session.set("rag_pipeline", pipeline)
@@ -208,6 +261,7 @@ async def setup_settings(settings):
         cl.user_session.set("temperature", temperature)
         cl.user_session.set("use_reranking", use_reranking)
         cl.user_session.set("chat_history", [])  # 대화 히스토리 초기화
+        cl.user_session.set("memory", pipeline.create_memory())
 
         await cl.Message(
             content=f"✅ 설정 업데이트 완료\n모델: {model_name} | Temperature: {temperature}\n대화 히스토리가 초기화되었습니다.",
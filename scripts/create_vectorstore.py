@@ -1,130 +1,226 @@
 """
 ChromaDB 벡터 스토어 생성 스크립트
 all-MiniLM-L6-v2 임베딩 사용 (초경량, 빠른 로딩)
+
+CSV / TXT / Markdown / PDF 소스를 로드 → 분할 → 임베딩 → upsert 스트리밍 파이프라인으로 처리
+하이브리드 검색용 BM25 인덱스를 컬렉션 옆(lexical_index.json)에 함께 저장
+기본은 증분 모드: 바뀐 청크만 임베딩하고 사라진 청크는 삭제
+    python scripts/create_vectorstore.py          # 증분 업데이트
+    python scripts/create_vectorstore.py --full   # 전체 재생성
+    python scripts/create_vectorstore.py --batch-size 128 --workers 4
+    python scripts/create_vectorstore.py --sources data/datasets/company_qa.csv docs/manual.pdf
 """
 
+import csv
 import sys
 import os
+import argparse
+import time
 from pathlib import Path
+from typing import Dict, List
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
-from langchain_community.document_loaders import CSVLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from utils.embedding_backend import EMBEDDING_BACKEND, create_embeddings
+from utils.ingest_pipeline import IngestPipeline, write_report
+from utils.lexical_index import LEXICAL_INDEX_FILENAME, BM25Index
+from utils.retrieval_eval import RECALL_KS, evaluate
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-def create_vectorstore():
-    """벡터 스토어 생성"""
+COLLECTION_NAME = "company_docs"
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
+
+DEFAULT_SOURCES = [
+    project_root / "data" / "datasets" / "company_qa.csv",
+    project_root / "data" / "raw",
+]
+DEFAULT_REPORT_PATH = project_root / "data" / "ingest_report.json"
+
+
+def load_existing_metadata(vectorstore) -> Dict[str, Dict]:
+    """저장된 컬렉션의 {ID: 메타데이터} 조회 (content_hash 포함)
+
+    Args:
+        vectorstore: 기존 Chroma 벡터 스토어
+
+    Returns:
+        ID별 메타데이터 딕셔너리 (해시가 없는 구버전 항목은 content_hash 없음)
+    """
+    existing = vectorstore.get(include=["metadatas"])
+    return {
+        doc_id: metadata or {}
+        for doc_id, metadata in zip(existing["ids"], existing["metadatas"])
+    }
+
+
+def create_vectorstore(
+    full: bool = False,
+    batch_size: int = 64,
+    workers: int = 1,
+    sources: List[Path] = None,
+    report_path: Path = DEFAULT_REPORT_PATH
+):
+    """벡터 스토어 생성 (증분 또는 전체)
+
+    Args:
+        full: True면 컬렉션을 지우고 전체 재생성
+        batch_size: 임베딩 배치 크기
+        workers: 임베딩 프로세스 수 (1이면 현재 프로세스)
+        sources: 인제스트할 파일/디렉토리 (기본: company_qa.csv + data/raw)
+        report_path: 단계별 시간 리포트(JSON) 저장 경로
+    """
+    sources = sources or DEFAULT_SOURCES
 
     logger.info("=" * 60)
     logger.info("ChromaDB 벡터 스토어 생성 시작")
     logger.info("=" * 60)
 
     # 1. 임베딩 모델 초기화 (distiluse-base-multilingual-cased-v2 - 다국어, 메모리 최적화)
-    logger.info("1. distiluse-base-multilingual-cased-v2 임베딩 모델 로드 중...")
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/distiluse-base-multilingual-cased-v2",
-        model_kwargs={"device": "cpu"},
-        encode_kwargs={"normalize_embeddings": True}
-    )
+    logger.info(f"1. distiluse-base-multilingual-cased-v2 임베딩 모델 로드 중 (백엔드: {EMBEDDING_BACKEND})...")
+    embeddings = create_embeddings(EMBEDDING_MODEL_NAME)
     logger.info("✓ 임베딩 모델 로드 완료")
 
-    # 2. CSV 데이터 로드
-    logger.info("\n2. CSV 데이터 로드 중...")
-    csv_path = project_root / "data" / "datasets" / "company_qa.csv"
-
-    if not csv_path.exists():
-        raise FileNotFoundError(f"CSV 파일이 없습니다: {csv_path}")
-
-    loader = CSVLoader(
-        file_path=str(csv_path),
-        csv_args={
-            "delimiter": ",",
-            "quotechar": '"',
-        },
-        source_column="category",
-        metadata_columns=["category"],
-        encoding="utf-8"
-    )
-
-    documents = loader.load()
-    logger.info(f"✓ 문서 로드 완료: {len(documents)}개")
-
-    # 3. 문서를 질문-답변 형식으로 변환
-    logger.info("\n3. 문서 변환 중...")
-    processed_docs = []
-
-    for doc in documents:
-        # CSV의 각 행을 질문-답변 형식의 문서로 변환
-        content_parts = doc.page_content.split("\n")
-        if len(content_parts) >= 2:
-            question = content_parts[0].replace("question: ", "")
-            answer = content_parts[1].replace("answer: ", "")
-
-            # 질문-답변 쌍으로 변환
-            formatted_content = f"질문: {question}\n답변: {answer}"
-            doc.page_content = formatted_content
-            processed_docs.append(doc)
-
-    logger.info(f"✓ 문서 변환 완료: {len(processed_docs)}개")
-
-    # 4. Text Splitting (긴 문서를 위한 준비)
-    logger.info("\n4. 텍스트 분할 설정...")
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=500,
-        chunk_overlap=50,
-        length_function=len,
-    )
-
-    split_docs = text_splitter.split_documents(processed_docs)
-    logger.info(f"✓ 문서 분할 완료: {len(split_docs)}개 청크")
+    # 2. 소스 확인
+    logger.info("\n2. 소스 확인 중...")
+    for source in sources:
+        if not Path(source).exists():
+            raise FileNotFoundError(f"소스가 없습니다: {source}")
+        logger.info(f"  - {source}")
 
-    # 5. ChromaDB 생성
-    logger.info("\n5. ChromaDB 벡터 스토어 생성 중...")
+    # 3. ChromaDB 열기 (전체 재생성이면 컬렉션 삭제)
+    mode = "전체 재생성" if full else "증분 업데이트"
+    logger.info(f"\n3. ChromaDB 벡터 스토어 {mode} 준비...")
     vectorstore_path = project_root / "data" / "vectorstore"
     vectorstore_path.mkdir(parents=True, exist_ok=True)
 
-    vectorstore = Chroma.from_documents(
-        documents=split_docs,
-        embedding=embeddings,
+    vectorstore = Chroma(
         persist_directory=str(vectorstore_path),
-        collection_name="company_docs"
+        embedding_function=embeddings,
+        collection_name=COLLECTION_NAME
     )
 
-    logger.info(f"✓ 벡터 스토어 생성 완료: {vectorstore_path}")
-
-    # 6. 테스트 검색
-    logger.info("\n6. 테스트 검색 수행...")
-    test_query = "퓨쳐시스템은 언제 설립되었나요?"
-    results = vectorstore.similarity_search(test_query, k=3)
-
-    logger.info(f"\n테스트 질문: {test_query}")
-    logger.info(f"검색 결과: {len(results)}개")
-    for i, doc in enumerate(results, 1):
-        logger.info(f"\n[결과 {i}]")
-        logger.info(f"내용: {doc.page_content[:100]}...")
-        logger.info(f"메타데이터: {doc.metadata}")
+    if full:
+        vectorstore.delete_collection()
+        vectorstore = Chroma(
+            persist_directory=str(vectorstore_path),
+            embedding_function=embeddings,
+            collection_name=COLLECTION_NAME
+        )
+
+    existing_metadata = load_existing_metadata(vectorstore)
+    logger.info(f"✓ 기존 청크: {len(existing_metadata)}개")
+
+    # 4. 로드 → 분할 → 임베딩 → upsert (단계별 스레드, 겹쳐서 실행)
+    logger.info("\n4. 인제스트 파이프라인 실행 중...")
+    pipeline = IngestPipeline(
+        vectorstore,
+        embeddings=embeddings,
+        model_name=EMBEDDING_MODEL_NAME,
+        batch_size=batch_size,
+        workers=workers,
+        existing_metadata=existing_metadata
+    )
+    report = pipeline.run(sources)
+    diff = pipeline.diff
+
+    # 5. 사라진 청크 삭제
+    logger.info("\n5. 사라진 청크 정리 중...")
+    if diff["removed"]:
+        vectorstore.delete(ids=diff["removed"])
+    logger.info(f"✓ 삭제: {len(diff['removed'])}개")
+
+    # 6. BM25 어휘 인덱스 (컬렉션 전체 기준으로 다시 생성, 임베딩이 없어 수십 ms 수준)
+    logger.info("\n6. BM25 어휘 인덱스 생성 중...")
+    start = time.perf_counter()
+    lexical_index = BM25Index.from_chroma(vectorstore)
+    lexical_index.save(vectorstore_path / LEXICAL_INDEX_FILENAME)
+    report["lexical_index_s"] = round(time.perf_counter() - start, 3)
+    logger.info(f"✓ BM25 인덱스: {len(lexical_index)}개 문서, {report['lexical_index_s']:.2f}s")
+
+    # 절약 시간: 이번에 측정한 청크당 임베딩 시간 × 건너뛴 청크 수
+    embedded = len(diff["added"]) + len(diff["updated"])
+    if embedded:
+        per_doc = report["stages"]["embed"]["busy_s"] / embedded
+    else:
+        sample = vectorstore.get(ids=diff["unchanged"][:8], include=["documents"])["documents"]
+        start = time.perf_counter()
+        if sample:
+            embeddings.embed_documents(sample)
+        per_doc = (time.perf_counter() - start) / max(1, len(sample))
+    report["time_saved_s"] = round(per_doc * len(diff["unchanged"]), 3)
+
+    write_report(report, report_path)
+
+    logger.info(f"✓ 벡터 스토어 {mode} 완료: {vectorstore_path}")
+    logger.info(
+        f"  added={len(diff['added'])} updated={len(diff['updated'])} "
+        f"removed={len(diff['removed'])} unchanged={len(diff['unchanged'])} "
+        f"(위치 메타데이터 갱신 {len(diff['moved'])})"
+    )
+    for name, stage in report["stages"].items():
+        logger.info(
+            f"  [{name}] in={stage['items_in']} out={stage['items_out']} "
+            f"busy={stage['busy_s']:.2f}s wait={stage['wait_s']:.2f}s"
+        )
+    logger.info(f"  전체 {report['wall_s']:.2f}s, 절약된 시간(추정): {report['time_saved_s']:.2f}s")
+    if embedded:
+        logger.info(
+            f"  batch={batch_size} workers={workers}: "
+            f"{report['docs_per_sec']:.1f} docs/sec, "
+            f"peak RSS {report['peak_rss_mb']:.0f}MB (워커 최대 {report['peak_worker_rss_mb']:.0f}MB)"
+        )
+    logger.info(f"  리포트: {report_path}")
+
+    # 7. 검색 품질 확인 (CSV 질문 → 자기 행, dense 검색)
+    qa_path = project_root / "data" / "datasets" / "company_qa.csv"
+    if qa_path.exists():
+        logger.info("\n7. 검색 품질 평가 중 (company_qa.csv 질문 → 원래 행)...")
+        with open(qa_path, encoding="utf-8") as f:
+            questions = [row["question"] for row in csv.DictReader(f)]
+
+        def search(query):
+            return [doc.page_content for doc in vectorstore.similarity_search(query, k=max(RECALL_KS))]
+
+        for variant in ("full", "short"):
+            result = evaluate(search, questions, variant)
+            recalls = ", ".join(f"recall@{k} {result[f'recall@{k}']:.3f}" for k in RECALL_KS)
+            logger.info(f"  [{variant}] {recalls}, MRR {result['mrr']:.3f}")
+        logger.info("  (설정별 비교: python benchmarks/eval_retrieval.py)")
 
     logger.info("\n" + "=" * 60)
     logger.info("벡터 스토어 생성 완료!")
     logger.info("=" * 60)
     logger.info(f"\n저장 위치: {vectorstore_path}")
-    logger.info(f"문서 수: {len(split_docs)}")
-    logger.info(f"임베딩 모델: sentence-transformers/distiluse-base-multilingual-cased-v2")
+    logger.info(f"청크 수: {len(existing_metadata) + len(diff['added']) - len(diff['removed'])}")
+    logger.info(f"임베딩 모델: {EMBEDDING_MODEL_NAME}")
     logger.info(f"벡터 DB: ChromaDB")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ChromaDB 벡터 스토어 생성")
+    parser.add_argument("--full", action="store_true", help="증분 대신 전체 재생성")
+    parser.add_argument("--batch-size", type=int, default=64, help="임베딩 배치 크기")
+    parser.add_argument("--workers", type=int, default=1, help="임베딩 프로세스 수")
+    parser.add_argument("--sources", type=Path, nargs="+", default=None,
+                        help="인제스트할 파일/디렉토리 (기본: company_qa.csv + data/raw)")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT_PATH,
+                        help="단계별 시간 리포트(JSON) 경로")
+    args = parser.parse_args()
+
     try:
-        create_vectorstore()
+        create_vectorstore(
+            full=args.full,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            sources=args.sources,
+            report_path=args.report
+        )
     except Exception as e:
         logger.error(f"오류 발생: {e}", exc_info=True)
         sys.exit(1)
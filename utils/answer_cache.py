@@ -0,0 +1,342 @@
+"""
+답변 캐시 (2단계)
+1단계: 정규화된 질문 문자열 정확 일치
+2단계: 질문 임베딩 코사인 유사도 기반 유사 질문 일치 (semantic=True일 때만)
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# 벡터 스토어 변경 여부 확인 주기 (초)
+VECTORSTORE_CHECK_INTERVAL = 5.0
+
+_TRAILING_PUNCT = re.compile(r"[\s?!.~。？！]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text: str) -> str:
+    """질문 정규화 (유니코드 NFKC, 소문자, 공백 축약, 끝 문장부호 제거)
+
+    Args:
+        text: 원본 질문
+
+    Returns:
+        정규화된 질문
+    """
+    text = unicodedata.normalize("NFKC", text).lower().strip()
+    text = _WHITESPACE.sub(" ", text)
+    return _TRAILING_PUNCT.sub("", text)
+
+
+def vectorstore_fingerprint(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """벡터 스토어 DB 파일의 (mtime, size) 지문
+
+    Args:
+        path: 벡터 스토어 디렉토리
+
+    Returns:
+        (mtime_ns, size) 튜플 또는 None
+    """
+    if not path:
+        return None
+    db_file = Path(path) / "chroma.sqlite3"
+    try:
+        stat = db_file.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _MemoryStore:
+    """LRU + TTL 인메모리 저장소"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[dict]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict) -> List[str]:
+        """저장 후 LRU로 밀려난 키 목록 반환"""
+        self._data[key] = (time.time() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        evicted = []
+        while len(self._data) > self.max_entries:
+            old_key, _ = self._data.popitem(last=False)
+            evicted.append(old_key)
+        return evicted
+
+    def items(self) -> List[Tuple[str, dict]]:
+        now = time.time()
+        return [(k, v) for k, (exp, v) in self._data.items() if exp >= now]
+
+    def get_meta(self, key: str) -> Optional[object]:
+        return None
+
+    def set_meta(self, key: str, value: object) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _DiskStore:
+    """diskcache 기반 LRU + TTL 디스크 저장소 (재시작 후에도 유지)
+
+    diskcache는 항목 수 기준 축출이 없고 peekitem 순서가 저장(rowid) 순서이므로,
+    조회된 항목을 다시 저장해 맨 뒤로 옮기는 방식으로 LRU 순서를 유지한다.
+    """
+
+    def __init__(self, directory: str, max_entries: int, ttl_seconds: float):
+        import diskcache
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._cache = diskcache.Cache(directory)
+        self._meta = diskcache.Cache(os.path.join(directory, "meta"))
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._cache.transact():
+            value, expire_time = self._cache.get(key, expire_time=True)
+            if value is None:
+                return None
+            # 가장 최근 사용 위치로 이동 (남은 TTL 유지)
+            self._cache.delete(key)
+            remaining = None if expire_time is None else max(0.0, expire_time - time.time())
+            self._cache.set(key, value, expire=remaining)
+        return value
+
+    def set(self, key: str, value: dict) -> List[str]:
+        """저장 후 항목 수 제한으로 밀려난 키 목록 반환 (가장 오래 사용되지 않은 항목부터)"""
+        with self._cache.transact():
+            self._cache.delete(key)  # 기존 키도 맨 뒤로
+            self._cache.set(key, value, expire=self.ttl_seconds)
+        evicted = []
+        while len(self._cache) > self.max_entries:
+            old_key, _ = self._cache.peekitem(last=False)
+            self._cache.delete(old_key)
+            evicted.append(old_key)
+        return evicted
+
+    def items(self) -> List[Tuple[str, dict]]:
+        result = []
+        for key in self._cache:
+            value = self._cache.get(key)
+            if value is not None:
+                result.append((key, value))
+        return result
+
+    def get_meta(self, key: str) -> Optional[object]:
+        return self._meta.get(key)
+
+    def set_meta(self, key: str, value: object) -> None:
+        self._meta.set(key, value)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class AnswerCache:
+    """2단계 답변 캐시 (정확 일치 → 임베딩 유사도)
+
+    대화 히스토리에 의존하지 않는 단독 질문에만 사용해야 한다.
+    유사도 단계는 한 단어만 다른 질문(본사 주소 / 전화번호 등)에 다른 질문의 답을 줄 수 있어
+    semantic=True로 명시했을 때만 사용한다.
+    벡터 스토어가 재생성되면(DB 파일 지문 변경) 자동으로 비워진다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600,
+        disk_path: Optional[str] = None,
+        vectorstore_path: Optional[str] = None,
+        semantic: bool = False
+    ):
+        """
+        Args:
+            embeddings: 질문 임베딩 모델 (정규화된 벡터 반환)
+            similarity_threshold: 유사 질문으로 볼 코사인 유사도 하한
+            max_entries: 최대 항목 수 (LRU 축출)
+            ttl_seconds: 항목 유효 시간 (초)
+            disk_path: diskcache 디렉토리 (없으면 인메모리)
+            vectorstore_path: 무효화 감시 대상 벡터 스토어 경로
+            semantic: 임베딩 유사도 단계 사용 여부 (False면 정확 일치만)
+        """
+        self.embeddings = embeddings
+        self.semantic = semantic
+        self.similarity_threshold = similarity_threshold
+        self.vectorstore_path = vectorstore_path
+
+        if disk_path:
+            self._store = _DiskStore(disk_path, max_entries, ttl_seconds)
+            logger.info(f"Answer cache (disk): {disk_path}")
+        else:
+            self._store = _MemoryStore(max_entries, ttl_seconds)
+
+        self._lock = threading.Lock()
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._keys: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._index_dirty = True
+
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        self._fingerprint = vectorstore_fingerprint(vectorstore_path)
+        self._last_check = time.monotonic()
+        stored = self._store.get_meta("fingerprint")
+        if stored is not None and tuple(stored) != self._fingerprint:
+            logger.info("Vectorstore changed since last run, clearing answer cache")
+            self._store.clear()
+        self._store.set_meta("fingerprint", self._fingerprint)
+
+        # 디스크에 남아 있던 항목의 임베딩으로 유사도 인덱스 복원
+        for key, value in self._store.items():
+            if value.get("embedding") is not None:
+                self._vectors[key] = np.asarray(value["embedding"], dtype=np.float32)
+
+    def _check_vectorstore(self) -> None:
+        """벡터 스토어가 재생성되었으면 캐시 비우기 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        if now - self._last_check < VECTORSTORE_CHECK_INTERVAL:
+            return
+        self._last_check = now
+
+        fingerprint = vectorstore_fingerprint(self.vectorstore_path)
+        if fingerprint != self._fingerprint:
+            logger.info("Vectorstore rebuilt, invalidating answer cache")
+            self._store.clear()
+            self._vectors.clear()
+            self._fingerprint = fingerprint
+            self._store.set_meta("fingerprint", fingerprint)
+            self._index_dirty = True
+
+    def _semantic_index(self) -> Tuple[List[str], Optional[np.ndarray]]:
+        """유사도 검색용 (키 목록, 임베딩 행렬) 반환 (lock 보유 상태에서 호출)"""
+        if self._index_dirty:
+            self._keys = list(self._vectors)
+            self._matrix = np.stack(list(self._vectors.values())) if self._vectors else None
+            self._index_dirty = False
+        return self._keys, self._matrix
+
+    def lookup(self, question: str) -> Optional[str]:
+        """캐시된 답변 조회
+
+        Args:
+            question: 사용자 질문
+
+        Returns:
+            캐시된 답변 또는 None
+        """
+        key = normalize_question(question)
+
+        with self._lock:
+            self._check_vectorstore()
+            entry = self._store.get(key)
+            if entry is not None:
+                self.exact_hits += 1
+                logger.info(f"Answer cache exact hit: {key[:50]}")
+                return entry["answer"]
+            keys, matrix = self._semantic_index() if self.semantic else ([], None)
+
+        if matrix is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # 원문으로 임베딩해야 검색 단계와 질의 임베딩 캐시를 공유한다
+        vector = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+
+        with self._lock:
+            if scores[best] >= self.similarity_threshold:
+                entry = self._store.get(keys[best])
+                if entry is None:
+                    # TTL 만료된 항목은 인덱스에서도 제거
+                    self._vectors.pop(keys[best], None)
+                    self._index_dirty = True
+                else:
+                    self.semantic_hits += 1
+                    logger.info(f"Answer cache semantic hit ({scores[best]:.3f}): {key[:50]}")
+                    return entry["answer"]
+            self.misses += 1
+        return None
+
+    def store(self, question: str, answer: str) -> None:
+        """답변 저장
+
+        Args:
+            question: 사용자 질문
+            answer: 생성된 답변
+        """
+        key = normalize_question(question)
+        vector = None
+        if self.semantic:
+            vector = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+
+        with self._lock:
+            evicted = self._store.set(key, {
+                "answer": answer,
+                "embedding": vector.tolist() if vector is not None else None
+            })
+            if vector is not None:
+                self._vectors[key] = vector
+            for old_key in evicted:
+                self._vectors.pop(old_key, None)
+            self._index_dirty = True
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._store.clear()
+            self._vectors.clear()
+            self._index_dirty = True
+
+    def get_stats(self) -> Dict[str, float]:
+        """히트/미스 통계 반환
+
+        Returns:
+            캐시 통계 딕셔너리
+        """
+        with self._lock:
+            total = self.exact_hits + self.semantic_hits + self.misses
+            return {
+                "entries": len(self._store),
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": (self.exact_hits + self.semantic_hits) / total if total else 0.0
+            }
@@ -0,0 +1,123 @@
+"""
+인제스트용 배치 임베딩
+명시적 배치 크기로 임베딩하고, 선택적으로 프로세스 풀(워커마다 모델 1개)로 분산
+"""
+
+import logging
+import multiprocessing
+import os
+import resource
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 전역 모델 (initializer에서 1회 로드)
+_worker_embeddings = None
+
+
+def _init_worker(model_name: str, torch_threads: int) -> None:
+    """워커 프로세스 초기화: 모델 로드 + 스레드 수 제한 (코어 과점유 방지)"""
+    global _worker_embeddings
+
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+    from utils.embedding_backend import create_embeddings
+
+    # 메인 프로세스와 같은 백엔드 (EMBEDDING_BACKEND 환경 변수 상속)
+    _worker_embeddings = create_embeddings(model_name)
+
+
+def _embed_in_worker(start: int, texts: List[str]) -> Tuple[int, List[List[float]]]:
+    return start, _worker_embeddings.embed_documents(texts)
+
+
+def create_worker_pool(model_name: str, workers: int) -> ProcessPoolExecutor:
+    """모델을 1회씩 로드한 워커로 구성된 임베딩 프로세스 풀 생성
+
+    Args:
+        model_name: 워커가 로드할 모델 이름
+        workers: 프로세스 수
+
+    Returns:
+        ProcessPoolExecutor (submit_batch로 배치 제출)
+    """
+    torch_threads = max(1, (os.cpu_count() or 1) // workers)
+    logger.info(f"Starting {workers} embedding workers ({torch_threads} threads each)")
+
+    # torch 로드 이후 fork는 교착 위험이 있으므로 spawn 사용
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_name, torch_threads)
+    )
+
+
+def submit_batch(pool: ProcessPoolExecutor, texts: List[str], start: int = 0) -> Future:
+    """워커 풀에 배치 제출
+
+    Args:
+        pool: create_worker_pool로 만든 풀
+        texts: 임베딩할 텍스트
+        start: 결과에 함께 돌려받을 배치 시작 인덱스
+
+    Returns:
+        (start, 벡터 리스트)로 완료되는 Future
+    """
+    return pool.submit(_embed_in_worker, start, texts)
+
+
+def iter_embedding_batches(
+    texts: List[str],
+    batch_size: int = 64,
+    workers: int = 1,
+    embeddings: Optional[Embeddings] = None,
+    model_name: Optional[str] = None
+) -> Iterator[Tuple[int, List[List[float]]]]:
+    """텍스트를 배치 단위로 임베딩하여 완료되는 순서대로 반환
+
+    Args:
+        texts: 임베딩할 텍스트 리스트
+        batch_size: 배치 크기
+        workers: 프로세스 수 (1이면 현재 프로세스에서 embeddings 사용)
+        embeddings: 단일 프로세스 모드에서 사용할 임베딩 모델
+        model_name: 멀티 프로세스 모드에서 워커가 로드할 모델 이름
+
+    Yields:
+        (배치 시작 인덱스, 벡터 리스트) 튜플
+    """
+    batches = [(i, texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)]
+
+    if workers <= 1:
+        if embeddings is None:
+            raise ValueError("단일 프로세스 모드에는 embeddings가 필요합니다.")
+        for start, batch in batches:
+            yield start, embeddings.embed_documents(batch)
+        return
+
+    if model_name is None:
+        raise ValueError("멀티 프로세스 모드에는 model_name이 필요합니다.")
+
+    with create_worker_pool(model_name, workers) as pool:
+        futures = [submit_batch(pool, batch, start) for start, batch in batches]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def peak_rss_mb() -> Tuple[float, float]:
+    """최대 RSS (MB) 반환
+
+    Returns:
+        (현재 프로세스, 종료된 자식 프로세스 중 최대) 튜플
+    """
+    # Linux의 ru_maxrss 단위는 KB
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return own, children
@@ -0,0 +1,237 @@
+"""
+롤링 요약 대화 메모리
+최근 대화는 원문으로 두고, 임계치를 넘은 오래된 대화는 백그라운드에서 요약에 합쳐
+대화가 길어져도 프롬프트 크기를 일정하게 유지
+"""
+
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+
+from utils.prompt_budget import estimate_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "2"))
+
+# 요약은 응답 경로 밖에서 실행 (LLM 호출 대기 동안 이벤트 루프/검색 풀 점유 방지)
+_summary_executor = ThreadPoolExecutor(
+    max_workers=SUMMARY_WORKERS,
+    thread_name_prefix="conversation-summary"
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+# 프로세스 전역 통계 (모든 세션 합계)
+_stats_lock = threading.Lock()
+_global_stats = {
+    "folds": 0,
+    "turns_folded": 0,
+    "fold_failures": 0,
+    "prompt_tokens_saved": 0
+}
+
+
+def _format_turns(turns: List[Dict[str, str]]) -> str:
+    return "".join(
+        f"사용자: {turn['user']}\n어시스턴트: {turn['assistant']}\n\n"
+        for turn in turns
+    )
+
+
+class StubSummarizer:
+    """결정적 로컬 요약기 (테스트/벤치마크용, LLM 호출 없음)
+
+    대화마다 "질문 → 답변 첫 문장" 한 줄을 만들고, 예산을 넘으면 오래된 줄부터 버린다.
+    """
+
+    def __init__(self, max_tokens: int = 200):
+        """
+        Args:
+            max_tokens: 요약 최대 토큰
+        """
+        self.max_tokens = max_tokens
+
+    def summarize(self, summary: str, turns: List[Dict[str, str]]) -> str:
+        """기존 요약에 대화를 합친 새 요약 반환
+
+        Args:
+            summary: 기존 요약 (없으면 빈 문자열)
+            turns: 합칠 대화 [{"user", "assistant"}]
+
+        Returns:
+            새 요약
+        """
+        lines = summary.splitlines() if summary else []
+        for turn in turns:
+            answer = _SENTENCE_END.split(turn["assistant"].strip(), maxsplit=1)[0]
+            lines.append(f"- {turn['user'].strip()} → {answer}")
+
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > self.max_tokens:
+            lines.pop(0)
+        return truncate_to_tokens("\n".join(lines), self.max_tokens)
+
+
+class LLMSummarizer:
+    """채팅 모델로 기존 요약 + 새 대화를 하나의 요약으로 압축"""
+
+    PROMPT = """다음은 사용자와 AI 어시스턴트의 이전 대화 요약과 그 이후의 대화입니다.
+이후 대화에서 참조될 수 있는 사실, 사용자가 요청한 내용, 답변의 핵심을 유지하여
+하나의 요약으로 합치세요. {max_tokens} 토큰 이내, 요약 본문만 출력하세요.
+
+이전 요약:
+{summary}
+
+대화:
+{turns}
+
+요약:"""
+
+    def __init__(self, llm: BaseChatModel, max_tokens: int = 200):
+        """
+        Args:
+            llm: 요약에 사용할 채팅 모델
+            max_tokens: 요약 최대 토큰
+        """
+        self.llm = llm
+        self.max_tokens = max_tokens
+
+    def summarize(self, summary: str, turns: List[Dict[str, str]]) -> str:
+        """기존 요약에 대화를 합친 새 요약 반환
+
+        Args:
+            summary: 기존 요약 (없으면 빈 문자열)
+            turns: 합칠 대화 [{"user", "assistant"}]
+
+        Returns:
+            새 요약
+        """
+        message = self.llm.invoke(self.PROMPT.format(
+            max_tokens=self.max_tokens,
+            summary=summary or "없음",
+            turns=_format_turns(turns)
+        ))
+        return truncate_to_tokens(str(message.content).strip(), self.max_tokens)
+
+
+class ConversationMemory:
+    """롤링 요약 대화 메모리 (세션당 1개)
+
+    대화 수가 fold_threshold를 넘으면 최근 keep_recent개를 제외한 대화를
+    백그라운드 스레드에서 요약에 합친다. 요약이 끝나기 전까지는 해당 대화가
+    원문으로 남아 있으므로 응답 경로는 요약을 기다리지 않는다.
+    """
+
+    def __init__(self, summarizer, fold_threshold: int = 4, keep_recent: int = 2):
+        """
+        Args:
+            summarizer: summarize(summary, turns)를 제공하는 요약기
+            fold_threshold: 원문 대화가 이 수를 넘으면 요약 시작
+            keep_recent: 요약하지 않고 원문으로 남길 최근 대화 수
+        """
+        self.summarizer = summarizer
+        self.fold_threshold = max(fold_threshold, keep_recent + 1)
+        self.keep_recent = keep_recent
+
+        self.summary = ""
+        self.turns: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+        self._folding = None
+
+        # 요약된 대화의 원문 토큰 수 (요약 토큰과의 차이가 매 프롬프트 절약량)
+        self.folded_tokens = 0
+        self.prompt_tokens_saved = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.turns or self.summary)
+
+    def add_turn(self, user: str, assistant: str) -> None:
+        """대화 추가 (필요하면 백그라운드 요약 시작)
+
+        Args:
+            user: 사용자 메시지
+            assistant: 어시스턴트 답변
+        """
+        with self._lock:
+            self.turns.append({"user": user, "assistant": assistant})
+            if self._folding is not None or len(self.turns) <= self.fold_threshold:
+                return
+            to_fold = self.turns[:-self.keep_recent] if self.keep_recent else list(self.turns)
+            self._folding = _summary_executor.submit(self._fold, self.summary, to_fold)
+
+    def _fold(self, summary: str, turns: List[Dict[str, str]]) -> None:
+        try:
+            new_summary = self.summarizer.summarize(summary, turns)
+        except Exception as e:
+            # 실패해도 메모리가 무한히 커지지 않도록 해당 대화는 버림 (요약은 유지)
+            logger.warning(f"대화 요약 실패, 오래된 대화 {len(turns)}개 제외: {e}")
+            new_summary = summary
+            failed = True
+        else:
+            failed = False
+
+        with self._lock:
+            self.summary = new_summary
+            del self.turns[:len(turns)]
+            if not failed:
+                self.folded_tokens += estimate_tokens(_format_turns(turns))
+            self._folding = None
+
+        with _stats_lock:
+            if failed:
+                _global_stats["fold_failures"] += 1
+            else:
+                _global_stats["folds"] += 1
+                _global_stats["turns_folded"] += len(turns)
+        logger.info(f"대화 {len(turns)}개 요약 완료 (요약 {estimate_tokens(new_summary)} 토큰)")
+
+    def snapshot(self) -> Tuple[str, List[Dict[str, str]]]:
+        """프롬프트에 넣을 (요약, 최근 원문 대화) 반환 (절약 토큰 집계 포함)
+
+        Returns:
+            (요약, 대화 리스트) 튜플
+        """
+        with self._lock:
+            summary, turns = self.summary, list(self.turns)
+            saved = max(0, self.folded_tokens - estimate_tokens(summary))
+            self.prompt_tokens_saved += saved
+
+        if saved:
+            with _stats_lock:
+                _global_stats["prompt_tokens_saved"] += saved
+        return summary, turns
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """진행 중인 요약이 끝날 때까지 대기 (테스트/벤치마크용)"""
+        folding = self._folding
+        if folding is not None:
+            folding.result(timeout=timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """세션 메모리 통계 반환
+
+        Returns:
+            원문 대화 수, 요약 토큰, 요약된 원문 토큰, 누적 절약 토큰
+        """
+        with self._lock:
+            return {
+                "turns": len(self.turns),
+                "summary_tokens": estimate_tokens(self.summary),
+                "folded_tokens": self.folded_tokens,
+                "prompt_tokens_saved": self.prompt_tokens_saved
+            }
+
+
+def get_memory_stats() -> Dict[str, int]:
+    """프로세스 전역 요약 통계 반환 (모든 세션 합계)
+
+    Returns:
+        요약 횟수, 요약된 대화 수, 실패 수, 누적 절약 토큰
+    """
+    with _stats_lock:
+        return dict(_global_stats)
@@ -1,11 +1,43 @@
 """
 데이터 로더
 CSV, PDF 파일 로드 및 전처리
+
+대용량 파일은 iter_* 제너레이터로 레코드/페이지 단위로 읽어 메모리 사용량을 일정하게 유지
 """
 
 import pandas as pd
-from typing import List, Dict
-from PyPDF2 import PdfReader
+from typing import Dict, Iterable, Iterator, List, Union
+from pypdf import PdfReader
+
+CSV_CHUNK_SIZE = 10_000
+
+
+def iter_csv_records(file_path: str, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[Dict[str, str]]:
+    """
+    CSV 파일을 청크 단위로 읽어 질문-답변 레코드를 하나씩 반환
+
+    Args:
+        file_path: CSV 파일 경로
+        chunksize: 한 번에 읽을 행 수
+
+    Yields:
+        질문-답변 딕셔너리
+    """
+    reader = pd.read_csv(file_path, chunksize=chunksize, dtype=str, keep_default_na=False)
+
+    for chunk in reader:
+        # 행 단위 iterrows 대신 컬럼 단위로 꺼내서 zip
+        n = len(chunk)
+        questions = chunk["question"].tolist() if "question" in chunk else [""] * n
+        answers = chunk["answer"].tolist() if "answer" in chunk else [""] * n
+        categories = chunk["category"].tolist() if "category" in chunk else ["general"] * n
+
+        for question, answer, category in zip(questions, answers, categories):
+            yield {
+                "question": question,
+                "answer": answer,
+                "category": category
+            }
 
 
 def load_csv_data(file_path: str) -> List[Dict[str, str]]:
@@ -18,17 +50,26 @@ def load_csv_data(file_path: str) -> List[Dict[str, str]]:
     Returns:
         질문-답변 딕셔너리 리스트
     """
-    df = pd.read_csv(file_path)
+    return list(iter_csv_records(file_path))
+
+
+def iter_pdf_pages(file_path: str) -> Iterator[Dict[str, Union[int, str]]]:
+    """
+    PDF 파일을 페이지 단위로 읽어 텍스트 반환
 
-    data = []
-    for _, row in df.iterrows():
-        data.append({
-            "question": row.get("question", ""),
-            "answer": row.get("answer", ""),
-            "category": row.get("category", "general")
-        })
+    Args:
+        file_path: PDF 파일 경로
+
+    Yields:
+        {"page": 페이지 번호(1부터), "text": 페이지 텍스트} 딕셔너리
+    """
+    reader = PdfReader(file_path)
 
-    return data
+    for page_number, page in enumerate(reader.pages, start=1):
+        yield {
+            "page": page_number,
+            "text": page.extract_text() or ""
+        }
 
 
 def load_pdf_data(file_path: str) -> str:
@@ -41,29 +82,31 @@ def load_pdf_data(file_path: str) -> str:
     Returns:
         추출된 텍스트
     """
-    reader = PdfReader(file_path)
-    text = ""
+    return "".join(f"{page['text']}\n" for page in iter_pdf_pages(file_path))
 
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
 
-    return text
+def iter_prepared_documents(data: Iterable[Dict[str, str]]) -> Iterator[str]:
+    """
+    질문-답변 레코드를 문서 텍스트로 하나씩 변환
 
+    Args:
+        data: 질문-답변 레코드 (리스트 또는 iter_csv_records 제너레이터)
 
-def prepare_documents(data: List[Dict[str, str]]) -> List[str]:
+    Yields:
+        문서 텍스트
+    """
+    for item in data:
+        yield f"질문: {item['question']}\n답변: {item['answer']}"
+
+
+def prepare_documents(data: Iterable[Dict[str, str]]) -> List[str]:
     """
     문서 리스트 준비
 
     Args:
-        data: 질문-답변 데이터
+        data: 질문-답변 데이터 (리스트 또는 iter_csv_records 제너레이터)
 
     Returns:
         문서 텍스트 리스트
     """
-    documents = []
-
-    for item in data:
-        doc_text = f"질문: {item['question']}\n답변: {item['answer']}"
-        documents.append(doc_text)
-
-    return documents
+    return list(iter_prepared_documents(data))
@@ -0,0 +1,92 @@
+"""
+임베딩 백엔드 팩토리
+같은 sentence-transformers 모델을 PyTorch(fp32) 또는 ONNX Runtime(fp32 / int8 동적 양자화)으로 실행
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from langchain_community.embeddings import HuggingFaceEmbeddings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+# ONNX 변환 결과 저장 경로 (모델별 하위 디렉터리, 최초 1회만 변환)
+EMBEDDING_ONNX_DIR = os.getenv(
+    "EMBEDDING_ONNX_DIR",
+    str(Path(__file__).parent.parent / "data" / "models" / "onnx")
+)
+# int8 양자화 대상 CPU 명령어 집합: arm64 | avx2 | avx512 | avx512_vnni
+EMBEDDING_QUANTIZATION = os.getenv("EMBEDDING_QUANTIZATION", "avx2")
+
+
+def export_onnx_model(model_name: str, output_dir: str = EMBEDDING_ONNX_DIR,
+                      quantization: Optional[str] = None) -> Path:
+    """모델을 ONNX로 변환해 로컬에 저장 (이미 있으면 재사용)
+
+    Args:
+        model_name: sentence-transformers 모델 이름
+        output_dir: 변환 결과 상위 디렉터리
+        quantization: int8 동적 양자화 설정 (None이면 fp32만)
+
+    Returns:
+        변환된 로컬 모델 디렉터리
+    """
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    target = Path(output_dir) / model_name.split("/")[-1]
+
+    if not (target / "modules.json").exists():
+        logger.info(f"Exporting {model_name} to ONNX: {target}")
+        SentenceTransformer(model_name, device="cpu", backend="onnx").save(str(target))
+
+    if quantization and not (target / "onnx" / f"model_qint8_{quantization}.onnx").exists():
+        logger.info(f"Quantizing ONNX model to int8 ({quantization})")
+        model = SentenceTransformer(str(target), device="cpu", backend="onnx")
+        export_dynamic_quantized_onnx_model(model, quantization, str(target))
+
+    return target
+
+
+def create_embeddings(model_name: str, backend: Optional[str] = None) -> HuggingFaceEmbeddings:
+    """설정된 백엔드로 임베딩 모델 생성 (정규화 벡터, CPU)
+
+    ONNX 변환/양자화에 실패하면 PyTorch 백엔드로 대체한다.
+
+    Args:
+        model_name: sentence-transformers 모델 이름
+        backend: torch | onnx | onnx-int8 (없으면 EMBEDDING_BACKEND)
+
+    Returns:
+        HuggingFaceEmbeddings 인스턴스
+    """
+    backend = backend or EMBEDDING_BACKEND
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드입니다: {backend}")
+
+    model_kwargs = {"device": "cpu"}
+    model_path = model_name
+
+    if backend != "torch":
+        quantization = EMBEDDING_QUANTIZATION if backend == "onnx-int8" else None
+        try:
+            model_path = str(export_onnx_model(model_name, quantization=quantization))
+            model_kwargs["backend"] = "onnx"
+            if quantization:
+                model_kwargs["model_kwargs"] = {"file_name": f"onnx/model_qint8_{quantization}.onnx"}
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX export failed, falling back to torch backend: {e}")
+            backend = "torch"
+            model_path = model_name
+
+    embeddings = HuggingFaceEmbeddings(
+        model_name=model_path,
+        model_kwargs=model_kwargs,
+        encode_kwargs={"normalize_embeddings": True}
+    )
+    logger.info(f"Embedding backend: {backend} ({model_path})")
+    return embeddings
@@ -0,0 +1,123 @@
+"""
+마이크로 배치 임베딩 스케줄러
+동시에 들어온 질의들을 수 ms 동안 모아 한 번의 encode 호출로 처리
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatchEmbeddings(Embeddings):
+    """질의 임베딩 마이크로 배처
+
+    백그라운드 스레드가 대기 중인 질의를 최대 max_wait_ms 또는 max_batch_size개까지 모아
+    embed_documents 한 번으로 인코딩하고, 각 호출자의 Future를 완료시킨다.
+    sync(embed_query)와 async(aembed_query) 호출자가 같은 배치를 공유한다.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_batch_size: int = 32, max_wait_ms: float = 3.0):
+        """
+        Args:
+            embeddings: 실제 임베딩 모델
+            max_batch_size: 배치당 최대 질의 수
+            max_wait_ms: 첫 질의 도착 후 배치를 모으는 최대 대기 시간 (ms)
+        """
+        self.embeddings = embeddings
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="embedding-batcher",
+            daemon=True
+        )
+        self._worker.start()
+
+    def _collect(self) -> List[Tuple[str, Future]]:
+        """첫 질의를 기다린 뒤 대기 시간/개수 한도까지 배치 수집"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            texts = [text for text, _ in batch]
+
+            try:
+                vectors = self.embeddings.embed_documents(texts)
+            except Exception as e:
+                logger.error(f"배치 임베딩 실패 ({len(texts)}개): {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.items += len(batch)
+
+    def submit(self, text: str) -> Future:
+        """질의를 배치 대기열에 추가
+
+        Args:
+            text: 질의 텍스트
+
+        Returns:
+            임베딩 벡터로 완료되는 Future
+        """
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def embed_query(self, text: str) -> List[float]:
+        """질의 임베딩 (배치 완료까지 블로킹)"""
+        return self.submit(text).result()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """질의 임베딩 (async, 이벤트 루프 비블로킹)"""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (이미 배치이므로 그대로 위임)"""
+        return self.embeddings.embed_documents(texts)
+
+    def get_stats(self) -> Dict[str, float]:
+        """배치 통계 반환
+
+        Returns:
+            배치 수, 처리 질의 수, 평균 배치 크기
+        """
+        with self._stats_lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+                "pending": self._queue.qsize()
+            }
@@ -0,0 +1,160 @@
+"""
+질의 임베딩 LRU 캐시
+HuggingFaceEmbeddings 등 임의의 Embeddings를 감싸 반복 질의의 재인코딩 방지
+"""
+
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFKC + 공백 정리)
+
+    distiluse-base-multilingual-cased-v2는 대소문자를 구분하므로
+    임베딩 결과가 바뀌지 않는 범위에서만 정규화한다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class CachedEmbeddings(Embeddings):
+    """스레드 안전한 질의 임베딩 LRU 캐시
+
+    벡터는 (max_entries, dim) 크기의 float32 행렬 한 개에 슬롯 단위로 저장한다.
+    문서 임베딩(embed_documents)은 인제스트 전용이므로 캐시하지 않고 그대로 위임한다.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, max_entries: int = 2048):
+        """
+        Args:
+            embeddings: 실제 임베딩 모델
+            model_name: 모델 이름 (캐시 키에 포함)
+            max_entries: 최대 캐시 항목 수
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._free_slots: List[int] = []
+
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        return f"{self.model_name}\x00{normalize_text(text)}"
+
+    def _insert(self, key: str, vector: List[float]) -> None:
+        """벡터를 슬롯에 저장 (lock 보유 상태에서 호출)"""
+        if key in self._slots:
+            self._slots.move_to_end(key)
+            return
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self.max_entries, len(vector)), dtype=np.float32)
+            self._free_slots = list(range(self.max_entries - 1, -1, -1))
+
+        if not self._free_slots:
+            _, slot = self._slots.popitem(last=False)
+            self._free_slots.append(slot)
+
+        slot = self._free_slots.pop()
+        self._matrix[slot] = vector
+        self._slots[key] = slot
+
+    def _lookup(self, key: str) -> Optional[List[float]]:
+        """캐시 조회 및 히트/미스 집계"""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                self.misses += 1
+                return None
+            self._slots.move_to_end(key)
+            self.hits += 1
+            return self._matrix[slot].tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """질의 임베딩 (캐시 우선)
+
+        Args:
+            text: 질의 텍스트
+
+        Returns:
+            임베딩 벡터
+        """
+        key = self._key(text)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        # 인코딩은 lock 밖에서 수행 (동시 질의 블로킹 방지)
+        vector = self.embeddings.embed_query(text)
+
+        with self._lock:
+            self._insert(key, vector)
+
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """질의 임베딩 (async, 캐시 우선)
+
+        Args:
+            text: 질의 텍스트
+
+        Returns:
+            임베딩 벡터
+        """
+        key = self._key(text)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        vector = await self.embeddings.aembed_query(text)
+
+        with self._lock:
+            self._insert(key, vector)
+
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시 미사용)"""
+        return self.embeddings.embed_documents(texts)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._slots.clear()
+            self._matrix = None
+            self._free_slots = []
+
+    def get_stats(self) -> Dict[str, float]:
+        """캐시 통계 반환
+
+        Returns:
+            히트율, 항목 수, 점유 바이트 등 통계 딕셔너리
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._slots),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "bytes": self._matrix.nbytes if self._matrix is not None else 0
+            }
@@ -0,0 +1,143 @@
+"""
+FAQ 빠른 경로
+company_qa.csv의 질문과 거의 같은 질의는 검색/reranking/LLM 없이 큐레이션된 답변을 바로 반환
+(정규화 문자열 완전 일치 → 질문 임베딩 코사인 유사도 순으로 확인)
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from utils.answer_cache import normalize_question
+from utils.data_loader import iter_csv_records
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FAQMatch:
+    """FAQ 매칭 결과"""
+
+    question: str
+    answer: str
+    score: float
+    kind: str  # "exact" | "semantic"
+
+
+class FAQIndex:
+    """정규화 질문 사전 + 질문 임베딩 행렬로 구성된 FAQ 인덱스
+
+    임베딩은 정규화되어 있다고 가정하므로 내적이 곧 코사인 유사도다.
+    질의 임베딩은 공유 임베딩 캐시를 거치므로 FAQ에 걸리지 않은 질의도
+    이후 검색 단계에서 같은 벡터를 재사용한다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        questions: List[str],
+        answers: List[str],
+        threshold: float = 0.93
+    ):
+        """
+        Args:
+            embeddings: 질문 임베딩 모델 (검색과 같은 모델)
+            questions: FAQ 질문 리스트
+            answers: FAQ 답변 리스트 (questions와 같은 순서)
+            threshold: 의미 매칭 최소 코사인 유사도
+        """
+        self.embeddings = embeddings
+        self.questions = questions
+        self.answers = answers
+        self.threshold = threshold
+
+        # 정규화 질문 → 행 번호 (중복 질문은 첫 행 우선)
+        self._exact: Dict[str, int] = {}
+        for i, question in enumerate(questions):
+            self._exact.setdefault(normalize_question(question), i)
+
+        if questions:
+            self.matrix = np.ascontiguousarray(
+                np.asarray(embeddings.embed_documents(questions), dtype=np.float32)
+            )
+        else:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.exact_hits = 0
+        self.semantic_hits = 0
+
+    @classmethod
+    def from_csv(cls, path: str, embeddings: Embeddings, threshold: float = 0.93) -> "FAQIndex":
+        """question/answer 컬럼이 있는 CSV로 인덱스 생성
+
+        Args:
+            path: CSV 경로
+            embeddings: 질문 임베딩 모델
+            threshold: 의미 매칭 최소 코사인 유사도
+
+        Returns:
+            FAQIndex 인스턴스
+        """
+        questions, answers = [], []
+        for record in iter_csv_records(path):
+            if record["question"].strip() and record["answer"].strip():
+                questions.append(record["question"])
+                answers.append(record["answer"])
+
+        index = cls(embeddings, questions, answers, threshold)
+        logger.info(f"FAQ index loaded: {len(questions)} questions (threshold {threshold})")
+        return index
+
+    def match(self, question: str, semantic: bool = True) -> Optional[FAQMatch]:
+        """FAQ 질문과 매칭
+
+        Args:
+            question: 사용자 질문
+            semantic: False면 정규화 완전 일치만 허용 (대화 중 후속 질문 등)
+
+        Returns:
+            FAQMatch 또는 None (임계치 미만)
+        """
+        with self._lock:
+            self.lookups += 1
+
+        row = self._exact.get(normalize_question(question))
+        if row is not None:
+            with self._lock:
+                self.exact_hits += 1
+            return FAQMatch(self.questions[row], self.answers[row], 1.0, "exact")
+
+        if not semantic or len(self.questions) == 0:
+            return None
+
+        vector = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+        scores = self.matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        with self._lock:
+            self.semantic_hits += 1
+        return FAQMatch(self.questions[best], self.answers[best], float(scores[best]), "semantic")
+
+    def get_stats(self) -> Dict[str, float]:
+        """FAQ 빠른 경로 통계 반환
+
+        Returns:
+            조회 수, 완전/의미 일치 수, 전체 질의 중 FAQ로 응답한 비율(served_ratio)
+        """
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            return {
+                "entries": len(self.questions),
+                "lookups": self.lookups,
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "served_ratio": hits / self.lookups if self.lookups else 0.0
+            }
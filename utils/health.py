@@ -1,94 +1,200 @@
 """
-헬스 체크 엔드포인트
-시스템 상태 모니터링
+헬스 체크
+실제 사용 중인 컴포넌트(Groq API, ChromaDB 컬렉션, 임베딩 모델, reranker)를 동시에 점검하고
+결과를 짧은 TTL 동안 캐시해 자주 폴링해도 비용이 거의 없도록 함
 """
 
+import asyncio
 import logging
-import requests
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from utils.embedding_backend import EMBEDDING_BACKEND
+from utils.llm_client import GROQ_API_BASE, GROQ_API_KEY, get_http_client
+from utils.metrics import get_metrics
+from utils.pipeline_registry import VECTORSTORE_PATH
+from utils.rag_pipeline import get_loaded_vectorstore, is_embeddings_loaded
+from utils.reranker import get_reranker
+from utils.warmup import get_warmup_state
 
 logger = logging.getLogger(__name__)
 
-OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "10"))  # 결과 캐시 시간 (초)
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "3"))  # 점검별 제한 시간 (초)
+
+# 점검 결과: (정상 여부, 메시지)
+CheckResult = Tuple[bool, str]
+
+# 이 컴포넌트가 모두 실패하면 unhealthy, 하나라도 실패하면 degraded
+CRITICAL_CHECKS = ("groq", "vectorstore")
+
+_check_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-check")
 
+_cache_lock = threading.Lock()
+_cached_status: Optional[Dict] = None
+_cached_at = 0.0
 
-def check_ollama() -> tuple[bool, str]:
-    """Ollama 서버 연결 확인
+
+def check_groq() -> CheckResult:
+    """Groq API 연결 + 인증 확인 (모델 목록 조회, LLM과 같은 keep-alive 커넥션 풀 사용)
 
     Returns:
         (정상 여부, 메시지) 튜플
     """
+    if not GROQ_API_KEY:
+        return False, "GROQ_API_KEY not set"
+
     try:
-        response = requests.get(
-            f"{OLLAMA_BASE_URL}/api/tags",
-            timeout=5
+        start = time.perf_counter()
+        response = get_http_client().get(
+            f"{GROQ_API_BASE.rstrip('/')}/openai/v1/models",
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            timeout=HEALTH_CHECK_TIMEOUT
         )
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
         if response.status_code == 200:
-            models = response.json().get("models", [])
-            return True, f"Ollama OK ({len(models)} models)"
-        else:
-            return False, f"Ollama HTTP {response.status_code}"
-
-    except requests.exceptions.Timeout:
-        return False, "Ollama timeout"
-    except requests.exceptions.ConnectionError:
-        return False, "Ollama connection refused"
+            return True, f"Groq OK ({elapsed_ms:.0f}ms)"
+        return False, f"Groq HTTP {response.status_code}"
+
+    except httpx.TimeoutException:
+        return False, "Groq timeout"
+    except httpx.TransportError:
+        return False, "Groq connection failed"
     except Exception as e:
-        return False, f"Ollama error: {str(e)}"
+        return False, f"Groq error: {str(e)}"
 
 
-def check_vectorstore() -> tuple[bool, str]:
-    """벡터 스토어 존재 확인
+def check_vectorstore() -> CheckResult:
+    """ChromaDB 컬렉션 문서 수 확인 (로드 전이면 DB 파일만 확인)
 
     Returns:
         (정상 여부, 메시지) 튜플
     """
     try:
-        vectorstore_path = Path("data/vectorstore")
-
-        if not vectorstore_path.exists():
-            return False, "Vectorstore not found"
-
-        # chroma.sqlite3 파일 확인
-        db_file = vectorstore_path / "chroma.sqlite3"
+        vectorstore = get_loaded_vectorstore(VECTORSTORE_PATH)
+        if vectorstore is not None:
+            count = vectorstore._collection.count()
+            if count == 0:
+                return False, "Vectorstore collection empty"
+            return True, f"Vectorstore OK ({count} chunks)"
+
+        db_file = Path(VECTORSTORE_PATH) / "chroma.sqlite3"
         if not db_file.exists():
             return False, "Vectorstore DB missing"
-
-        # 파일 크기 확인
         size_mb = db_file.stat().st_size / (1024 * 1024)
-        return True, f"Vectorstore OK ({size_mb:.1f}MB)"
+        return True, f"Vectorstore not loaded yet ({size_mb:.1f}MB on disk)"
 
     except Exception as e:
         return False, f"Vectorstore error: {str(e)}"
 
 
-def get_health_status() -> dict:
-    """전체 시스템 헬스 체크
+def check_embeddings() -> CheckResult:
+    """임베딩 모델 로드 상태 (워밍업 중이면 정상으로 간주)
+
+    Returns:
+        (정상 여부, 메시지) 튜플
+    """
+    if is_embeddings_loaded():
+        return True, f"Embeddings loaded ({EMBEDDING_BACKEND})"
+
+    warmup = get_warmup_state()
+    if warmup is not None and not warmup.ready.is_set():
+        return True, "Embeddings loading (warm-up in progress)"
+    return False, "Embeddings not loaded"
+
+
+def check_reranker() -> CheckResult:
+    """Reranker 로드 상태 (지연 로딩이므로 미로드도 정상)
 
     Returns:
-        헬스 상태 딕셔너리
+        (정상 여부, 메시지) 튜플
     """
-    ollama_ok, ollama_msg = check_ollama()
-    vectorstore_ok, vectorstore_msg = check_vectorstore()
-
-    overall_status = "healthy" if (ollama_ok and vectorstore_ok) else "degraded"
-
-    if not ollama_ok and not vectorstore_ok:
-        overall_status = "unhealthy"
-
-    return {
-        "status": overall_status,
-        "components": {
-            "ollama": {
-                "status": "healthy" if ollama_ok else "unhealthy",
-                "message": ollama_msg
-            },
-            "vectorstore": {
-                "status": "healthy" if vectorstore_ok else "unhealthy",
-                "message": vectorstore_msg
+    stats = get_reranker().get_stats()
+    state = "loaded" if stats["loaded"] else "idle (loads on first rerank)"
+    return True, f"Reranker {stats['model']} {state}"
+
+
+CHECKS: Dict[str, Callable[[], CheckResult]] = {
+    "groq": check_groq,
+    "vectorstore": check_vectorstore,
+    "embeddings": check_embeddings,
+    "reranker": check_reranker
+}
+
+
+def _run_checks() -> Dict[str, Dict[str, str]]:
+    """모든 점검을 동시에 실행 (점검별 제한 시간 초과 시 unhealthy)"""
+    futures = {name: _check_executor.submit(check) for name, check in CHECKS.items()}
+    deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+
+    components = {}
+    for name, future in futures.items():
+        try:
+            ok, message = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            ok, message = False, f"check timed out after {HEALTH_CHECK_TIMEOUT:g}s"
+        except Exception as e:
+            ok, message = False, f"check failed: {str(e)}"
+        components[name] = {
+            "status": "healthy" if ok else "unhealthy",
+            "message": message
+        }
+    return components
+
+
+def get_health_status(max_age: Optional[float] = None) -> dict:
+    """전체 시스템 헬스 체크 (TTL 캐시, 동시 호출은 한 번의 점검 결과를 공유)
+
+    Args:
+        max_age: 허용할 캐시 나이 (초, 없으면 HEALTH_CACHE_TTL, 0이면 강제 재점검)
+
+    Returns:
+        헬스 상태 딕셔너리 (단계별 지연시간 p50/p95/p99 + 요청 카운터 포함)
+    """
+    global _cached_status, _cached_at
+
+    max_age = HEALTH_CACHE_TTL if max_age is None else max_age
+
+    with _cache_lock:
+        age = time.monotonic() - _cached_at
+        if _cached_status is None or age > max_age:
+            components = _run_checks()
+            failed = [name for name in CRITICAL_CHECKS if components[name]["status"] != "healthy"]
+            degraded = any(c["status"] != "healthy" for c in components.values())
+
+            if len(failed) == len(CRITICAL_CHECKS):
+                overall_status = "unhealthy"
+            elif degraded:
+                overall_status = "degraded"
+            else:
+                overall_status = "healthy"
+
+            warmup = get_warmup_state()
+            _cached_status = {
+                "status": overall_status,
+                "components": components,
+                "warmup": warmup.to_dict() if warmup is not None else None,
+                "version": "1.0.0"
             }
-        },
-        "version": "1.0.0"
-    }
+            _cached_at = time.monotonic()
+            age = 0.0
+
+        status = dict(_cached_status)
+
+    # 지연시간 통계는 캐시하지 않음 (메모리 내 집계라 비용이 작음)
+    status["checked_seconds_ago"] = round(age, 1)
+    status["latency"] = get_metrics().get_summary()
+    return status
+
+
+async def aget_health_status(max_age: Optional[float] = None) -> dict:
+    """get_health_status의 async 버전 (이벤트 루프를 막지 않음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_health_status, max_age)
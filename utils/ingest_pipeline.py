@@ -0,0 +1,416 @@
+"""
+멀티 포맷 인제스트 파이프라인
+CSV / TXT / Markdown / PDF → 분할 → 임베딩 → Chroma upsert
+
+각 단계는 별도 스레드에서 실행되고 크기 제한 큐로 연결되어
+로딩, 분할, 임베딩, 저장이 순차가 아니라 겹쳐서 진행된다.
+"""
+
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from utils.batch_embedder import create_worker_pool, peak_rss_mb, submit_batch
+from utils.data_loader import iter_csv_records, iter_pdf_pages
+
+logger = logging.getLogger(__name__)
+
+_SENTINEL = object()
+
+DocumentLoader = Callable[[Path], Iterator[Document]]
+
+
+# ---------------------------------------------------------------------------
+# 로더 (확장자별, register_loader로 추가 가능)
+# ---------------------------------------------------------------------------
+
+def _load_csv(path: Path) -> Iterator[Document]:
+    for row, record in enumerate(iter_csv_records(str(path))):
+        question_line = f"질문: {record['question']}"
+        yield Document(
+            page_content=f"{question_line}\n답변: {record['answer']}",
+            metadata={
+                "source": path.name,
+                "row": row,
+                "category": record["category"],
+                "doc_key": question_line
+            }
+        )
+
+
+def _load_text(path: Path) -> Iterator[Document]:
+    yield Document(
+        page_content=path.read_text(encoding="utf-8"),
+        metadata={"source": path.name, "doc_key": path.name}
+    )
+
+
+def _load_pdf(path: Path) -> Iterator[Document]:
+    for page in iter_pdf_pages(str(path)):
+        if not page["text"].strip():
+            continue
+        yield Document(
+            page_content=page["text"],
+            metadata={
+                "source": path.name,
+                "page": page["page"],
+                "doc_key": f"{path.name}#page{page['page']}"
+            }
+        )
+
+
+LOADERS: Dict[str, DocumentLoader] = {
+    ".csv": _load_csv,
+    ".txt": _load_text,
+    ".md": _load_text,
+    ".pdf": _load_pdf,
+}
+
+
+def register_loader(extension: str, loader: DocumentLoader) -> None:
+    """확장자별 로더 등록
+
+    Args:
+        extension: 파일 확장자 (예: ".docx")
+        loader: Path를 받아 Document를 하나씩 반환하는 함수
+    """
+    LOADERS[extension.lower()] = loader
+
+
+def iter_source_files(sources: Iterable[Path]) -> Iterator[Path]:
+    """소스 경로(파일 또는 디렉토리)에서 지원 형식 파일 나열"""
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            for path in sorted(source.rglob("*")):
+                if path.is_file() and path.suffix.lower() in LOADERS:
+                    yield path
+        elif source.suffix.lower() in LOADERS:
+            yield source
+        else:
+            logger.warning(f"지원하지 않는 소스 건너뜀: {source}")
+
+
+# ---------------------------------------------------------------------------
+# ID / 해시
+# ---------------------------------------------------------------------------
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# 변경 감지에 쓰는 메타데이터 (row/page 같은 위치 정보는 앞에 행이 추가/삭제되면 바뀌므로 제외)
+HASHED_METADATA = ("source", "category")
+
+
+def content_hash(chunk: Document) -> str:
+    """청크 내용 + 안정적인 메타데이터 해시 (변경 감지용)"""
+    metadata = {k: chunk.metadata[k] for k in HASHED_METADATA if k in chunk.metadata}
+    return _sha256(chunk.page_content + json.dumps(metadata, sort_keys=True, ensure_ascii=False))
+
+
+# ---------------------------------------------------------------------------
+# 파이프라인
+# ---------------------------------------------------------------------------
+
+def _drain(q: "queue.Queue") -> None:
+    """오류 후 상류 단계가 put에서 막히지 않도록 종료 신호까지 큐 비우기"""
+    while q.get() is not _SENTINEL:
+        pass
+
+
+class _StageStats:
+    """단계별 처리량/시간 집계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.wait_s = 0.0
+        self.started = 0.0
+        self.finished = 0.0
+
+    def get(self, q: "queue.Queue"):
+        start = time.perf_counter()
+        item = q.get()
+        self.wait_s += time.perf_counter() - start
+        if item is not _SENTINEL:
+            self.items_in += 1
+        return item
+
+    def put(self, q: "queue.Queue", item, count: int = 1) -> None:
+        start = time.perf_counter()
+        q.put(item)
+        self.wait_s += time.perf_counter() - start
+        self.items_out += count
+
+    def to_dict(self) -> Dict[str, float]:
+        total = self.finished - self.started
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "total_s": round(total, 3),
+            "busy_s": round(max(0.0, total - self.wait_s), 3),
+            "wait_s": round(self.wait_s, 3),
+        }
+
+
+class IngestPipeline:
+    """스트리밍 인제스트 파이프라인
+
+    existing_metadata({ID: 저장된 메타데이터})를 주면 내용이 같은 청크는 임베딩하지 않고,
+    이번 실행에서 보지 못한 ID는 removed로 보고한다 (삭제는 호출자가 수행).
+    내용은 같지만 row/page 같은 위치 메타데이터만 바뀐 청크는 moved로 보고 메타데이터만 갱신한다.
+    """
+
+    def __init__(
+        self,
+        vectorstore,
+        embeddings: Optional[Embeddings] = None,
+        model_name: Optional[str] = None,
+        batch_size: int = 64,
+        workers: int = 1,
+        queue_size: int = 8,
+        text_splitter=None,
+        existing_hashes: Optional[Dict[str, str]] = None,
+        existing_metadata: Optional[Dict[str, Dict]] = None
+    ):
+        """
+        Args:
+            vectorstore: 대상 Chroma 벡터 스토어
+            embeddings: 단일 프로세스 모드 임베딩 모델
+            model_name: 멀티 프로세스 모드에서 워커가 로드할 모델 이름
+            batch_size: 임베딩 배치 크기
+            workers: 임베딩 프로세스 수 (1이면 임베딩 스레드에서 직접 실행)
+            queue_size: 단계 사이 큐 최대 크기 (배압)
+            text_splitter: 텍스트 분할기 (기본 500자 / 50자 overlap)
+            existing_hashes: 기존 컬렉션의 {ID: content_hash} (existing_metadata가 있으면 무시)
+            existing_metadata: 기존 컬렉션의 {ID: 메타데이터} (위치 메타데이터 갱신에 필요)
+        """
+        if workers <= 1 and embeddings is None:
+            raise ValueError("단일 프로세스 모드에는 embeddings가 필요합니다.")
+        if workers > 1 and model_name is None:
+            raise ValueError("멀티 프로세스 모드에는 model_name이 필요합니다.")
+
+        self.vectorstore = vectorstore
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.workers = workers
+        self.queue_size = queue_size
+        self.text_splitter = text_splitter or RecursiveCharacterTextSplitter(
+            chunk_size=500,
+            chunk_overlap=50,
+            length_function=len,
+        )
+        self.existing_metadata = existing_metadata or {}
+        if existing_metadata is not None:
+            existing_hashes = {
+                doc_id: (metadata or {}).get("content_hash", "")
+                for doc_id, metadata in existing_metadata.items()
+            }
+        self.existing_hashes = existing_hashes or {}
+
+        self.stats = {name: _StageStats(name) for name in ("load", "split", "embed", "upsert")}
+        self.diff: Dict[str, List[str]] = {
+            "added": [], "updated": [], "removed": [], "unchanged": [], "moved": []
+        }
+        self._moved: List[tuple] = []  # (ID, 새 메타데이터), unchanged 중 위치만 바뀐 청크
+        self._errors: List[BaseException] = []
+        self._pool = None
+
+    # 단계 1: 로딩
+    def _load_stage(self, sources: List[Path], out_q: "queue.Queue") -> None:
+        stats = self.stats["load"]
+        stats.started = time.perf_counter()
+        try:
+            for path in iter_source_files(sources):
+                logger.info(f"  로드: {path}")
+                for doc in LOADERS[path.suffix.lower()](path):
+                    stats.items_in += 1
+                    stats.put(out_q, doc)
+                    if self._errors:
+                        return
+        except BaseException as e:
+            self._errors.append(e)
+        finally:
+            out_q.put(_SENTINEL)
+            stats.finished = time.perf_counter()
+
+    # 단계 2: 분할 + ID 부여 + 변경 감지
+    def _split_stage(self, in_q: "queue.Queue", out_q: "queue.Queue") -> None:
+        stats = self.stats["split"]
+        stats.started = time.perf_counter()
+        seen_keys = set()
+        try:
+            while (doc := stats.get(in_q)) is not _SENTINEL:
+                if self._errors:
+                    continue  # 상류가 끝날 때까지 비우기만 함
+
+                # ID: 문서 키 해시 + 중복 순번 + 청크 번호 (내용이 바뀌어도 유지)
+                # doc_key가 없는 사용자 로더는 본문 자체를 키로 사용
+                doc_key = doc.metadata.pop("doc_key", None) or doc.page_content
+                row_key = _sha256(doc_key)[:16]
+                suffix = 0
+                while (row_key, suffix) in seen_keys:
+                    suffix += 1
+                seen_keys.add((row_key, suffix))
+
+                for i, chunk in enumerate(self.text_splitter.split_documents([doc])):
+                    chunk_id = f"{row_key}-{suffix}-{i}"
+                    chunk.metadata["content_hash"] = content_hash(chunk)
+
+                    stored = self.existing_hashes.get(chunk_id)
+                    if stored is None:
+                        self.diff["added"].append(chunk_id)
+                    elif stored != chunk.metadata["content_hash"]:
+                        self.diff["updated"].append(chunk_id)
+                    else:
+                        self.diff["unchanged"].append(chunk_id)
+                        # 해시에서 빠진 row/page 등이 바뀌었으면 재임베딩 없이 메타데이터만 갱신
+                        stored_metadata = self.existing_metadata.get(chunk_id)
+                        if stored_metadata is not None and stored_metadata != chunk.metadata:
+                            self.diff["moved"].append(chunk_id)
+                            self._moved.append((chunk_id, chunk.metadata))
+                        continue
+                    stats.put(out_q, (chunk_id, chunk))
+        except BaseException as e:
+            self._errors.append(e)
+            _drain(in_q)
+        finally:
+            out_q.put(_SENTINEL)
+            stats.finished = time.perf_counter()
+
+    # 단계 3: 배치 임베딩
+    def _embed_stage(self, in_q: "queue.Queue", out_q: "queue.Queue") -> None:
+        stats = self.stats["embed"]
+        stats.started = time.perf_counter()
+        pool = self._pool
+
+        def flush(batch):
+            texts = [chunk.page_content for _, chunk in batch]
+            if pool is not None:
+                # 워커 풀에 넘기고 바로 다음 배치 수집 (결과는 upsert 단계에서 대기)
+                result = submit_batch(pool, texts)
+            else:
+                result = self.embeddings.embed_documents(texts)
+            stats.put(out_q, (batch, result), count=len(batch))
+
+        done = False  # 종료 신호를 이미 읽었으면 마지막 배치 실패 시 비울 것이 없음
+        try:
+            batch = []
+            while (item := stats.get(in_q)) is not _SENTINEL:
+                if self._errors:
+                    continue
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    flush(batch)
+                    batch = []
+            done = True
+            if batch and not self._errors:
+                flush(batch)
+        except BaseException as e:
+            self._errors.append(e)
+            if not done:
+                _drain(in_q)
+        finally:
+            out_q.put(_SENTINEL)
+            stats.finished = time.perf_counter()
+
+    # 단계 4: Chroma upsert (호출 스레드에서 실행)
+    def _upsert_stage(self, in_q: "queue.Queue") -> None:
+        stats = self.stats["upsert"]
+        stats.started = time.perf_counter()
+        try:
+            while (item := stats.get(in_q)) is not _SENTINEL:
+                if self._errors:
+                    continue
+                batch, result = item
+                vectors = result if isinstance(result, list) else result.result()[1]
+                self.vectorstore._collection.upsert(
+                    ids=[chunk_id for chunk_id, _ in batch],
+                    embeddings=vectors,
+                    documents=[chunk.page_content for _, chunk in batch],
+                    metadatas=[chunk.metadata for _, chunk in batch]
+                )
+                stats.items_out += len(batch)
+        except BaseException as e:
+            self._errors.append(e)
+            _drain(in_q)
+        finally:
+            stats.finished = time.perf_counter()
+
+    def run(self, sources: List[Path]) -> Dict:
+        """파이프라인 실행
+
+        Args:
+            sources: 파일 또는 디렉토리 경로 목록
+
+        Returns:
+            단계별 시간, 변경 요약, 처리량을 담은 리포트 딕셔너리
+        """
+        docs_q: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        chunks_q: "queue.Queue" = queue.Queue(maxsize=self.queue_size * self.batch_size)
+        batches_q: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+
+        start = time.perf_counter()
+        if self.workers > 1:
+            self._pool = create_worker_pool(self.model_name, self.workers)
+
+        threads = [
+            threading.Thread(target=self._load_stage, args=(sources, docs_q), name="ingest-load"),
+            threading.Thread(target=self._split_stage, args=(docs_q, chunks_q), name="ingest-split"),
+            threading.Thread(target=self._embed_stage, args=(chunks_q, batches_q), name="ingest-embed"),
+        ]
+        for t in threads:
+            t.start()
+        self._upsert_stage(batches_q)
+        for t in threads:
+            t.join()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=bool(self._errors))
+            self._pool = None
+        wall = time.perf_counter() - start
+
+        if self._errors:
+            raise self._errors[0]
+
+        for i in range(0, len(self._moved), self.batch_size):
+            batch = self._moved[i:i + self.batch_size]
+            self.vectorstore._collection.update(
+                ids=[chunk_id for chunk_id, _ in batch],
+                metadatas=[metadata for _, metadata in batch]
+            )
+
+        seen = set(self.diff["added"]) | set(self.diff["updated"]) | set(self.diff["unchanged"])
+        self.diff["removed"] = [i for i in self.existing_hashes if i not in seen]
+
+        embedded = self.stats["upsert"].items_out
+        own_rss, worker_rss = peak_rss_mb()
+        return {
+            "sources": [str(s) for s in sources],
+            "batch_size": self.batch_size,
+            "workers": self.workers,
+            "wall_s": round(wall, 3),
+            "stages": {name: s.to_dict() for name, s in self.stats.items()},
+            "diff": {k: len(v) for k, v in self.diff.items()},
+            "docs_per_sec": round(embedded / wall, 2) if embedded else 0.0,
+            "peak_rss_mb": round(own_rss, 1),
+            "peak_worker_rss_mb": round(worker_rss, 1),
+        }
+
+
+def write_report(report: Dict, path: Path) -> None:
+    """리포트를 JSON 파일로 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -0,0 +1,244 @@
+"""
+BM25 어휘 인덱스 + Reciprocal Rank Fusion
+한국어는 조사가 붙어 어절 단위 매칭이 잘 안 되므로 어절별 문자 bigram(+ 3자 이상 어절 원형)으로
+색인한다. 인제스트 시 Chroma 컬렉션과 함께 저장하고, 검색 시 dense 결과와 RRF로 합친다.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+LEXICAL_INDEX_FILENAME = "lexical_index.json"
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """한국어용 어휘 토큰화 (어절별 문자 bigram + 3자 이상 어절 원형)
+
+    "퓨쳐시스템은"과 "퓨쳐시스템의"처럼 조사만 다른 어절도 bigram이 대부분 겹치고,
+    제품 코드/날짜 같은 어절은 원형 토큰으로 정확히 매칭된다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        토큰 리스트
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(word) == 1:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        if len(word) > 2:
+            tokens.append(word)
+    return tokens
+
+
+def collection_signature(ids: Sequence[str], metadatas: Sequence[Optional[Dict]]) -> str:
+    """컬렉션 내용 지문 (ID + content_hash), 인덱스가 컬렉션과 같은 상태인지 확인용
+
+    Args:
+        ids: 청크 ID 리스트
+        metadatas: 청크 메타데이터 리스트
+
+    Returns:
+        sha256 hex 문자열
+    """
+    pairs = sorted(
+        f"{doc_id}:{(metadata or {}).get('content_hash', '')}"
+        for doc_id, metadata in zip(ids, metadatas)
+    )
+    return hashlib.sha256("\n".join(pairs).encode("utf-8")).hexdigest()
+
+
+class BM25Index:
+    """인메모리 BM25 인덱스
+
+    용어별 포스팅(문서 인덱스, BM25 가중치)을 NumPy 배열로 미리 계산해 두므로
+    검색은 질의 용어별 배열 누적 한 번 + argpartition으로 끝난다.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        documents: List[Document],
+        term_freqs: List[Dict[str, int]],
+        signature: str = "",
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        Args:
+            ids: 청크 ID 리스트
+            documents: 청크 Document 리스트 (ids와 같은 순서)
+            term_freqs: 문서별 {토큰: 빈도}
+            signature: collection_signature 값
+            k1: BM25 용어 빈도 포화 계수
+            b: BM25 문서 길이 정규화 계수
+        """
+        self.ids = ids
+        self.documents = documents
+        self.term_freqs = term_freqs
+        self.signature = signature
+        self.k1 = k1
+        self.b = b
+
+        lengths = np.array([sum(tf.values()) for tf in term_freqs], dtype=np.float32)
+        avg_length = float(lengths.mean()) if len(lengths) else 0.0
+        norm = k1 * (1 - b + b * lengths / avg_length) if avg_length else np.full(len(lengths), k1)
+
+        postings: Dict[str, Tuple[List[int], List[int]]] = defaultdict(lambda: ([], []))
+        for doc_idx, tf in enumerate(term_freqs):
+            for term, freq in tf.items():
+                postings[term][0].append(doc_idx)
+                postings[term][1].append(freq)
+
+        n_docs = len(term_freqs)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term, (doc_idxs, freqs) in postings.items():
+            doc_idxs = np.array(doc_idxs, dtype=np.int32)
+            freqs = np.array(freqs, dtype=np.float32)
+            idf = math.log(1 + (n_docs - len(doc_idxs) + 0.5) / (len(doc_idxs) + 0.5))
+            weights = idf * freqs * (k1 + 1) / (freqs + norm[doc_idxs])
+            self._postings[term] = (doc_idxs, weights.astype(np.float32))
+
+    @classmethod
+    def build(
+        cls,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Optional[Dict]],
+        k1: float = 1.5,
+        b: float = 0.75
+    ) -> "BM25Index":
+        """청크 본문으로 인덱스 생성
+
+        Args:
+            ids: 청크 ID 리스트
+            texts: 청크 본문 리스트
+            metadatas: 청크 메타데이터 리스트
+            k1: BM25 k1
+            b: BM25 b
+
+        Returns:
+            BM25Index 인스턴스
+        """
+        documents = [
+            Document(page_content=text, metadata=metadata or {})
+            for text, metadata in zip(texts, metadatas)
+        ]
+        term_freqs = [dict(Counter(tokenize(text))) for text in texts]
+        return cls(ids, documents, term_freqs, collection_signature(ids, metadatas), k1, b)
+
+    @classmethod
+    def from_chroma(cls, vectorstore) -> "BM25Index":
+        """Chroma 컬렉션 전체로 인덱스 생성
+
+        Args:
+            vectorstore: Chroma 벡터 스토어
+
+        Returns:
+            BM25Index 인스턴스
+        """
+        data = vectorstore.get(include=["documents", "metadatas"])
+        return cls.build(data["ids"], data["documents"], data["metadatas"])
+
+    def save(self, path: Path) -> None:
+        """JSON 파일로 저장 (토큰화 결과 포함, 로드 시 재토큰화 없음)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "k1": self.k1,
+            "b": self.b,
+            "signature": self.signature,
+            "ids": self.ids,
+            "documents": [doc.page_content for doc in self.documents],
+            "metadatas": [doc.metadata for doc in self.documents],
+            "term_freqs": self.term_freqs,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        """save()로 저장한 인덱스 로드"""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        documents = [
+            Document(page_content=text, metadata=metadata or {})
+            for text, metadata in zip(payload["documents"], payload["metadatas"])
+        ]
+        return cls(
+            payload["ids"],
+            documents,
+            payload["term_freqs"],
+            payload.get("signature", ""),
+            payload.get("k1", 1.5),
+            payload.get("b", 0.75)
+        )
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[Document, float]]:
+        """BM25 top-k 검색
+
+        Args:
+            query: 질의
+            k: 검색 개수
+
+        Returns:
+            (문서, BM25 점수) 튜플 리스트 (점수 내림차순, 점수 0인 문서 제외)
+        """
+        if not self.documents:
+            return []
+
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if posting is not None:
+                # 포스팅 안의 문서 인덱스는 중복이 없으므로 팬시 인덱싱 누적으로 충분
+                scores[posting[0]] += posting[1]
+
+        k = min(k, int(np.count_nonzero(scores)))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.documents[i], float(scores[i])) for i in top]
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None
+) -> List[Tuple[Hashable, float]]:
+    """여러 순위 리스트를 RRF 점수(sum w / (k + rank))로 합침
+
+    Args:
+        rankings: 순위순 키 리스트들
+        k: RRF 상수 (클수록 하위 순위 영향이 커짐)
+        weights: 리스트별 가중치 (기본 모두 1)
+
+    Returns:
+        (키, RRF 점수) 튜플 리스트 (점수 내림차순)
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[Hashable, float] = defaultdict(float)
+    for ranking, weight in zip(rankings, weights):
+        for rank, key in enumerate(ranking, 1):
+            scores[key] += weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,273 @@
+"""
+Groq LLM 클라이언트
+- 모든 파이프라인이 공유하는 keep-alive HTTP 커넥션 풀 (세션/설정 변경마다 TLS 핸드셰이크 반복 방지)
+- single-flight 병합: 같은 프롬프트가 동시에 들어오면 상위 호출 1번의 스트리밍 토큰을 모든 대기자에게 전달
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import agenerate_from_stream, generate_from_stream
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_groq import ChatGroq
+
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Groq SDK와 같은 규칙의 호스트 주소 (로컬 stub 서버 테스트 시 http://127.0.0.1:8900 등)
+GROQ_API_BASE = os.getenv("GROQ_API_BASE") or os.getenv("GROQ_BASE_URL") or "https://api.groq.com"
+GROQ_TIMEOUT = float(os.getenv("GROQ_TIMEOUT", "30"))
+GROQ_MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "20"))
+GROQ_MAX_KEEPALIVE = int(os.getenv("GROQ_MAX_KEEPALIVE", "10"))
+GROQ_KEEPALIVE_EXPIRY = float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "60"))
+LLM_COALESCING = os.getenv("LLM_COALESCING", "true").lower() == "true"
+
+_client_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+# 진행 중인 상위 호출 (파이프라인/세션 간 공유, 키 → _Flight)
+_flight_lock = threading.Lock()
+_sync_flights: Dict[str, "_Flight"] = {}
+_async_flights: Dict[str, "_Flight"] = {}
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=GROQ_MAX_CONNECTIONS,
+        max_keepalive_connections=GROQ_MAX_KEEPALIVE,
+        keepalive_expiry=GROQ_KEEPALIVE_EXPIRY
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 전역 sync HTTP 클라이언트 (keep-alive 커넥션 풀)"""
+    global _http_client
+
+    with _client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(limits=_limits(), timeout=GROQ_TIMEOUT)
+            logger.info(f"Shared HTTP client created (max {GROQ_MAX_CONNECTIONS} connections)")
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """프로세스 전역 async HTTP 클라이언트 (keep-alive 커넥션 풀)
+
+    커넥션이 이벤트 루프에 묶이므로 앱의 단일 이벤트 루프에서만 사용한다.
+    """
+    global _async_http_client
+
+    with _client_lock:
+        if _async_http_client is None:
+            _async_http_client = httpx.AsyncClient(limits=_limits(), timeout=GROQ_TIMEOUT)
+    return _async_http_client
+
+
+class _Flight:
+    """진행 중인 상위 호출 1건 (받은 청크를 순서대로 보관, 늦게 합류한 대기자도 처음부터 재생)"""
+
+    def __init__(self, cond):
+        self.cond = cond  # threading.Condition (sync) | asyncio.Condition (async)
+        self.chunks: List[ChatGenerationChunk] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.waiters = 1
+        self.task: Optional[asyncio.Task] = None
+
+
+class CoalescingChatModel(BaseChatModel):
+    """같은 입력의 동시 호출을 상위 호출 1번으로 합치는 채팅 모델 래퍼 (single-flight)
+
+    키는 모델 설정 + 메시지 + stop + 호출 인자이며, 진행 중인 호출 목록은 프로세스 전역이라
+    세션마다 만든 파이프라인끼리도 합쳐진다. 합쳐진 호출은 같은 답변을 받는다.
+    청크 객체는 공유하지 않고 대기자마다 복사해서 넘긴다.
+    상위 호출은 별도 스레드/태스크에서 끝까지 진행되므로 대기자 하나가 중간에 끊겨도 나머지는 영향 없다.
+    """
+
+    inner: BaseChatModel
+
+    @property
+    def _llm_type(self) -> str:
+        return f"coalescing-{self.inner._llm_type}"
+
+    def _key(self, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict) -> str:
+        payload = json.dumps(
+            [self.inner._llm_type, self.inner._identifying_params]
+            + [[m.type, m.content] for m in messages]
+            + [stop, sorted(kwargs.items())],
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _join(self, flights: Dict[str, _Flight], key: str, make_cond):
+        """진행 중인 호출에 합류하거나 새로 시작
+
+        Returns:
+            (flight, 새로 시작했는지) 튜플
+        """
+        with _flight_lock:
+            flight = flights.get(key)
+            if flight is not None and not flight.done:
+                flight.waiters += 1
+                get_metrics().increment("llm_calls_total", kind="coalesced")
+                return flight, False
+            flight = _Flight(make_cond())
+            flights[key] = flight
+            get_metrics().increment("llm_calls_total", kind="upstream")
+            return flight, True
+
+    def _finish(self, flights: Dict[str, _Flight], key: str, flight: _Flight) -> None:
+        with _flight_lock:
+            flight.done = True
+            if flights.get(key) is flight:
+                del flights[key]
+        if flight.waiters > 1:
+            logger.info(f"LLM call shared by {flight.waiters} requests")
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        key = self._key(messages, stop, kwargs)
+        flight, leader = self._join(_sync_flights, key, threading.Condition)
+
+        if leader:
+            def pump():
+                try:
+                    for chunk in self.inner._stream(messages, stop=stop, **kwargs):
+                        with flight.cond:
+                            flight.chunks.append(chunk)
+                            flight.cond.notify_all()
+                except BaseException as e:
+                    flight.error = e
+                finally:
+                    with flight.cond:
+                        self._finish(_sync_flights, key, flight)
+                        flight.cond.notify_all()
+
+            threading.Thread(target=pump, name="llm-flight", daemon=True).start()
+
+        i = 0
+        while True:
+            with flight.cond:
+                flight.cond.wait_for(lambda: len(flight.chunks) > i or flight.done)
+                pending = flight.chunks[i:]
+                finished = flight.done
+            for chunk in pending:
+                # LangChain이 yield된 청크의 message(id 등)를 호출마다 고치므로 대기자별 복사본을 넘김
+                yield chunk.model_copy(deep=True)
+            i += len(pending)
+            if finished and i >= len(flight.chunks):
+                break
+
+        if flight.error is not None:
+            raise flight.error
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop=stop, **kwargs))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        key = self._key(messages, stop, kwargs)
+        flight, leader = self._join(_async_flights, key, asyncio.Condition)
+
+        if leader:
+            async def pump():
+                try:
+                    async for chunk in self.inner._astream(messages, stop=stop, **kwargs):
+                        async with flight.cond:
+                            flight.chunks.append(chunk)
+                            flight.cond.notify_all()
+                except BaseException as e:
+                    flight.error = e
+                finally:
+                    async with flight.cond:
+                        self._finish(_async_flights, key, flight)
+                        flight.cond.notify_all()
+
+            flight.task = asyncio.create_task(pump())
+
+        i = 0
+        while True:
+            async with flight.cond:
+                await flight.cond.wait_for(lambda: len(flight.chunks) > i or flight.done)
+                pending = flight.chunks[i:]
+                finished = flight.done
+            for chunk in pending:
+                # LangChain이 yield된 청크의 message(id 등)를 호출마다 고치므로 대기자별 복사본을 넘김
+                yield chunk.model_copy(deep=True)
+            i += len(pending)
+            if finished and i >= len(flight.chunks):
+                break
+
+        if flight.error is not None:
+            raise flight.error
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop=stop, **kwargs))
+
+
+def create_groq_llm(model_name: str, temperature: float, coalesce: Optional[bool] = None) -> BaseChatModel:
+    """공유 커넥션 풀을 쓰는 Groq 채팅 모델 생성
+
+    Args:
+        model_name: Groq 모델 이름
+        temperature: 생성 온도
+        coalesce: 동일 프롬프트 single-flight 병합 여부 (없으면 LLM_COALESCING)
+
+    Returns:
+        ChatGroq (병합 사용 시 CoalescingChatModel로 감쌈)
+    """
+    if not GROQ_API_KEY:
+        raise ValueError("GROQ_API_KEY 환경변수가 설정되지 않았습니다.")
+
+    llm = ChatGroq(
+        model=model_name,
+        api_key=GROQ_API_KEY,
+        base_url=GROQ_API_BASE,
+        temperature=temperature,
+        timeout=GROQ_TIMEOUT,  # 30초 타임아웃
+        max_retries=2,  # 최대 2번 재시도
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client()
+    )
+
+    if LLM_COALESCING if coalesce is None else coalesce:
+        return CoalescingChatModel(inner=llm)
+    return llm
@@ -0,0 +1,247 @@
+"""
+단계별 지연시간 계측
+RAG 단계(임베딩, 벡터 검색, BM25, rerank, 프롬프트, LLM TTFT/스트리밍)의 span을 히스토그램으로 집계하고
+Prometheus 텍스트 형식과 p50/p95/p99 요약으로 노출
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_WINDOW = int(os.getenv("METRICS_WINDOW", "2048"))  # 백분위 계산에 쓰는 최근 샘플 수
+METRICS_PREFIX = "chatbot"
+
+# Prometheus 누적 버킷 경계 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 현재 요청의 span 수집용 (단계 이름 → 누적 초)
+_current_trace: ContextVar[Optional[Dict[str, float]]] = ContextVar("metrics_trace", default=None)
+
+
+class Histogram:
+    """버킷 카운트(Prometheus용) + 최근 샘플 윈도(백분위용)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = METRICS_WINDOW):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        """최근 윈도 기준 ms 단위 백분위 (최근접 순위)"""
+        ordered = sorted(self.recent)
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1] * 1000, 2)
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count * 1000, 2) if self.count else 0.0,
+            "p50_ms": pct(50),
+            "p95_ms": pct(95),
+            "p99_ms": pct(99)
+        }
+
+
+class MetricsRegistry:
+    """프로세스 전역 단계별 히스토그램 + 카운터 (스레드 안전)"""
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 기록 (진행 중인 요청 trace에도 누적)
+
+        Args:
+            stage: 단계 이름
+            seconds: 소요 시간 (초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = Histogram(window=self.window)
+                self._histograms[stage] = histogram
+            histogram.observe(seconds)
+
+        trace = _current_trace.get()
+        if trace is not None:
+            trace[stage] = trace.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """with 블록 소요 시간을 stage로 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """카운터 증가
+
+        Args:
+            name: 카운터 이름 (예: requests_total)
+            amount: 증가량
+            **labels: Prometheus 라벨 (예: path="faq")
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def reset(self) -> None:
+        """모든 히스토그램/카운터 초기화 (벤치마크 구간 분리용)"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def start_trace(self) -> Dict[str, float]:
+        """현재 컨텍스트에서 요청 단위 span 수집 시작
+
+        이후 같은 컨텍스트(복사된 컨텍스트 포함)에서 기록되는 단계 시간이 반환된 dict에 누적된다.
+
+        Returns:
+            단계 이름 → 누적 초 dict
+        """
+        trace: Dict[str, float] = {}
+        _current_trace.set(trace)
+        return trace
+
+    def end_trace(self, trace: Dict[str, float], **fields) -> None:
+        """요청 단위 span 수집 종료 + 구조화 로그 1줄 기록
+
+        Args:
+            trace: start_trace가 반환한 dict
+            **fields: 함께 기록할 필드 (예: path="llm")
+        """
+        if _current_trace.get() is trace:
+            _current_trace.set(None)
+        record = {**fields, **{stage: round(seconds * 1000, 1) for stage, seconds in trace.items()}}
+        logger.info(f"timings_ms {json.dumps(record, ensure_ascii=False)}")
+
+    def get_summary(self) -> Dict[str, Dict]:
+        """단계별 p50/p95/p99 + 카운터 반환
+
+        Returns:
+            {"stages": {단계: 요약}, "counters": {이름{라벨}: 값}}
+        """
+        with self._lock:
+            stages = {stage: h.summary() for stage, h in sorted(self._histograms.items())}
+            counters = {
+                _series(name, labels): value
+                for (name, labels), value in sorted(self._counters.items())
+            }
+        return {"stages": stages, "counters": counters}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)"""
+        metric = f"{METRICS_PREFIX}_stage_seconds"
+        lines: List[str] = [
+            f"# HELP {metric} RAG pipeline stage latency in seconds",
+            f"# TYPE {metric} histogram"
+        ]
+
+        with self._lock:
+            for stage, h in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.bucket_counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {h.sum:.6f}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {h.count}')
+
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                series = f"{METRICS_PREFIX}_{name}"
+                if series not in typed:
+                    lines.append(f"# TYPE {series} counter")
+                    typed.add(series)
+                lines.append(f"{_series(series, labels)} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+class RequestTimer:
+    """요청 1건의 end-to-end / TTFT 계측 (단계별 span은 trace로 함께 수집)
+
+    llm_ttft는 체인 시작~첫 토큰에서 검색/프롬프트 구성 시간을 뺀 값(LLM 첫 토큰 대기)이다.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or get_metrics()
+        self.trace = self.registry.start_trace()
+        self.start = time.perf_counter()
+        self.llm_start: Optional[float] = None
+        self.first_token_at: Optional[float] = None
+
+    def llm_started(self) -> None:
+        """QA 체인 호출 직전에 호출"""
+        self.llm_start = time.perf_counter()
+
+    def _pre_llm_seconds(self) -> float:
+        return self.trace.get("retrieval", 0.0) + self.trace.get("prompt_build", 0.0)
+
+    def token(self) -> None:
+        """스트리밍 청크마다 호출 (첫 청크에서 TTFT 기록)"""
+        if self.first_token_at is not None or self.llm_start is None:
+            return
+        self.first_token_at = time.perf_counter()
+        self.registry.observe("ttft", self.first_token_at - self.start)
+        self.registry.observe(
+            "llm_ttft",
+            max(0.0, self.first_token_at - self.llm_start - self._pre_llm_seconds())
+        )
+
+    def finish(self, path: str) -> None:
+        """요청 종료 기록
+
+        Args:
+            path: 응답 경로 (faq | cache | llm | invalid | error)
+        """
+        end = time.perf_counter()
+        if self.first_token_at is not None:
+            self.registry.observe("llm_stream", end - self.first_token_at)
+        elif self.llm_start is not None and path == "llm":
+            # 비스트리밍: 체인 전체에서 검색/프롬프트 구성을 뺀 생성 시간
+            self.registry.observe("llm_generate", max(0.0, end - self.llm_start - self._pre_llm_seconds()))
+        self.registry.observe("request", end - self.start)
+        self.registry.increment("requests_total", path=path)
+        self.registry.end_trace(self.trace, path=path)
+
+
+def _series(name: str, labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+# 전역 메트릭 인스턴스
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """프로세스 전역 MetricsRegistry 반환"""
+    return _metrics
+
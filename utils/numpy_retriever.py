@@ -0,0 +1,94 @@
+"""
+NumPy 정확 검색 Retriever
+소규모 코퍼스용: 저장된 Chroma 컬렉션의 벡터를 float32 행렬 하나로 올려 두고
+내적 한 번 + argpartition으로 top-k 검색 (SQLite/HNSW 경유 없음)
+"""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+from langchain_community.vectorstores import Chroma
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+logger = logging.getLogger(__name__)
+
+
+class NumpyRetriever(BaseRetriever):
+    """인메모리 NumPy 정확 검색 Retriever
+
+    임베딩은 정규화되어 있다고 가정하므로 내적이 곧 코사인 유사도다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    embeddings: Embeddings
+    matrix: np.ndarray
+    documents: List[Document]
+    k: int = 10
+
+    @classmethod
+    def from_chroma(cls, vectorstore: Chroma, embeddings: Embeddings, k: int = 10) -> "NumpyRetriever":
+        """Chroma 컬렉션 전체를 읽어 Retriever 생성
+
+        Args:
+            vectorstore: 로드된 Chroma 벡터 스토어
+            embeddings: 질의 임베딩 모델 (컬렉션과 같은 모델)
+            k: 기본 검색 개수
+
+        Returns:
+            NumpyRetriever 인스턴스
+        """
+        data = vectorstore.get(include=["embeddings", "documents", "metadatas"])
+        matrix = np.ascontiguousarray(np.asarray(data["embeddings"], dtype=np.float32))
+        documents = [
+            Document(page_content=text, metadata=metadata or {})
+            for text, metadata in zip(data["documents"], data["metadatas"])
+        ]
+        logger.info(f"NumPy retriever loaded: {matrix.shape[0]} vectors, {matrix.nbytes / 1024:.1f}KB")
+        return cls(embeddings=embeddings, matrix=matrix, documents=documents, k=k)
+
+    def search_by_vector(self, vector: List[float], k: int) -> List[Tuple[Document, float]]:
+        """벡터로 top-k 검색
+
+        Args:
+            vector: 질의 임베딩
+            k: 검색 개수
+
+        Returns:
+            (문서, 코사인 유사도) 튜플 리스트 (유사도 내림차순)
+        """
+        if len(self.documents) == 0:
+            return []
+
+        scores = self.matrix @ np.asarray(vector, dtype=np.float32)
+        k = min(k, len(scores))
+
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+
+        return [(self.documents[i], float(scores[i])) for i in top]
+
+    def similarity_search_with_score(self, query: str, k: int = None) -> List[Tuple[Document, float]]:
+        """질의 텍스트로 top-k 검색
+
+        Args:
+            query: 질의
+            k: 검색 개수 (없으면 self.k)
+
+        Returns:
+            (문서, 코사인 유사도) 튜플 리스트
+        """
+        return self.search_by_vector(self.embeddings.embed_query(query), k or self.k)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query)]
@@ -0,0 +1,176 @@
+"""
+RAG 파이프라인 레지스트리
+(model_name, temperature, use_reranking) 조합별로 파이프라인을 프로세스 전역에서 공유
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from utils.rag_pipeline import RAGPipeline
+
+logger = logging.getLogger(__name__)
+
+VECTORSTORE_PATH = os.getenv(
+    "VECTORSTORE_PATH",
+    str(Path(__file__).resolve().parent.parent / "data" / "vectorstore")
+)
+
+PipelineKey = Tuple[str, float, bool]
+
+
+def make_pipeline_key(model_name: str, temperature: float, use_reranking: bool) -> PipelineKey:
+    """레지스트리 키 생성
+
+    Args:
+        model_name: Groq 모델 이름
+        temperature: 생성 온도
+        use_reranking: Reranking 사용 여부
+
+    Returns:
+        (model_name, temperature, use_reranking) 튜플
+    """
+    # 슬라이더 값의 부동소수점 오차로 키가 갈라지지 않도록 반올림
+    return (model_name, round(float(temperature), 2), bool(use_reranking))
+
+
+class PipelineRegistry:
+    """프로세스 전역 RAG 파이프라인 레지스트리
+
+    임베딩, 벡터 스토어, reranker는 모든 파이프라인이 공유하고,
+    키별 파이프라인은 LLM 클라이언트와 QA 체인만 따로 가진다.
+    세션별 상태(대화 히스토리 등)는 cl.user_session에 둔다.
+
+    파이프라인 생성은 레지스트리 락 밖에서 하므로, 새 키를 만드는 동안에도
+    이미 있는 파이프라인의 acquire/release/get_stats는 막히지 않는다.
+    같은 키를 동시에 요청한 세션들은 진행 중인 생성 1건의 결과를 기다린다.
+    """
+
+    def __init__(self, vectorstore_path: str = VECTORSTORE_PATH):
+        """
+        Args:
+            vectorstore_path: ChromaDB 벡터 스토어 경로
+        """
+        self.vectorstore_path = vectorstore_path
+        self._lock = threading.Lock()
+        self._pipelines: Dict[PipelineKey, RAGPipeline] = {}
+        self._sessions: Dict[PipelineKey, int] = {}
+        self._building: Dict[PipelineKey, Future] = {}
+
+    def _build(self, key: PipelineKey) -> RAGPipeline:
+        """키에 해당하는 파이프라인 생성"""
+        model_name, temperature, use_reranking = key
+
+        if not Path(self.vectorstore_path).exists():
+            raise FileNotFoundError(f"벡터 스토어를 찾을 수 없습니다: {self.vectorstore_path}")
+
+        logger.info(f"Creating shared RAG pipeline: {key}")
+        pipeline = RAGPipeline(
+            model_name=model_name,
+            temperature=temperature,
+            use_reranking=use_reranking
+        )
+        pipeline.load_vectorstore(self.vectorstore_path)
+        pipeline.create_qa_chain()
+        return pipeline
+
+    def acquire(
+        self,
+        model_name: str,
+        temperature: float,
+        use_reranking: bool
+    ) -> RAGPipeline:
+        """공유 파이프라인을 가져오고 세션 수를 1 증가
+
+        Args:
+            model_name: Groq 모델 이름
+            temperature: 생성 온도
+            use_reranking: Reranking 사용 여부
+
+        Returns:
+            공유 RAGPipeline 인스턴스
+        """
+        key = make_pipeline_key(model_name, temperature, use_reranking)
+
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            building = self._building.get(key)
+            leader = pipeline is None and building is None
+            if leader:
+                building = self._building[key] = Future()
+
+        if pipeline is None:
+            if leader:
+                try:
+                    pipeline = self._build(key)
+                except BaseException as e:
+                    with self._lock:
+                        del self._building[key]
+                    building.set_exception(e)
+                    raise
+                with self._lock:
+                    self._pipelines[key] = pipeline
+                    del self._building[key]
+                building.set_result(pipeline)
+            else:
+                pipeline = building.result()  # 생성 실패 시 같은 예외 전파
+
+        with self._lock:
+            self._sessions[key] = self._sessions.get(key, 0) + 1
+            logger.info(f"Pipeline acquired {key}: {self._sessions[key]} sessions")
+
+        return pipeline
+
+    def release(self, model_name: str, temperature: float, use_reranking: bool) -> None:
+        """세션 수를 1 감소 (파이프라인은 재사용을 위해 유지)
+
+        Args:
+            model_name: Groq 모델 이름
+            temperature: 생성 온도
+            use_reranking: Reranking 사용 여부
+        """
+        key = make_pipeline_key(model_name, temperature, use_reranking)
+
+        with self._lock:
+            if self._sessions.get(key, 0) > 0:
+                self._sessions[key] -= 1
+                logger.info(f"Pipeline released {key}: {self._sessions[key]} sessions")
+
+    def get_stats(self) -> List[Dict]:
+        """파이프라인별 사용 세션 수 반환
+
+        Returns:
+            파이프라인 통계 딕셔너리 리스트
+        """
+        with self._lock:
+            return [
+                {
+                    "model_name": key[0],
+                    "temperature": key[1],
+                    "use_reranking": key[2],
+                    "sessions": self._sessions.get(key, 0)
+                }
+                for key in self._pipelines
+            ]
+
+
+# 전역 레지스트리 인스턴스
+_pipeline_registry = None
+
+
+def get_pipeline_registry() -> PipelineRegistry:
+    """PipelineRegistry 싱글톤 인스턴스 반환
+
+    Returns:
+        PipelineRegistry 인스턴스
+    """
+    global _pipeline_registry
+
+    if _pipeline_registry is None:
+        _pipeline_registry = PipelineRegistry()
+        logger.info(f"Pipeline registry initialized: {_pipeline_registry.vectorstore_path}")
+
+    return _pipeline_registry
@@ -0,0 +1,224 @@
+"""
+토큰 예산 기반 프롬프트 구성
+대화 히스토리와 검색 컨텍스트를 설정된 토큰 예산 안에 맞춤
+(낮은 순위 청크부터 자르거나 제외, 오래된 대화는 압축)
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Union
+
+# 한글/CJK 문자는 대략 글자당 1토큰, 그 외는 약 4글자당 1토큰 (Llama 계열 토크나이저 기준 근사)
+_CJK_PATTERN = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3]")
+_CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARK = " …"
+
+History = Union[str, Sequence[Dict[str, str]]]
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / _CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤를 잘라냄
+
+    Args:
+        text: 대상 텍스트
+        max_tokens: 최대 토큰 수
+
+    Returns:
+        잘린 텍스트 (잘렸으면 끝에 TRUNCATION_MARK)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    # 추정치가 글자 수에 대해 단조 증가하므로 이진 탐색
+    budget = max_tokens - estimate_tokens(TRUNCATION_MARK)
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + TRUNCATION_MARK
+
+
+@dataclass
+class PromptParts:
+    """예산에 맞춘 프롬프트 입력과 토큰 통계"""
+
+    chat_history: str
+    context: str
+    prompt_tokens: int
+    raw_tokens: int
+    used_docs: int
+    total_docs: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.raw_tokens - self.prompt_tokens)
+
+
+class PromptBuilder:
+    """히스토리 + 컨텍스트를 토큰 예산 안에 맞추는 프롬프트 빌더
+
+    질문과 템플릿 고정부를 먼저 빼고, 히스토리는 history_budget 안에서 최신
+    대화를 우선 남긴다 (가장 최근 대화 외에는 답변을 turn_tokens로 압축).
+    남은 예산은 검색 순위가 높은 청크부터 채우고, 넘치는 청크는 잘라내거나 제외한다.
+    """
+
+    def __init__(
+        self,
+        max_prompt_tokens: int = 3000,
+        history_budget: int = 800,
+        max_history_items: int = 5,
+        turn_tokens: int = 120,
+        min_chunk_tokens: int = 48
+    ):
+        """
+        Args:
+            max_prompt_tokens: 프롬프트 전체 토큰 예산
+            history_budget: 대화 히스토리 최대 토큰
+            max_history_items: 포함할 최근 대화 수
+            turn_tokens: 오래된 대화의 답변 압축 길이 (토큰)
+            min_chunk_tokens: 이보다 적게 남으면 청크를 자르지 않고 제외
+        """
+        self.max_prompt_tokens = max_prompt_tokens
+        self.history_budget = history_budget
+        self.max_history_items = max_history_items
+        self.turn_tokens = turn_tokens
+        self.min_chunk_tokens = min_chunk_tokens
+
+    def _raw_history(self, history: History) -> str:
+        """압축 없이 최근 max_history_items개 대화를 이어 붙인 히스토리 (절약량 기준)"""
+        if isinstance(history, str):
+            return history
+        return "".join(
+            f"사용자: {entry['user']}\n어시스턴트: {entry['assistant']}\n\n"
+            for entry in list(history)[-self.max_history_items:]
+        )
+
+    def format_history(self, history: History, budget: int) -> str:
+        """최근 대화부터 예산 안에 들어가는 만큼 히스토리 구성
+
+        Args:
+            history: [{"user", "assistant"}] 리스트 (이미 포맷된 문자열도 허용)
+            budget: 히스토리 토큰 예산
+
+        Returns:
+            포맷된 히스토리 (없으면 빈 문자열)
+        """
+        if not history or budget <= 0:
+            return ""
+        if isinstance(history, str):
+            return truncate_to_tokens(history, budget)
+
+        recent = list(history)[-self.max_history_items:] if self.max_history_items > 0 else []
+        blocks: List[str] = []
+        used = 0
+        for age, entry in enumerate(reversed(recent)):
+            answer = entry["assistant"]
+            if age > 0:
+                # 가장 최근 대화만 원문 유지, 이전 대화는 답변 압축
+                answer = truncate_to_tokens(answer, self.turn_tokens)
+            block = f"사용자: {entry['user']}\n어시스턴트: {answer}\n\n"
+            tokens = estimate_tokens(block)
+            if used + tokens > budget:
+                if not blocks:
+                    blocks.append(truncate_to_tokens(block, budget))
+                break
+            blocks.append(block)
+            used += tokens
+
+        return "".join(reversed(blocks))
+
+    def format_context(self, documents: Sequence[str], budget: int) -> List[str]:
+        """순위가 높은 청크부터 예산 안에서 선택 (넘치는 청크는 잘라내거나 제외)
+
+        Args:
+            documents: 순위순 청크 본문
+            budget: 컨텍스트 토큰 예산
+
+        Returns:
+            "[문서 n]" 헤더가 붙은 청크 리스트
+        """
+        selected: List[str] = []
+        remaining = budget
+        for i, content in enumerate(documents):
+            block = f"[문서 {i+1}]\n{content}"
+            tokens = estimate_tokens(block) + 1  # 구분 줄바꿈
+            if tokens <= remaining:
+                selected.append(block)
+                remaining -= tokens
+                continue
+            if remaining >= self.min_chunk_tokens:
+                selected.append(truncate_to_tokens(block, remaining))
+            break
+        return selected
+
+    def build(
+        self,
+        template_tokens: int,
+        question: str,
+        history: History,
+        documents: Sequence[str],
+        summary: str = ""
+    ) -> PromptParts:
+        """예산에 맞춘 히스토리/컨텍스트 생성
+
+        Args:
+            template_tokens: 템플릿 고정부 토큰 수
+            question: 사용자 질문
+            history: 대화 히스토리
+            documents: 순위순 청크 본문
+            summary: 이전 대화 요약 (히스토리 예산의 절반까지 사용)
+
+        Returns:
+            PromptParts
+        """
+        fixed = template_tokens + estimate_tokens(question)
+        available = max(0, self.max_prompt_tokens - fixed)
+
+        history_budget = min(self.history_budget, available)
+        summary_block = ""
+        if summary:
+            summary_block = truncate_to_tokens(f"[이전 대화 요약]\n{summary}\n\n", history_budget // 2)
+        chat_history = summary_block + self.format_history(
+            history, history_budget - estimate_tokens(summary_block)
+        )
+        history_tokens = estimate_tokens(chat_history)
+
+        blocks = self.format_context(documents, available - history_tokens)
+        context = "\n\n".join(blocks)
+
+        raw_tokens = (
+            fixed
+            + estimate_tokens(summary)
+            + estimate_tokens(self._raw_history(history) if history else "")
+            + estimate_tokens("\n\n".join(f"[문서 {i+1}]\n{d}" for i, d in enumerate(documents)))
+        )
+        return PromptParts(
+            chat_history=chat_history,
+            context=context,
+            prompt_tokens=fixed + history_tokens + estimate_tokens(context),
+            raw_tokens=raw_tokens,
+            used_docs=len(blocks),
+            total_docs=len(documents)
+        )
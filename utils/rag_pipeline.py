@@ -4,23 +4,279 @@ Retrieval-Augmented Generation 파이프라인
 ChromaDB + all-MiniLM-L6-v2 (초경량, 빠른 로딩) + Groq API
 """
 
-from typing import List, Dict, Optional, Iterator
-from langchain_groq import ChatGroq
-from langchain_community.embeddings import HuggingFaceEmbeddings
+from typing import List, Dict, Optional, Iterator, AsyncIterator, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from langchain_community.vectorstores import Chroma
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
-from flashrank import Ranker, RerankRequest
+from langchain_core.runnables import RunnableLambda
+from langchain_core.language_models import BaseChatModel
+from langchain_core.documents import Document
+from flashrank import RerankRequest
+from utils.answer_cache import AnswerCache
+from utils.faq_index import FAQIndex
+from utils.rerank_policy import AdaptiveRerankPolicy
+from utils.reranker import get_reranker
+from utils.embedding_backend import EMBEDDING_BACKEND, create_embeddings
+from utils.embedding_cache import CachedEmbeddings
+from utils.embedding_batcher import MicroBatchEmbeddings
+from utils.numpy_retriever import NumpyRetriever
+from utils.lexical_index import (
+    LEXICAL_INDEX_FILENAME,
+    BM25Index,
+    collection_signature,
+    reciprocal_rank_fusion
+)
+from utils.prompt_budget import History, PromptBuilder, estimate_tokens
+from utils.conversation_memory import ConversationMemory, LLMSummarizer, StubSummarizer
+from utils.llm_client import create_groq_llm
+from utils.metrics import RequestTimer, get_metrics
+import asyncio
+import contextvars
 import logging
+import re
+import threading
+import time
 import os
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
+metrics = get_metrics()
 
 # 환경변수에서 설정 로드
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 MAX_QUERY_LENGTH = int(os.getenv("MAX_QUERY_LENGTH", "500"))
 MAX_HISTORY_ITEMS = int(os.getenv("MAX_HISTORY_ITEMS", "5"))
+RETRIEVAL_WORKERS = int(os.getenv("RETRIEVAL_WORKERS", "4"))
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+EMBEDDING_BATCHING = os.getenv("EMBEDDING_BATCHING", "true").lower() == "true"
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "3"))
+RETRIEVER_BACKEND = os.getenv("RETRIEVER_BACKEND", "chroma")  # chroma | numpy
+
+# 하이브리드 검색 (dense + BM25, RRF 결합)
+RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "hybrid")  # dense | hybrid
+RETRIEVAL_K = int(os.getenv("RETRIEVAL_K", "5"))  # RRF 결합 후 남길 문서 수
+RRF_K = int(os.getenv("RRF_K", "60"))
+
+DENSE_K = 10
+
+# 적응형 reranking (dense 1위-2위 유사도 차이가 margin 이상이면 생략, 애매하면 상위 m개만 rerank)
+# 기본값은 기존 동작(후보 전체를 항상 rerank). adaptive의 margin/top_m은
+# benchmarks/eval_adaptive_rerank.py로 배포 모델에서 측정한 뒤 켠다.
+RERANK_POLICY = os.getenv("RERANK_POLICY", "always")  # adaptive | always
+RERANK_MARGIN = float(os.getenv("RERANK_MARGIN", "0.05"))
+RERANK_TOP_M = int(os.getenv("RERANK_TOP_M", str(DENSE_K)))
+
+# 프롬프트 토큰 예산 (추정치 기준)
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "3000"))
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "800"))
+HISTORY_TURN_TOKENS = int(os.getenv("HISTORY_TURN_TOKENS", "120"))
+
+# 롤링 요약 메모리 (off | llm | stub)
+CONVERSATION_SUMMARY = os.getenv("CONVERSATION_SUMMARY", "off")
+# 요약 전 대화가 프롬프트의 최근 MAX_HISTORY_ITEMS개 밖으로 밀려나지 않도록 MAX_HISTORY_ITEMS - 1 이하로 제한
+# (백그라운드 요약이 끝나기 전에 한 턴이 더 쌓여도 모두 프롬프트에 들어감)
+SUMMARY_FOLD_THRESHOLD = min(
+    int(os.getenv("SUMMARY_FOLD_THRESHOLD", str(MAX_HISTORY_ITEMS - 1))),
+    MAX_HISTORY_ITEMS - 1
+)
+SUMMARY_KEEP_RECENT = int(os.getenv("SUMMARY_KEEP_RECENT", "2"))
+SUMMARY_MAX_TOKENS = int(os.getenv("SUMMARY_MAX_TOKENS", "200"))
+
+# 답변 캐시 설정
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+# 유사 질문 재사용은 한 단어만 다른 질문에 다른 답을 줄 수 있어 기본 off (정확 일치는 항상 사용)
+ANSWER_CACHE_SEMANTIC = os.getenv("ANSWER_CACHE_SEMANTIC", "false").lower() == "true"
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95"))
+ANSWER_CACHE_TTL = float(os.getenv("ANSWER_CACHE_TTL", "3600"))
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1000"))
+ANSWER_CACHE_DIR = os.getenv("ANSWER_CACHE_DIR", "")  # 비어 있으면 인메모리
+
+# FAQ 빠른 경로 (CSV 질문과 정규화 문자열이 같은 질의는 LLM 없이 큐레이션된 답변 반환)
+FAQ_ENABLED = os.getenv("FAQ_ENABLED", "true").lower() == "true"
+# 의미 매칭(임베딩 유사도)은 한 단어만 다른 CSV 질문(본사 주소 / 전화번호 등)에 오답을 낼 수 있으므로
+# benchmarks/bench_faq.py로 배포 모델의 정밀도를 확인한 뒤 켠다
+FAQ_SEMANTIC = os.getenv("FAQ_SEMANTIC", "false").lower() == "true"
+FAQ_THRESHOLD = float(os.getenv("FAQ_THRESHOLD", "0.93"))
+FAQ_PATH = os.getenv(
+    "FAQ_PATH",
+    str(Path(__file__).parent.parent / "data" / "datasets" / "company_qa.csv")
+)
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
+COLLECTION_NAME = "company_docs"
+
+# 대화 리스트/문자열 또는 롤링 요약 메모리
+ChatHistory = Union[History, ConversationMemory]
+
+# 프로세스 전역 공유 컴포넌트 (세션마다 다시 로드하지 않음)
+_shared_lock = threading.Lock()
+_shared_embeddings = None
+_shared_vectorstores: Dict[str, Chroma] = {}
+_shared_numpy_retrievers: Dict[str, NumpyRetriever] = {}
+_shared_lexical_indexes: Dict[str, BM25Index] = {}
+_shared_faq_indexes: Dict[str, FAQIndex] = {}
+
+# 임베딩/검색/reranking 전용 스레드 풀 (async 경로에서 이벤트 루프 블로킹 방지)
+_retrieval_executor = ThreadPoolExecutor(
+    max_workers=RETRIEVAL_WORKERS,
+    thread_name_prefix="rag-retrieval"
+)
+
+
+def _run_in_executor(func, *args) -> asyncio.Future:
+    """검색 전용 스레드 풀에서 실행 (요청 단위 span이 이어지도록 현재 컨텍스트 복사)"""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_retrieval_executor, contextvars.copy_context().run, func, *args)
+
+
+def get_shared_embeddings() -> CachedEmbeddings:
+    """임베딩 모델 싱글톤 반환 (프로세스당 1회 로드)
+
+    LRU 캐시 → (선택) 마이크로 배처 → 임베딩 백엔드(EMBEDDING_BACKEND) 순으로 감싼다.
+
+    Returns:
+        CachedEmbeddings 인스턴스
+    """
+    global _shared_embeddings
+
+    with _shared_lock:
+        if _shared_embeddings is None:
+            # 임베딩 모델 (distiluse-base-multilingual-cased-v2 - 다국어 지원, 메모리 최적화)
+            logger.info(f"Loading distiluse-base-multilingual-cased-v2 embeddings ({EMBEDDING_BACKEND})...")
+            base_embeddings = create_embeddings(EMBEDDING_MODEL_NAME)
+            if EMBEDDING_BATCHING:
+                # 동시 세션의 질의를 모아 한 번에 encode
+                base_embeddings = MicroBatchEmbeddings(
+                    base_embeddings,
+                    max_batch_size=EMBEDDING_BATCH_SIZE,
+                    max_wait_ms=EMBEDDING_BATCH_WAIT_MS
+                )
+            _shared_embeddings = CachedEmbeddings(
+                base_embeddings,
+                model_name=EMBEDDING_MODEL_NAME,
+                max_entries=EMBEDDING_CACHE_SIZE
+            )
+            logger.info("✅ distiluse-base-multilingual-cased-v2 embeddings loaded (~250MB memory)")
+
+    return _shared_embeddings
+
+
+def get_shared_vectorstore(path: str) -> Chroma:
+    """경로별 ChromaDB 벡터 스토어 싱글톤 반환
+
+    Args:
+        path: 벡터 스토어 디렉토리
+
+    Returns:
+        Chroma 인스턴스
+    """
+    embeddings = get_shared_embeddings()
+    key = os.path.abspath(path)
+
+    with _shared_lock:
+        vectorstore = _shared_vectorstores.get(key)
+        if vectorstore is None:
+            vectorstore = Chroma(
+                persist_directory=path,
+                embedding_function=embeddings,
+                collection_name=COLLECTION_NAME
+            )
+            _shared_vectorstores[key] = vectorstore
+
+    return vectorstore
+
+
+def get_shared_numpy_retriever(path: str) -> NumpyRetriever:
+    """경로별 NumPy 정확 검색 Retriever 싱글톤 반환
+
+    Args:
+        path: 벡터 스토어 디렉토리
+
+    Returns:
+        NumpyRetriever 인스턴스
+    """
+    vectorstore = get_shared_vectorstore(path)
+    key = os.path.abspath(path)
+
+    with _shared_lock:
+        retriever = _shared_numpy_retrievers.get(key)
+        if retriever is None:
+            retriever = NumpyRetriever.from_chroma(vectorstore, vectorstore.embeddings, k=10)
+            _shared_numpy_retrievers[key] = retriever
+
+    return retriever
+
+
+def get_shared_lexical_index(path: str) -> BM25Index:
+    """경로별 BM25 어휘 인덱스 싱글톤 반환
+
+    인제스트 때 저장한 인덱스가 현재 컬렉션과 다르거나 없으면 컬렉션에서 다시 만든다.
+
+    Args:
+        path: 벡터 스토어 디렉토리
+
+    Returns:
+        BM25Index 인스턴스
+    """
+    vectorstore = get_shared_vectorstore(path)
+    key = os.path.abspath(path)
+
+    with _shared_lock:
+        index = _shared_lexical_indexes.get(key)
+        if index is None:
+            data = vectorstore.get(include=["metadatas"])
+            signature = collection_signature(data["ids"], data["metadatas"])
+            index_path = os.path.join(path, LEXICAL_INDEX_FILENAME)
+
+            if os.path.exists(index_path):
+                index = BM25Index.load(index_path)
+                if index.signature != signature:
+                    logger.warning("BM25 인덱스가 컬렉션과 다릅니다. 컬렉션에서 다시 생성합니다.")
+                    index = None
+            if index is None:
+                index = BM25Index.from_chroma(vectorstore)
+            logger.info(f"BM25 index loaded: {len(index)} documents")
+            _shared_lexical_indexes[key] = index
+
+    return index
+
+
+def get_shared_faq_index(path: str = FAQ_PATH) -> FAQIndex:
+    """CSV 경로별 FAQ 인덱스 싱글톤 반환
+
+    Args:
+        path: question/answer 컬럼이 있는 CSV
+
+    Returns:
+        FAQIndex 인스턴스
+    """
+    embeddings = get_shared_embeddings()
+    key = os.path.abspath(path)
+
+    with _shared_lock:
+        index = _shared_faq_indexes.get(key)
+        if index is None:
+            index = FAQIndex.from_csv(path, embeddings, threshold=FAQ_THRESHOLD)
+            _shared_faq_indexes[key] = index
+
+    return index
+
+
+def get_loaded_vectorstore(path: str) -> Optional[Chroma]:
+    """이미 로드된 벡터 스토어 반환 (없으면 None, 새로 로드하지 않음 - 헬스 체크용)"""
+    with _shared_lock:
+        return _shared_vectorstores.get(os.path.abspath(path))
+
+
+def is_embeddings_loaded() -> bool:
+    """공유 임베딩 모델 로드 여부 (헬스 체크용)"""
+    return _shared_embeddings is not None
+
+
+def _split_for_replay(answer: str) -> List[str]:
+    """캐시된 답변을 스트리밍 재생용 청크(단어 + 뒤따르는 공백)로 분할"""
+    return re.findall(r"\S+\s*|\s+", answer)
 
 
 def validate_input(query: str) -> None:
@@ -55,65 +311,161 @@ class RAGPipeline:
         self,
         model_name: str = "llama-3.1-8b-instant",
         temperature: float = 0.7,
-        use_reranking: bool = True
+        use_reranking: bool = True,
+        llm: Optional[BaseChatModel] = None,
+        retriever_backend: Optional[str] = None,
+        retrieval_mode: Optional[str] = None
     ):
         """
         Args:
             model_name: Groq 모델 이름
             temperature: 생성 온도
             use_reranking: Reranking 사용 여부
+            llm: 사용할 채팅 모델 (없으면 Groq, 벤치마크용 stub 주입)
+            retriever_backend: 검색 백엔드 ("chroma" | "numpy", 없으면 RETRIEVER_BACKEND)
+            retrieval_mode: "dense" | "hybrid" (BM25 + RRF, 없으면 RETRIEVAL_MODE)
         """
         self.model_name = model_name
         self.temperature = temperature
         self.use_reranking = use_reranking
-
-        # LLM 초기화 (Groq API)
-        logger.info(f"Initializing Groq LLM: {model_name}")
-        if not GROQ_API_KEY:
-            raise ValueError("GROQ_API_KEY 환경변수가 설정되지 않았습니다.")
-        self.llm = ChatGroq(
-            model=model_name,
-            api_key=GROQ_API_KEY,
-            temperature=temperature,
-            timeout=30.0,  # 30초 타임아웃
-            max_retries=2   # 최대 2번 재시도
-        )
-        logger.info(f"✅ Groq LLM initialized")
-
-        # 임베딩 모델 (distiluse-base-multilingual-cased-v2 - 다국어 지원, 메모리 최적화)
-        logger.info("Loading distiluse-base-multilingual-cased-v2 embeddings (multilingual, optimized)...")
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/distiluse-base-multilingual-cased-v2",
-            model_kwargs={"device": "cpu"},
-            encode_kwargs={"normalize_embeddings": True}
+        self.retriever_backend = retriever_backend or RETRIEVER_BACKEND
+        if self.retriever_backend not in ("chroma", "numpy"):
+            raise ValueError(f"지원하지 않는 검색 백엔드입니다: {self.retriever_backend}")
+        self.retrieval_mode = retrieval_mode or RETRIEVAL_MODE
+        if self.retrieval_mode not in ("dense", "hybrid"):
+            raise ValueError(f"지원하지 않는 검색 모드입니다: {self.retrieval_mode}")
+
+        if llm is not None:
+            self.llm = llm
+            logger.info(f"Using injected LLM: {type(llm).__name__}")
+        else:
+            # LLM 초기화 (Groq API, 프로세스 전역 커넥션 풀 공유 + 동일 프롬프트 병합)
+            logger.info(f"Initializing Groq LLM: {model_name}")
+            self.llm = create_groq_llm(model_name, temperature)
+            logger.info(f"✅ Groq LLM initialized")
+
+        # 임베딩 모델 (프로세스 전역 공유)
+        self.embeddings = get_shared_embeddings()
+
+        self.rerank_policy = AdaptiveRerankPolicy(
+            mode=RERANK_POLICY,
+            margin=RERANK_MARGIN,
+            top_m=RERANK_TOP_M
         )
-        logger.info("✅ distiluse-base-multilingual-cased-v2 embeddings loaded (~250MB memory)")
 
-        # Reranker (FlashRank - 무료)
+        # Reranker (FlashRank - 무료, 프로세스 전역 공유, 첫 rerank 때 로드)
         if use_reranking:
-            logger.info("Loading FlashRank reranker...")
-            self.reranker = Ranker(model_name="ms-marco-MiniLM-L-12-v2")
-            logger.info("✅ FlashRank reranker loaded")
+            self.reranker = get_reranker()
         else:
             self.reranker = None
             logger.info("Reranking disabled")
 
+        # 히스토리 + 컨텍스트를 토큰 예산에 맞추는 프롬프트 빌더
+        self.prompt_builder = PromptBuilder(
+            max_prompt_tokens=PROMPT_TOKEN_BUDGET,
+            history_budget=HISTORY_TOKEN_BUDGET,
+            max_history_items=MAX_HISTORY_ITEMS,
+            turn_tokens=HISTORY_TURN_TOKENS
+        )
+
         self.vectorstore = None
+        self.vectorstore_path = None
         self.qa_chain = None
+        self.answer_cache = None
+        self.faq_index = None
 
     def load_vectorstore(self, path: str):
-        """ChromaDB 벡터 스토어 로드"""
+        """ChromaDB 벡터 스토어 로드 (프로세스 전역 공유)"""
         try:
-            self.vectorstore = Chroma(
-                persist_directory=path,
-                embedding_function=self.embeddings,
-                collection_name="company_docs"
-            )
+            self.vectorstore = get_shared_vectorstore(path)
+            self.vectorstore_path = path
             logger.info(f"벡터 스토어 로드 완료: {path}")
         except Exception as e:
             logger.error(f"벡터 스토어 로드 실패: {e}")
             raise
 
+        if FAQ_ENABLED and os.path.exists(FAQ_PATH):
+            self.faq_index = get_shared_faq_index(FAQ_PATH)
+
+        if ANSWER_CACHE_ENABLED:
+            # 모델별로 답변이 다르므로 캐시도 모델별로 분리
+            self.answer_cache = AnswerCache(
+                embeddings=self.embeddings,
+                similarity_threshold=ANSWER_CACHE_THRESHOLD,
+                max_entries=ANSWER_CACHE_MAX_ENTRIES,
+                ttl_seconds=ANSWER_CACHE_TTL,
+                disk_path=os.path.join(ANSWER_CACHE_DIR, self.model_name) if ANSWER_CACHE_DIR else None,
+                vectorstore_path=path,
+                semantic=ANSWER_CACHE_SEMANTIC
+            )
+
+    def create_memory(self, mode: Optional[str] = None) -> Optional[ConversationMemory]:
+        """세션용 롤링 요약 메모리 생성
+
+        Args:
+            mode: "llm" | "stub" | "off" (없으면 CONVERSATION_SUMMARY)
+
+        Returns:
+            ConversationMemory (off면 None, 세션은 대화 리스트를 그대로 사용)
+        """
+        mode = mode or CONVERSATION_SUMMARY
+        if mode == "off":
+            return None
+        if mode == "llm":
+            summarizer = LLMSummarizer(self.llm, max_tokens=SUMMARY_MAX_TOKENS)
+        elif mode == "stub":
+            summarizer = StubSummarizer(max_tokens=SUMMARY_MAX_TOKENS)
+        else:
+            raise ValueError(f"지원하지 않는 요약 모드입니다: {mode}")
+        return ConversationMemory(
+            summarizer,
+            fold_threshold=SUMMARY_FOLD_THRESHOLD,
+            keep_recent=SUMMARY_KEEP_RECENT
+        )
+
+    def _fast_answer(self, question: str, chat_history: ChatHistory) -> Tuple[Optional[str], str]:
+        """검색/LLM 없이 응답할 수 있으면 답변 반환 (FAQ → 답변 캐시 순)
+
+        대화 히스토리가 있으면 후속 질문이 FAQ 질문과 비슷하게 임베딩되더라도 맥락이 필요할 수 있으므로
+        FAQ는 정규화 완전 일치만 허용하고(FAQ_SEMANTIC이어도), 답변 캐시는 건너뛴다.
+
+        Returns:
+            (답변 또는 None, 응답 경로 "faq" | "cache" | "llm") 튜플
+        """
+        if self.faq_index is not None:
+            try:
+                with metrics.span("faq"):
+                    match = self.faq_index.match(question, semantic=FAQ_SEMANTIC and not chat_history)
+            except Exception as e:
+                logger.warning(f"FAQ 조회 실패: {e}")
+                match = None
+            if match is not None:
+                logger.info(f"FAQ {match.kind} hit ({match.score:.3f}): {match.question[:50]}")
+                return match.answer, "faq"
+
+        with metrics.span("answer_cache"):
+            cached = self._cache_lookup(question, chat_history)
+        return cached, "llm" if cached is None else "cache"
+
+    def _cache_lookup(self, question: str, chat_history: ChatHistory) -> Optional[str]:
+        """답변 캐시 조회 (히스토리가 없는 단독 질문만, 실패 시 캐시 미사용)"""
+        if self.answer_cache is None or chat_history:
+            return None
+        try:
+            return self.answer_cache.lookup(question)
+        except Exception as e:
+            logger.warning(f"답변 캐시 조회 실패: {e}")
+            return None
+
+    def _cache_store(self, question: str, chat_history: ChatHistory, answer: str) -> None:
+        """답변 캐시 저장 (히스토리가 없는 단독 질문만)"""
+        if self.answer_cache is None or chat_history or not answer:
+            return
+        try:
+            self.answer_cache.store(question, answer)
+        except Exception as e:
+            logger.warning(f"답변 캐시 저장 실패: {e}")
+
     def _rerank_documents(self, query: str, documents: List) -> List:
         """문서 재순위화 (FlashRank)"""
         if not self.reranker or len(documents) == 0:
@@ -127,7 +479,8 @@ class RAGPipeline:
             ]
 
             rerank_request = RerankRequest(query=query, passages=passages)
-            reranked = self.reranker.rerank(rerank_request)
+            with metrics.span("rerank"):
+                reranked = self.reranker.rerank(rerank_request)
 
             # 상위 3개만 반환
             top_docs = []
@@ -141,6 +494,91 @@ class RAGPipeline:
             logger.warning(f"Reranking 실패, 원본 문서 사용: {e}")
             return documents[:3]
 
+    def _dense_search(self, query: str, k: int = DENSE_K) -> List[Tuple[Document, float]]:
+        """dense 검색 (점수 포함)
+
+        Args:
+            query: 질의
+            k: 검색 개수
+
+        Returns:
+            (문서, 코사인 유사도) 튜플 리스트 (유사도 내림차순)
+        """
+        # 임베딩과 벡터 검색을 따로 계측하기 위해 질의 벡터를 먼저 구함
+        with metrics.span("embed"):
+            vector = self.embeddings.embed_query(query)
+
+        with metrics.span("vector_search"):
+            if self.retriever_backend == "numpy":
+                return get_shared_numpy_retriever(self.vectorstore_path).search_by_vector(vector, k=k)
+
+            # Chroma 기본 공간은 제곱 L2 거리: 정규화 임베딩이면 cos = 1 - d / 2
+            return [
+                (doc, 1.0 - distance / 2)
+                for doc, distance in self.vectorstore.similarity_search_by_vector_with_relevance_scores(vector, k=k)
+            ]
+
+    def _adaptive_rerank(self, query: str, docs: List, scores: List[float], decisive: bool) -> List:
+        """애매한 질의만 상위 m개 후보를 rerank (확정적이면 상위 3개 그대로)
+
+        Args:
+            query: 질의
+            docs: 후보 문서 (순위순)
+            scores: docs와 같은 순서의 dense 유사도
+            decisive: 다른 신호(dense/BM25 1위 일치 등)로 이미 확정적인지 여부
+
+        Returns:
+            최종 문서 리스트
+        """
+        if decisive or self.rerank_policy.is_decisive(scores):
+            self.rerank_policy.record(reranked=False)
+            return docs[:3]
+
+        start = time.perf_counter()
+        reranked = self._rerank_documents(query, docs[:self.rerank_policy.top_m])
+        self.rerank_policy.record(reranked=True, seconds=time.perf_counter() - start)
+        return reranked
+
+    def _hybrid_search(
+        self,
+        query: str,
+        dense_scored: List[Tuple[Document, float]],
+        lexical_index: BM25Index
+    ) -> Tuple[List, List[float], bool]:
+        """dense 결과와 BM25 결과를 RRF로 결합
+
+        Args:
+            query: 질의
+            dense_scored: dense 검색 결과 (문서, 유사도) 순위순
+            lexical_index: BM25 인덱스
+
+        Returns:
+            (결합된 상위 RETRIEVAL_K개 문서, 결합 순서에 맞춘 dense 유사도, dense/BM25 1위 일치 여부) 튜플
+        """
+        dense_docs = [doc for doc, _ in dense_scored]
+        with metrics.span("lexical_search"):
+            sparse_docs = [doc for doc, _ in lexical_index.search(query, k=len(dense_docs) or 10)]
+
+        by_content = {}
+        for doc in dense_docs + sparse_docs:
+            by_content.setdefault(doc.page_content, doc)
+
+        fused = reciprocal_rank_fusion(
+            [[doc.page_content for doc in dense_docs], [doc.page_content for doc in sparse_docs]],
+            k=RRF_K
+        )
+        docs = [by_content[content] for content, _ in fused[:RETRIEVAL_K]]
+
+        # margin 판단이 실제로 잘라 쓰는 결합 순서 기준이 되도록 dense 유사도를 같이 정렬
+        # BM25에만 있는 문서는 dense 상위 k 밖이므로 k위 유사도(상한)로 둔다 (margin을 작게 잡는 쪽)
+        dense_scores = {doc.page_content: score for doc, score in dense_scored}
+        floor = dense_scored[-1][1] if dense_scored else 0.0
+        scores = [dense_scores.get(doc.page_content, floor) for doc in docs]
+
+        # 두 검색기가 같은 1위를 내면 RRF 1위도 그 문서이고, reranking으로 바뀔 여지가 작음
+        agree = bool(dense_docs and sparse_docs) and dense_docs[0].page_content == sparse_docs[0].page_content
+        return docs, scores, agree
+
     def create_qa_chain(self):
         """QA 체인 생성 (LangChain 0.3 방식)"""
         if not self.vectorstore:
@@ -171,31 +609,76 @@ class RAGPipeline:
         prompt = ChatPromptTemplate.from_template(template)
 
         # Retriever 설정 (k=10으로 많이 가져온 후 reranking)
-        base_retriever = self.vectorstore.as_retriever(
-            search_type="similarity",
-            search_kwargs={"k": 10}
-        )
+        if self.retriever_backend == "numpy":
+            # 소규모 코퍼스: 인메모리 정확 검색
+            get_shared_numpy_retriever(self.vectorstore_path)
+        logger.info(f"Retriever backend: {self.retriever_backend}")
+
+        lexical_index = None
+        if self.retrieval_mode == "hybrid":
+            lexical_index = get_shared_lexical_index(self.vectorstore_path)
+        logger.info(f"Retrieval mode: {self.retrieval_mode}, rerank policy: {self.rerank_policy.mode}")
 
         # Reranking을 포함한 retriever
         def retrieve_and_rerank(query: str) -> List:
-            docs = base_retriever.invoke(query)
+            with metrics.span("retrieval"):
+                return retrieve(query)
+
+        def retrieve(query: str) -> List:
+            scored = self._dense_search(query)
+            docs = [doc for doc, _ in scored]
+            scores = [score for _, score in scored]
+
+            agree = False
+            if lexical_index is not None:
+                docs, scores, agree = self._hybrid_search(query, scored, lexical_index)
+
             if self.use_reranking:
-                docs = self._rerank_documents(query, docs)
+                return self._adaptive_rerank(query, docs, scores, decisive=agree)
+            if agree:
+                logger.debug("dense/BM25 1위 일치")
             return docs
 
-        # LCEL 체인 구성
-        def format_docs(docs):
-            return "\n\n".join(
-                f"[문서 {i+1}]\n{doc.page_content}"
-                for i, doc in enumerate(docs)
+        # 템플릿 고정부 토큰 (변수 제외)
+        template_tokens = estimate_tokens(
+            template.format(chat_history="", context="", question="")
+        )
+
+        def build_inputs(x, docs) -> Dict[str, str]:
+            history, summary = x.get("chat_history"), ""
+            if isinstance(history, ConversationMemory):
+                summary, history = history.snapshot()
+
+            # 히스토리 + 컨텍스트를 토큰 예산에 맞춤 (낮은 순위 청크부터 자름)
+            with metrics.span("prompt_build"):
+                parts = self.prompt_builder.build(
+                    template_tokens,
+                    x["question"],
+                    history,
+                    [doc.page_content for doc in docs],
+                    summary=summary
+                )
+            logger.info(
+                f"프롬프트 {parts.prompt_tokens} 토큰 (절약 {parts.tokens_saved}, "
+                f"문서 {parts.used_docs}/{parts.total_docs})"
             )
+            return {
+                "question": x["question"],
+                "chat_history": parts.chat_history or "없음",
+                "context": parts.context
+            }
 
+        def prepare_inputs(x) -> Dict[str, str]:
+            return build_inputs(x, retrieve_and_rerank(x["question"]))
+
+        async def aprepare_inputs(x) -> Dict[str, str]:
+            # 임베딩 + 검색 + reranking은 CPU 작업이므로 전용 스레드 풀에서 실행
+            docs = await _run_in_executor(retrieve_and_rerank, x["question"])
+            return build_inputs(x, docs)
+
+        # LCEL 체인 구성
         self.qa_chain = (
-            {
-                "context": lambda x: format_docs(retrieve_and_rerank(x["question"])),
-                "question": lambda x: x["question"],
-                "chat_history": lambda x: x.get("chat_history", "없음")
-            }
+            RunnableLambda(prepare_inputs, afunc=aprepare_inputs)
             | prompt
             | self.llm
             | StrOutputParser()
@@ -203,12 +686,12 @@ class RAGPipeline:
 
         logger.info("QA 체인 생성 완료")
 
-    def query(self, question: str, chat_history: str = "") -> str:
+    def query(self, question: str, chat_history: ChatHistory = "") -> str:
         """질문에 대한 답변 생성
 
         Args:
             question: 사용자 질문
-            chat_history: 이전 대화 히스토리 (선택)
+            chat_history: 이전 대화 ([{"user", "assistant"}] 리스트, 문자열 또는 ConversationMemory, 선택)
         """
         if not self.qa_chain:
             raise ValueError("QA chain이 초기화되지 않았습니다.")
@@ -216,25 +699,37 @@ class RAGPipeline:
         # 입력 검증
         validate_input(question)
 
+        timer = RequestTimer(metrics)
+        path = "error"
         try:
+            cached, path = self._fast_answer(question, chat_history)
+            if cached is not None:
+                return cached
+
+            timer.llm_started()
             result = self.qa_chain.invoke({
                 "question": question,
-                "chat_history": chat_history if chat_history else "없음"
+                "chat_history": chat_history
             })
+            self._cache_store(question, chat_history, result)
             return result
         except ValueError as e:
             # 입력 검증 오류는 그대로 전달
+            path = "error"
             raise
         except Exception as e:
+            path = "error"
             logger.error(f"질의 처리 실패: {e}")
             return "죄송합니다. 오류가 발생했습니다. 다시 시도해주세요."
+        finally:
+            timer.finish(path)
 
-    def stream_query(self, question: str, chat_history: str = "") -> Iterator[str]:
+    def stream_query(self, question: str, chat_history: ChatHistory = "") -> Iterator[str]:
         """스트리밍 방식으로 답변 생성
 
         Args:
             question: 사용자 질문
-            chat_history: 이전 대화 히스토리 (선택)
+            chat_history: 이전 대화 ([{"user", "assistant"}] 리스트, 문자열 또는 ConversationMemory, 선택)
         """
         if not self.qa_chain:
             raise ValueError("QA chain이 초기화되지 않았습니다.")
@@ -243,26 +738,137 @@ class RAGPipeline:
         try:
             validate_input(question)
         except ValueError as e:
+            metrics.increment("requests_total", path="invalid")
             yield f"❌ {str(e)}"
             return
 
+        timer = RequestTimer(metrics)
+        path = "error"
         try:
+            cached, path = self._fast_answer(question, chat_history)
+            if cached is not None:
+                yield from _split_for_replay(cached)
+                return
+
             logger.info(f"Starting stream query: {question[:50]}...")
+            timer.llm_started()
+            chunks = []
             for chunk in self.qa_chain.stream({
                 "question": question,
-                "chat_history": chat_history if chat_history else "없음"
+                "chat_history": chat_history
             }):
+                if chunk:
+                    timer.token()
+                chunks.append(chunk)
                 yield chunk
+            self._cache_store(question, chat_history, "".join(chunks))
             logger.info("Stream query completed successfully")
-        except TimeoutError as e:
-            logger.error(f"API 타임아웃: {e}")
-            yield "⏱️ API 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
         except Exception as e:
-            logger.error(f"스트리밍 질의 처리 실패: {e}", exc_info=True)
-            if "rate limit" in str(e).lower():
-                yield "⚠️ API 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
-            else:
-                yield f"❌ 오류가 발생했습니다: {str(e)}"
+            path = "error"
+            yield self._stream_error_message(e)
+        finally:
+            timer.finish(path)
+
+    async def aquery(self, question: str, chat_history: ChatHistory = "") -> str:
+        """질문에 대한 답변 생성 (async)
+
+        Args:
+            question: 사용자 질문
+            chat_history: 이전 대화 ([{"user", "assistant"}] 리스트, 문자열 또는 ConversationMemory, 선택)
+        """
+        if not self.qa_chain:
+            raise ValueError("QA chain이 초기화되지 않았습니다.")
+
+        # 입력 검증
+        validate_input(question)
+
+        timer = RequestTimer(metrics)
+        path = "error"
+        try:
+            cached, path = await _run_in_executor(self._fast_answer, question, chat_history)
+            if cached is not None:
+                return cached
+
+            timer.llm_started()
+            result = await self.qa_chain.ainvoke({
+                "question": question,
+                "chat_history": chat_history
+            })
+            await _run_in_executor(self._cache_store, question, chat_history, result)
+            return result
+        except Exception as e:
+            path = "error"
+            logger.error(f"질의 처리 실패: {e}")
+            return "죄송합니다. 오류가 발생했습니다. 다시 시도해주세요."
+        finally:
+            timer.finish(path)
+
+    async def astream_query(self, question: str, chat_history: ChatHistory = "") -> AsyncIterator[str]:
+        """스트리밍 방식으로 답변 생성 (async, 이벤트 루프 비블로킹)
+
+        Args:
+            question: 사용자 질문
+            chat_history: 이전 대화 ([{"user", "assistant"}] 리스트, 문자열 또는 ConversationMemory, 선택)
+        """
+        if not self.qa_chain:
+            raise ValueError("QA chain이 초기화되지 않았습니다.")
+
+        # 입력 검증
+        try:
+            validate_input(question)
+        except ValueError as e:
+            metrics.increment("requests_total", path="invalid")
+            yield f"❌ {str(e)}"
+            return
+
+        timer = RequestTimer(metrics)
+        path = "error"
+        try:
+            cached, path = await _run_in_executor(self._fast_answer, question, chat_history)
+            if cached is not None:
+                for chunk in _split_for_replay(cached):
+                    yield chunk
+                return
+
+            logger.info(f"Starting async stream query: {question[:50]}...")
+            timer.llm_started()
+            chunks = []
+            async for chunk in self.qa_chain.astream({
+                "question": question,
+                "chat_history": chat_history
+            }):
+                if chunk:
+                    timer.token()
+                chunks.append(chunk)
+                yield chunk
+            await _run_in_executor(self._cache_store, question, chat_history, "".join(chunks))
+            logger.info("Async stream query completed successfully")
+        except Exception as e:
+            path = "error"
+            yield self._stream_error_message(e)
+        finally:
+            timer.finish(path)
+
+    def _stream_error_message(self, error: Exception) -> str:
+        """스트리밍 중 발생한 예외를 사용자 메시지로 변환"""
+        if isinstance(error, TimeoutError):
+            logger.error(f"API 타임아웃: {error}")
+            return "⏱️ API 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+
+        logger.error(f"스트리밍 질의 처리 실패: {error}", exc_info=error)
+        if "rate limit" in str(error).lower():
+            return "⚠️ API 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
+        return f"❌ 오류가 발생했습니다: {str(error)}"
+
+    def get_rerank_stats(self) -> Dict[str, float]:
+        """적응형 reranking 통계 (rerank_rate, 추정 절약 시간)"""
+        return self.rerank_policy.get_stats()
+
+    def get_faq_stats(self) -> Dict[str, float]:
+        """FAQ 빠른 경로 통계 (served_ratio: 전체 질의 중 FAQ로 응답한 비율)"""
+        if self.faq_index is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.faq_index.get_stats()}
 
     def get_relevant_documents(self, question: str, k: int = 3) -> List[Dict]:
         """관련 문서 검색 (디버깅용)"""
@@ -1,47 +1,322 @@
 """
 Rate Limiting 구현
-사용자별 질의 횟수 제한
+사용자별 질의 횟수 제한 (슬라이딩 윈도우, 분당/시간당)
+
+저장소 백엔드:
+    memory: 프로세스 내부 딕셔너리 (기본, 단일 워커)
+    sqlite: 같은 호스트의 여러 워커가 공유하는 SQLite 파일 (한도가 워커 수만큼 늘어나지 않음)
 """
 
 import time
 import logging
-from collections import defaultdict
-from typing import Dict, List
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 import os
 
 logger = logging.getLogger(__name__)
 
+MINUTE = 60
+HOUR = 3600
+
+project_root = Path(__file__).parent.parent
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_DB_PATH = os.getenv("RATE_LIMIT_DB_PATH", str(project_root / "data" / "rate_limit.sqlite3"))
+
+
+class _UserWindow:
+    """사용자별 요청 시각 (시간 윈도우 리스트 + 분/시간 윈도우 시작 인덱스)
+
+    시각은 오름차순으로만 추가되므로 두 시작 인덱스는 앞으로만 이동하고,
+    만료된 앞부분은 절반 이상 쌓였을 때 한 번에 잘라낸다 (분할 상환 O(1)).
+    """
+
+    __slots__ = ("times", "minute_start", "hour_start", "last_seen")
+
+    def __init__(self):
+        self.times = []
+        self.minute_start = 0
+        self.hour_start = 0
+        self.last_seen = 0.0
+
+    def prune(self, now: float) -> None:
+        """윈도우를 벗어난 요청을 시작 인덱스 이동으로 제외"""
+        times = self.times
+        n = len(times)
+
+        i = self.hour_start
+        while i < n and now - times[i] >= HOUR:
+            i += 1
+        j = max(self.minute_start, i)
+        while j < n and now - times[j] >= MINUTE:
+            j += 1
+
+        # 만료된 앞부분이 절반을 넘으면 잘라내기
+        if i and i * 2 >= n:
+            del times[:i]
+            j -= i
+            i = 0
+
+        self.hour_start = i
+        self.minute_start = j
+
+    @property
+    def minute_count(self) -> int:
+        return len(self.times) - self.minute_start
+
+    @property
+    def hour_count(self) -> int:
+        return len(self.times) - self.hour_start
+
+
+class RateLimitBackend(ABC):
+    """Rate Limiter 저장소 인터페이스
+
+    hit()는 확인과 기록을 원자적으로 수행해야 한다. 여러 워커가 같은 저장소를
+    공유할 때 확인과 기록 사이에 다른 워커가 끼어들면 한도를 넘길 수 있다.
+    """
+
+    @abstractmethod
+    def hit(self, user_id: str, now: float, rpm: int, rph: int) -> Tuple[bool, int, int]:
+        """한도 내이면 요청 기록
+
+        Args:
+            user_id: 사용자 ID
+            now: 요청 시각
+            rpm: 분당 요청 제한
+            rph: 시간당 요청 제한
+
+        Returns:
+            (허용 여부, 최근 1분 요청 수, 최근 1시간 요청 수) 튜플 (허용 시 이번 요청 포함)
+        """
+
+    @abstractmethod
+    def usage(self, user_id: str, now: float) -> Tuple[int, int]:
+        """(최근 1분 요청 수, 최근 1시간 요청 수) 반환"""
+
+    @abstractmethod
+    def evict_idle(self, now: float) -> int:
+        """한 시간 넘게 지난 기록 제거
+
+        Returns:
+            제거된 항목 수
+        """
+
+    def close(self) -> None:
+        """저장소 자원 해제"""
+
+
+class MemoryBackend(RateLimitBackend):
+    """프로세스 내부 저장소 (사용자별 _UserWindow, 단일 락)"""
+
+    def __init__(self):
+        # 사용자별 요청 기록
+        self.requests: Dict[str, _UserWindow] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, user_id: str, now: float, rpm: int, rph: int) -> Tuple[bool, int, int]:
+        with self._lock:
+            window = self.requests.get(user_id)
+            if window is None:
+                window = self.requests[user_id] = _UserWindow()
+            window.prune(now)
+
+            allowed = window.minute_count < rpm and window.hour_count < rph
+            if allowed:
+                window.times.append(now)
+                window.last_seen = now
+            return allowed, window.minute_count, window.hour_count
+
+    def usage(self, user_id: str, now: float) -> Tuple[int, int]:
+        with self._lock:
+            window = self.requests.get(user_id)
+            if window is None:
+                return 0, 0
+            window.prune(now)
+            return window.minute_count, window.hour_count
+
+    def evict_idle(self, now: float) -> int:
+        with self._lock:
+            idle = [uid for uid, window in self.requests.items() if now - window.last_seen >= HOUR]
+            for uid in idle:
+                del self.requests[uid]
+        return len(idle)
+
+
+class SQLiteBackend(RateLimitBackend):
+    """여러 프로세스가 공유하는 SQLite 저장소
+
+    요청을 (사용자, 초) 버킷 카운터로 저장하고, 조회와 증가를 한 번의
+    BEGIN IMMEDIATE 트랜잭션에서 처리하므로 워커 간에도 한도가 정확히 지켜진다.
+    WAL + synchronous=NORMAL이라 커밋에 fsync가 없고, 만료 버킷 삭제는 확인 경로가
+    아닌 evict_idle()에서 한 번에 처리한다.
+    윈도우 경계는 초 단위로 맞춰진다.
+    """
+
+    def __init__(self, path: str = RATE_LIMIT_DB_PATH, timeout: float = 5.0):
+        """
+        Args:
+            path: SQLite 파일 경로 (같은 호스트의 워커가 같은 경로 사용)
+            timeout: 다른 워커의 쓰기 락 대기 시간 (초)
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_hits ("
+            " user_id TEXT NOT NULL,"
+            " bucket INTEGER NOT NULL,"
+            " count INTEGER NOT NULL,"
+            " PRIMARY KEY (user_id, bucket)"
+            ") WITHOUT ROWID"
+        )
+
+    def _counts(self, user_id: str, bucket: int) -> Tuple[int, int]:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(CASE WHEN bucket > ? THEN count END), 0),"
+            " COALESCE(SUM(count), 0)"
+            " FROM rate_limit_hits WHERE user_id = ? AND bucket > ?",
+            (bucket - MINUTE, user_id, bucket - HOUR)
+        ).fetchone()
+        return row[0], row[1]
+
+    def hit(self, user_id: str, now: float, rpm: int, rph: int) -> Tuple[bool, int, int]:
+        bucket = int(now)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                minute_count, hour_count = self._counts(user_id, bucket)
+                allowed = minute_count < rpm and hour_count < rph
+                if allowed:
+                    self._conn.execute(
+                        "INSERT INTO rate_limit_hits (user_id, bucket, count) VALUES (?, ?, 1)"
+                        " ON CONFLICT (user_id, bucket) DO UPDATE SET count = count + 1",
+                        (user_id, bucket)
+                    )
+                    minute_count += 1
+                    hour_count += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return allowed, minute_count, hour_count
+
+    def usage(self, user_id: str, now: float) -> Tuple[int, int]:
+        with self._lock:
+            return self._counts(user_id, int(now))
+
+    def evict_idle(self, now: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM rate_limit_hits WHERE bucket <= ?",
+                (int(now) - HOUR,)
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_backend(name: str = RATE_LIMIT_BACKEND) -> RateLimitBackend:
+    """이름으로 Rate Limiter 저장소 생성
+
+    Args:
+        name: "memory" 또는 "sqlite"
+
+    Returns:
+        RateLimitBackend 인스턴스
+    """
+    if name == "memory":
+        return MemoryBackend()
+    if name == "sqlite":
+        return SQLiteBackend(RATE_LIMIT_DB_PATH)
+    raise ValueError(f"알 수 없는 RATE_LIMIT_BACKEND: {name} (memory | sqlite)")
+
 
 class RateLimiter:
-    """간단한 Rate Limiter (토큰 버킷 알고리즘)"""
+    """슬라이딩 윈도우 Rate Limiter
+
+    기록은 저장소 백엔드에 위임한다. 기본 MemoryBackend는 사용자별 요청 시각을
+    시간순 리스트에 보관하고 윈도우 시작 인덱스만 앞으로 옮기므로 확인 1회가
+    분할 상환 O(1)이다. 오래된 기록은 백그라운드 스레드가 주기적으로 제거한다.
+    임계 구역에 await가 없으므로 스레드와 asyncio 핸들러 양쪽에서 그대로
+    호출해도 안전하다.
+    """
 
     def __init__(
         self,
         requests_per_minute: int = 30,
-        requests_per_hour: int = 100
+        requests_per_hour: int = 100,
+        evict_interval: float = 300.0,
+        backend: Optional[RateLimitBackend] = None
     ):
         """
         Args:
             requests_per_minute: 분당 요청 제한
             requests_per_hour: 시간당 요청 제한
+            evict_interval: 유휴 사용자 정리 주기 (초, 0이면 정리 스레드 미사용)
+            backend: 저장소 백엔드 (기본: MemoryBackend)
         """
         self.rpm = requests_per_minute
         self.rph = requests_per_hour
+        self.backend = backend or MemoryBackend()
 
-        # 사용자별 요청 기록
-        self.requests: Dict[str, List[float]] = defaultdict(list)
+        self._stop = threading.Event()
+        self._evictor = None
+        if evict_interval > 0:
+            self._evictor = threading.Thread(
+                target=self._evict_loop,
+                args=(evict_interval,),
+                name="rate-limiter-evictor",
+                daemon=True
+            )
+            self._evictor.start()
 
-    def _cleanup_old_requests(self, user_id: str, current_time: float):
-        """1시간 이전 요청 기록 삭제
+    def _stats(self, minute_count: int, hour_count: int) -> Dict[str, int]:
+        return {
+            "requests_last_minute": minute_count,
+            "requests_last_hour": hour_count,
+            "limit_per_minute": self.rpm,
+            "limit_per_hour": self.rph,
+            "remaining_minute": max(0, self.rpm - minute_count),
+            "remaining_hour": max(0, self.rph - hour_count)
+        }
+
+    def check(self, user_id: str) -> Tuple[bool, str, Dict[str, int]]:
+        """요청 허용 여부 확인 및 기록 (사용량 통계 포함)
 
         Args:
             user_id: 사용자 ID
-            current_time: 현재 시간
+
+        Returns:
+            (허용 여부, 에러 메시지, 사용량 통계) 튜플
         """
-        self.requests[user_id] = [
-            req_time for req_time in self.requests[user_id]
-            if current_time - req_time < 3600  # 1시간
-        ]
+        allowed, minute_count, hour_count = self.backend.hit(user_id, time.time(), self.rpm, self.rph)
+        stats = self._stats(minute_count, hour_count)
+
+        # 분당 제한 확인
+        if not allowed and minute_count >= self.rpm:
+            return False, f"분당 {self.rpm}회 제한을 초과했습니다. 잠시 후 다시 시도해주세요.", stats
+
+        # 시간당 제한 확인
+        if not allowed:
+            return False, f"시간당 {self.rph}회 제한을 초과했습니다. 나중에 다시 시도해주세요.", stats
+
+        logger.debug(f"Rate limit check passed for {user_id}: {minute_count}/{self.rpm} per minute")
+        return True, "", stats
 
     def is_allowed(self, user_id: str) -> tuple[bool, str]:
         """요청 허용 여부 확인
@@ -52,29 +327,8 @@ class RateLimiter:
         Returns:
             (허용 여부, 에러 메시지) 튜플
         """
-        current_time = time.time()
-
-        # 오래된 요청 기록 정리
-        self._cleanup_old_requests(user_id, current_time)
-
-        # 분당 제한 확인
-        recent_minute = [
-            req_time for req_time in self.requests[user_id]
-            if current_time - req_time < 60  # 1분
-        ]
-
-        if len(recent_minute) >= self.rpm:
-            return False, f"분당 {self.rpm}회 제한을 초과했습니다. 잠시 후 다시 시도해주세요."
-
-        # 시간당 제한 확인
-        if len(self.requests[user_id]) >= self.rph:
-            return False, f"시간당 {self.rph}회 제한을 초과했습니다. 나중에 다시 시도해주세요."
-
-        # 요청 기록 추가
-        self.requests[user_id].append(current_time)
-        logger.info(f"Rate limit check passed for {user_id}: {len(recent_minute)+1}/{self.rpm} per minute")
-
-        return True, ""
+        allowed, error_msg, _ = self.check(user_id)
+        return allowed, error_msg
 
     def get_usage_stats(self, user_id: str) -> Dict[str, int]:
         """사용자의 사용량 통계 반환
@@ -85,22 +339,33 @@ class RateLimiter:
         Returns:
             사용량 통계 딕셔너리
         """
-        current_time = time.time()
-        self._cleanup_old_requests(user_id, current_time)
+        return self._stats(*self.backend.usage(user_id, time.time()))
 
-        recent_minute = [
-            req_time for req_time in self.requests[user_id]
-            if current_time - req_time < 60
-        ]
+    def evict_idle(self, now: float = None) -> int:
+        """한 시간 넘게 지난 기록 제거
 
-        return {
-            "requests_last_minute": len(recent_minute),
-            "requests_last_hour": len(self.requests[user_id]),
-            "limit_per_minute": self.rpm,
-            "limit_per_hour": self.rph,
-            "remaining_minute": max(0, self.rpm - len(recent_minute)),
-            "remaining_hour": max(0, self.rph - len(self.requests[user_id]))
-        }
+        Args:
+            now: 기준 시각 (기본: 현재)
+
+        Returns:
+            제거된 항목 수 (memory: 사용자 수, sqlite: 버킷 수)
+        """
+        evicted = self.backend.evict_idle(now or time.time())
+        if evicted:
+            logger.info(f"Rate limiter evicted {evicted} idle entries")
+        return evicted
+
+    def _evict_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Rate limiter eviction failed: {e}")
+
+    def close(self) -> None:
+        """정리 스레드 중지 및 저장소 해제"""
+        self._stop.set()
+        self.backend.close()
 
 
 # 전역 Rate Limiter 인스턴스
@@ -120,8 +385,9 @@ def get_rate_limiter() -> RateLimiter:
         rph = int(os.getenv("RATE_LIMIT_PER_HOUR", "100"))
         _rate_limiter = RateLimiter(
             requests_per_minute=rpm,
-            requests_per_hour=rph
+            requests_per_hour=rph,
+            backend=create_backend(RATE_LIMIT_BACKEND)
         )
-        logger.info(f"Rate Limiter initialized: {rpm}/min, {rph}/hour")
+        logger.info(f"Rate Limiter initialized: {rpm}/min, {rph}/hour ({RATE_LIMIT_BACKEND} backend)")
 
     return _rate_limiter
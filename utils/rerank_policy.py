@@ -0,0 +1,84 @@
+"""
+적응형 Reranking 정책
+dense 유사도 1위-2위 차이(margin)가 충분히 크면 순위가 이미 확정적이라고 보고 cross-encoder를 생략,
+애매한 질의만 상위 m개 후보에 대해 rerank
+"""
+
+import logging
+import threading
+from typing import Dict, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRerankPolicy:
+    """dense 점수 margin 기반 rerank 여부 결정 + 통계
+
+    생략한 질의의 절약 시간은 실제로 rerank한 질의의 평균 소요 시간으로 추정한다.
+    """
+
+    def __init__(self, mode: str = "adaptive", margin: float = 0.05, top_m: int = 5):
+        """
+        Args:
+            mode: "adaptive" (애매할 때만) | "always" (항상 rerank)
+            margin: 1위-2위 유사도 차이가 이 값 이상이면 rerank 생략
+            top_m: rerank할 상위 후보 수
+        """
+        if mode not in ("adaptive", "always"):
+            raise ValueError(f"지원하지 않는 rerank 정책입니다: {mode}")
+        self.mode = mode
+        self.margin = margin
+        self.top_m = top_m
+
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.reranked = 0
+        self.rerank_seconds = 0.0
+
+    def is_decisive(self, scores: Sequence[float]) -> bool:
+        """dense 순위가 확정적인지 판단 (내림차순 유사도)
+
+        Args:
+            scores: 후보별 유사도 (높을수록 유사, 순위순)
+
+        Returns:
+            True면 rerank 생략
+        """
+        if self.mode == "always":
+            return False
+        if len(scores) < 2:
+            return True
+        return scores[0] - scores[1] >= self.margin
+
+    def record(self, reranked: bool, seconds: float = 0.0) -> None:
+        """질의 1건의 결정 기록
+
+        Args:
+            reranked: rerank 수행 여부
+            seconds: rerank 소요 시간 (수행한 경우)
+        """
+        with self._lock:
+            self.queries += 1
+            if reranked:
+                self.reranked += 1
+                self.rerank_seconds += seconds
+
+    def get_stats(self) -> Dict[str, float]:
+        """rerank 비율과 추정 절약 시간 반환
+
+        Returns:
+            질의 수, rerank 수, rerank_rate, 평균 rerank 시간(ms), 추정 절약 시간(s)
+        """
+        with self._lock:
+            avg = self.rerank_seconds / self.reranked if self.reranked else 0.0
+            skipped = self.queries - self.reranked
+            return {
+                "mode": self.mode,
+                "margin": self.margin,
+                "top_m": self.top_m,
+                "queries": self.queries,
+                "reranked": self.reranked,
+                "rerank_rate": self.reranked / self.queries if self.queries else 0.0,
+                "avg_rerank_ms": avg * 1000,
+                "estimated_saved_s": skipped * avg
+            }
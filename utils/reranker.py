@@ -0,0 +1,212 @@
+"""
+FlashRank Reranker 지연 로딩 싱글톤
+첫 rerank 호출 때 모델을 로드하고, 일정 시간 사용이 없으면 내려서 메모리 반환
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from flashrank import Ranker, RerankRequest
+
+logger = logging.getLogger(__name__)
+
+# 모델 별칭 (FlashRank 모델 이름을 그대로 써도 됨)
+RERANK_MODELS = {
+    "nano": "ms-marco-TinyBERT-L-2-v2",      # ~4MB, 가장 빠름 (영어)
+    "small": "ms-marco-MiniLM-L-12-v2",      # ~34MB, 기존 기본값 (영어)
+    "multilingual": "ms-marco-MultiBERT-L-12"  # ~150MB, 한국어 포함 다국어
+}
+
+RERANK_MODEL = os.getenv("RERANK_MODEL", "small")
+RERANK_IDLE_SECONDS = float(os.getenv("RERANK_IDLE_SECONDS", "600"))  # 0이면 내리지 않음
+RERANK_CACHE_DIR = os.getenv("RERANK_CACHE_DIR", "")  # 비어 있으면 FlashRank 기본 경로
+
+_registry_lock = threading.Lock()
+_rerankers: Dict[str, "LazyReranker"] = {}
+
+
+def resolve_model_name(name: str) -> str:
+    """별칭을 FlashRank 모델 이름으로 변환"""
+    return RERANK_MODELS.get(name, name)
+
+
+class LazyReranker:
+    """지연 로딩 + 유휴 시 해제되는 스레드 안전 FlashRank 래퍼
+
+    rerank 중인 호출이 있으면 해제하지 않는다. 해제 후 다음 호출에서 다시 로드한다.
+    모델 로드는 self._lock 밖에서 하므로 로드 중에도 get_stats(헬스 체크)는 바로 반환된다.
+    """
+
+    def __init__(self, model_name: str, idle_seconds: float = 600.0, cache_dir: str = ""):
+        """
+        Args:
+            model_name: FlashRank 모델 이름 또는 별칭 (nano | small | multilingual)
+            idle_seconds: 마지막 사용 후 이 시간이 지나면 모델 해제 (0이면 해제 안 함)
+            cache_dir: 모델 다운로드 경로 (비어 있으면 FlashRank 기본값)
+        """
+        self.model_name = resolve_model_name(model_name)
+        self.idle_seconds = idle_seconds
+        self.cache_dir = cache_dir
+
+        self._lock = threading.Lock()
+        self._ranker: Optional[Ranker] = None
+        self._in_flight = 0
+        self._last_used = 0.0
+        self._watcher: Optional[threading.Thread] = None
+        self._building: Optional[Future] = None
+
+        self.loads = 0
+        self.unloads = 0
+        self.load_seconds = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._ranker is not None
+
+    def _load(self) -> Ranker:
+        """모델 로드 (self._lock 밖에서 호출, 동시에 한 스레드만)"""
+        logger.info(f"Loading FlashRank reranker: {self.model_name}")
+        start = time.perf_counter()
+        kwargs = {"model_name": self.model_name}
+        if self.cache_dir:
+            kwargs["cache_dir"] = self.cache_dir
+        ranker = Ranker(**kwargs)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.loads += 1
+            self.load_seconds += elapsed
+        logger.info(f"✅ FlashRank reranker loaded ({elapsed:.2f}s)")
+        return ranker
+
+    def _start_watcher(self) -> None:
+        """유휴 해제 감시 스레드 시작 (self._lock 보유 상태에서 호출)"""
+        if self.idle_seconds > 0 and (self._watcher is None or not self._watcher.is_alive()):
+            self._watcher = threading.Thread(
+                target=self._watch_idle,
+                name="reranker-idle-unload",
+                daemon=True
+            )
+            self._watcher.start()
+
+    def _acquire(self) -> Ranker:
+        """로드된 모델을 가져오고 in-flight 수를 1 증가 (필요하면 락 밖에서 로드)
+
+        동시에 들어온 호출들은 진행 중인 로드 1건의 결과를 기다린다.
+        로드하는 동안에도 get_stats/unload는 막히지 않는다.
+        """
+        with self._lock:
+            ranker = self._ranker
+            if ranker is not None:
+                self._in_flight += 1
+                return ranker
+            building = self._building
+            leader = building is None
+            if leader:
+                building = self._building = Future()
+
+        if not leader:
+            ranker = building.result()  # 로드 실패 시 같은 예외 전파
+            with self._lock:
+                self._in_flight += 1
+            return ranker
+
+        try:
+            ranker = self._load()
+        except BaseException as e:
+            with self._lock:
+                self._building = None
+            building.set_exception(e)
+            raise
+        with self._lock:
+            self._ranker = ranker
+            self._building = None
+            self._in_flight += 1
+            self._last_used = time.monotonic()
+            self._start_watcher()
+        building.set_result(ranker)
+        return ranker
+
+    def rerank(self, request: RerankRequest) -> List[Dict]:
+        """rerank 수행 (필요하면 먼저 모델 로드)
+
+        Args:
+            request: FlashRank RerankRequest
+
+        Returns:
+            점수 내림차순 passage 리스트
+        """
+        ranker = self._acquire()
+        try:
+            return ranker.rerank(request)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def unload(self) -> bool:
+        """사용 중이 아니면 모델 해제
+
+        Returns:
+            해제 여부
+        """
+        with self._lock:
+            if self._ranker is None or self._in_flight:
+                return False
+            self._ranker = None
+            self.unloads += 1
+        gc.collect()
+        logger.info(f"FlashRank reranker unloaded after idle: {self.model_name}")
+        return True
+
+    def _watch_idle(self) -> None:
+        interval = min(60.0, max(1.0, self.idle_seconds / 4))
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                if self._ranker is None:
+                    return
+                idle = time.monotonic() - self._last_used
+                busy = self._in_flight > 0
+            if not busy and idle >= self.idle_seconds and self.unload():
+                return
+
+    def get_stats(self) -> Dict[str, float]:
+        """로드 상태 통계 반환
+
+        Returns:
+            모델 이름, 로드 여부, 로드/해제 횟수, 누적 로드 시간
+        """
+        with self._lock:
+            return {
+                "model": self.model_name,
+                "loaded": self._ranker is not None,
+                "loads": self.loads,
+                "unloads": self.unloads,
+                "load_seconds": round(self.load_seconds, 3)
+            }
+
+
+def get_reranker(model_name: Optional[str] = None) -> LazyReranker:
+    """모델별 지연 로딩 reranker 싱글톤 반환 (이 시점에는 모델을 로드하지 않음)
+
+    Args:
+        model_name: FlashRank 모델 이름 또는 별칭 (없으면 RERANK_MODEL)
+
+    Returns:
+        LazyReranker 인스턴스
+    """
+    name = resolve_model_name(model_name or RERANK_MODEL)
+
+    with _registry_lock:
+        reranker = _rerankers.get(name)
+        if reranker is None:
+            reranker = LazyReranker(name, idle_seconds=RERANK_IDLE_SECONDS, cache_dir=RERANK_CACHE_DIR)
+            _rerankers[name] = reranker
+
+    return reranker
@@ -0,0 +1,99 @@
+"""
+검색 품질 평가
+company_qa.csv의 각 질문(과 규칙 기반 변형 질의)을 질의로, 그 질문의 원래 행을 정답 문서로 보고
+recall@k, MRR, 질의당 지연시간 계산
+"""
+
+import re
+import time
+from typing import Callable, Dict, List, Sequence
+
+# 원문 / 앞쪽 절반 어절 / 핵심어만 / 핵심어 + 요청형 ("~ 알려줘")
+VARIANTS = ("full", "short", "keywords", "request")
+RECALL_KS = (1, 3, 10)
+
+COMPANY_NAME = "퓨쳐시스템"
+_QUESTION_ENDING = re.compile(
+    r"(되었나요|되나요|하나요|인가요|있나요|없나요|었나요|았나요|나요|가요|습니까|입니까|는가|은가|요)?\??$"
+)
+_PARTICLE = re.compile(r"(으로|에서|에게|은|는|이|가|을|를|의|도|만|과|와|로|에)$")
+
+
+def _keywords(question: str) -> str:
+    words = []
+    for word in question.split():
+        if word.startswith("알려"):  # "~ 알려주세요" 요청형 어미
+            continue
+        word = _QUESTION_ENDING.sub("", word)
+        if len(word) > 2:
+            word = _PARTICLE.sub("", word)
+        if word and word != COMPANY_NAME:
+            words.append(word)
+    return " ".join(words) or question
+
+
+def paraphrase(question: str, variant: str) -> str:
+    """평가용 변형 질의 생성 (결정적 규칙 기반)
+
+    Args:
+        question: CSV 원문 질문
+        variant: full | short | keywords | request
+
+    Returns:
+        변형된 질의
+    """
+    if variant == "full":
+        return question
+    if variant == "short":
+        words = question.split()
+        return " ".join(words[:max(1, len(words) // 2)])
+    if variant == "keywords":
+        return _keywords(question)
+    if variant == "request":
+        return f"{_keywords(question)} 알려줘"
+    raise ValueError(f"지원하지 않는 변형입니다: {variant}")
+
+
+def gold_rank(ranked: Sequence[str], question: str) -> int:
+    """정답 문서(질문의 원래 행) 순위 (1부터, 없으면 0)"""
+    marker = f"질문: {question}\n"
+    for rank, content in enumerate(ranked, 1):
+        if marker in content:
+            return rank
+    return 0
+
+
+def evaluate(
+    search: Callable[[str], List[str]],
+    questions: Sequence[str],
+    variant: str = "full",
+    ks: Sequence[int] = RECALL_KS
+) -> Dict[str, float]:
+    """검색 함수 1개를 질문 전체에 대해 평가
+
+    Args:
+        search: 질의 → 순위순 문서 내용 리스트 (max(ks)개 이상 반환해야 recall@max 의미 있음)
+        questions: CSV 질문 목록 (정답 판정 기준)
+        variant: 질의 변형
+        ks: recall@k의 k 목록
+
+    Returns:
+        recall@k, mrr, 질의별 지연시간 리스트(latencies)
+    """
+    ranks = []
+    latencies = []
+    for question in questions:
+        query = paraphrase(question, variant)
+        start = time.perf_counter()
+        ranked = search(query)
+        latencies.append(time.perf_counter() - start)
+        ranks.append(gold_rank(ranked, question))
+
+    n = len(questions)
+    result = {
+        f"recall@{k}": sum(1 for r in ranks if 0 < r <= k) / n
+        for k in ks
+    }
+    result["mrr"] = sum(1 / r for r in ranks if r) / n
+    result["latencies"] = latencies
+    return result
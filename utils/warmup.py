@@ -0,0 +1,154 @@
+"""
+시작 시 백그라운드 워밍업
+공유 파이프라인을 한 번 만들고 더미 임베딩/검색/rerank로 모델 가중치와 HNSW 인덱스를 미리 로드,
+완료 전까지는 readiness 플래그로 메시지 처리를 대기시킨다.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from flashrank import RerankRequest
+
+from utils.rag_pipeline import get_shared_embeddings, get_shared_vectorstore
+from utils.reranker import get_reranker
+
+logger = logging.getLogger(__name__)
+
+WARMUP_RERANKER = os.getenv("WARMUP_RERANKER", "false").lower() == "true"
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "120"))
+
+WARMUP_QUERY = "퓨쳐시스템 워밍업 질의"
+
+_warmup_lock = threading.Lock()
+_warmup_state = None
+
+
+class WarmupState:
+    """워밍업 진행 상태 (ready 이벤트 + 컴포넌트별 소요 시간)"""
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.error: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    @contextmanager
+    def step(self, name: str):
+        """컴포넌트 단계 시간 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - start, 3)
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return round(self.finished_at - self.started_at, 3)
+
+    def wait(self, timeout: Optional[float] = WARMUP_TIMEOUT) -> bool:
+        """워밍업 완료까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            완료 여부 (시간 초과 시 False)
+        """
+        return self.ready.wait(timeout)
+
+    def to_dict(self) -> Dict:
+        return {
+            "ready": self.ready.is_set(),
+            "error": self.error,
+            "time_to_ready_s": self.time_to_ready,
+            "components_s": dict(self.timings)
+        }
+
+
+def _run_warmup(state: WarmupState, registry, model_name: str, temperature: float,
+                use_reranking: bool, rerank: bool) -> None:
+    try:
+        with state.step("embedding_model"):
+            embeddings = get_shared_embeddings()
+
+        with state.step("embedding_encode"):
+            vector = embeddings.embed_query(WARMUP_QUERY)
+
+        with state.step("vectorstore"):
+            # 첫 검색에서 SQLite 페이지와 HNSW 세그먼트를 메모리에 올림
+            get_shared_vectorstore(registry.vectorstore_path).similarity_search_by_vector(vector, k=1)
+
+        with state.step("pipeline"):
+            # FAQ/BM25/답변 캐시까지 포함해 첫 세션과 같은 파이프라인 생성 (세션 수는 유지)
+            pipeline = registry.acquire(model_name, temperature, use_reranking)
+            registry.release(model_name, temperature, use_reranking)
+
+        with state.step("retrieval"):
+            pipeline._dense_search(WARMUP_QUERY)
+
+        if rerank:
+            with state.step("reranker"):
+                get_reranker().rerank(RerankRequest(
+                    query=WARMUP_QUERY,
+                    passages=[{"id": 0, "text": WARMUP_QUERY}]
+                ))
+    except Exception as e:
+        # 실패해도 메시지는 막지 않음 (세션 시작 시 기존 경로로 다시 시도)
+        state.error = str(e)
+        logger.error(f"Warm-up failed: {e}", exc_info=True)
+    finally:
+        state.finished_at = time.perf_counter()
+        state.ready.set()
+
+    breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in state.timings.items())
+    status = "✅ Warm-up ready" if state.error is None else "⚠️ Warm-up finished with errors"
+    logger.info(f"{status} in {state.time_to_ready:.2f}s ({breakdown})")
+
+
+def start_warmup(
+    registry,
+    model_name: str,
+    temperature: float,
+    use_reranking: bool,
+    rerank: Optional[bool] = None
+) -> WarmupState:
+    """백그라운드 워밍업 시작 (프로세스당 1회, 이후 호출은 같은 상태 반환)
+
+    Args:
+        registry: PipelineRegistry
+        model_name: 첫 세션이 사용할 모델 이름
+        temperature: 첫 세션이 사용할 생성 온도
+        use_reranking: 첫 세션의 Reranking 사용 여부
+        rerank: 더미 rerank로 reranker까지 로드할지 (기본: use_reranking 또는 WARMUP_RERANKER)
+
+    Returns:
+        WarmupState
+    """
+    global _warmup_state
+
+    with _warmup_lock:
+        if _warmup_state is None:
+            _warmup_state = WarmupState()
+            if rerank is None:
+                rerank = use_reranking or WARMUP_RERANKER
+            threading.Thread(
+                target=_run_warmup,
+                args=(_warmup_state, registry, model_name, temperature, use_reranking, rerank),
+                name="warmup",
+                daemon=True
+            ).start()
+            logger.info("Warm-up started in background")
+
+    return _warmup_state
+
+
+def get_warmup_state() -> Optional[WarmupState]:
+    """현재 워밍업 상태 반환 (시작 전이면 None)"""
+    return _warmup_state